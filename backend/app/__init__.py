@@ -3,6 +3,7 @@ from flask import Flask, send_from_directory
 from flask_cors import CORS
 from dotenv import load_dotenv
 from app.database import db
+from app.json_provider import OrjsonProvider
 
 load_dotenv(dotenv_path=os.path.join(os.path.dirname(os.path.dirname(__file__)), '..', '.env'))
 
@@ -21,6 +22,9 @@ def create_app(test_config=None):
     else:
         app = Flask(__name__, instance_relative_config=True)
 
+    # Serialize JSON responses with orjson (handles datetime/date natively)
+    app.json = OrjsonProvider(app)
+
     # Load default config
     app.config.from_object('config.Config')
 
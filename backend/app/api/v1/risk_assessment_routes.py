@@ -3,11 +3,11 @@ Risk Assessment API Routes
 Provides REST endpoints for risk assessment and deal memo generation
 """
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request, stream_with_context
 from app.services.deal_service import DealService
 from app.services.deal_memo_service import DealMemoService
 from app.services.rent_tier_service import RentTierService
-from app.database import db, RiskBenchmarkData, MarketDecileThresholds
+from app.database import db, RiskAssessmentModel, RiskBenchmarkData, MarketDecileThresholds
 
 # Create blueprint
 risk_assessment_bp = Blueprint('risk_assessment', __name__)
@@ -24,6 +24,7 @@ def calculate_risk_assessment(deal_id):
         - holding_period: Investment horizon in years (default: 10)
         - geography: Geographic market for benchmarks (default: 'US')
         - save_to_db: Whether to save results to database (default: true)
+        - detail: 'full' (default) or 'summary' to omit the per-service components
 
     Returns:
         200: Risk assessment calculated successfully
@@ -36,6 +37,7 @@ def calculate_risk_assessment(deal_id):
         holding_period = request.args.get('holding_period', 10, type=int)
         geography = request.args.get('geography', 'US', type=str)
         save_to_db = request.args.get('save_to_db', 'true', type=str).lower() == 'true'
+        detail = request.args.get('detail', 'full', type=str)
 
         # Validate parameters
         if holding_period < 1 or holding_period > 30:
@@ -43,12 +45,18 @@ def calculate_risk_assessment(deal_id):
                 'error': 'Invalid holding_period. Must be between 1 and 30 years'
             }), 400
 
+        if detail not in ('full', 'summary'):
+            return jsonify({
+                'error': "Invalid detail. Must be 'full' or 'summary'"
+            }), 400
+
         # Calculate risk assessment
         assessment = DealService.calculate_risk_assessment(
             deal_id=deal_id,
             holding_period=holding_period,
             geography=geography,
-            save_to_db=save_to_db
+            save_to_db=save_to_db,
+            detail=detail
         )
 
         return jsonify({
@@ -103,6 +111,52 @@ def get_risk_assessment(deal_id):
         }), 500
 
 
+@risk_assessment_bp.route('/risk-assessments', methods=['GET'])
+def list_risk_assessments():
+    """
+    List stored risk assessments
+
+    GET /api/v1/risk-assessments
+
+    Query Parameters:
+        - risk_level: Optional composite risk level filter ('Low', 'Medium', 'High')
+        - format: 'json' (default) or 'ndjson' to stream one assessment per line
+
+    Returns:
+        200: Risk assessments retrieved successfully
+        500: Database error
+    """
+    try:
+        risk_level = request.args.get('risk_level', type=str)
+        output_format = request.args.get('format', 'json', type=str).lower()
+
+        filter_ = None
+        if risk_level:
+            filter_ = RiskAssessmentModel.composite_risk_level == risk_level
+
+        if output_format == 'ndjson':
+            return Response(
+                stream_with_context(RiskAssessmentModel.stream_as_ndjson(db.session, filter_)),
+                status=200,
+                mimetype='application/x-ndjson'
+            )
+
+        # Serialized straight from column tuples; bypasses jsonify
+        payload = RiskAssessmentModel.list_as_json(db.session, filter_)
+
+        return Response(
+            b'{"success":true,"data":' + payload + b'}',
+            status=200,
+            mimetype='application/json'
+        )
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
 @risk_assessment_bp.route('/deals/<int:deal_id>/deal-memo', methods=['GET'])
 def get_deal_memo(deal_id):
     """
@@ -113,9 +167,12 @@ def get_deal_memo(deal_id):
     Query Parameters:
         - holding_period: Investment horizon in years (default: 10)
         - geography: Geographic market for benchmarks (default: 'US')
+        - sections: Comma-separated memo sections to include (default: all),
+          e.g. 'executive_summary,tier_classification'
 
     Returns:
         200: Deal memo generated successfully
+        400: Unknown section name
         404: Deal not found
         500: Generation error
     """
@@ -123,12 +180,22 @@ def get_deal_memo(deal_id):
         # Get query parameters
         holding_period = request.args.get('holding_period', 10, type=int)
         geography = request.args.get('geography', 'US', type=str)
+        sections = request.args.get('sections', type=str)
+        if sections is not None:
+            sections = [name.strip() for name in sections.split(',') if name.strip()]
+            unknown = sorted(set(sections).difference(DealMemoService.MEMO_SECTIONS))
+            if unknown:
+                return jsonify({
+                    'success': False,
+                    'error': f'Unknown memo sections: {unknown}'
+                }), 400
 
         # Generate memo
         memo = DealMemoService.generate_memo(
             deal_id=deal_id,
             holding_period=holding_period,
-            geography=geography
+            geography=geography,
+            sections=sections
         )
 
         return jsonify({
@@ -1,6 +1,7 @@
-from flask import Blueprint, jsonify, request, current_app
+from flask import Blueprint, Response, jsonify, request, current_app
 import os
 import json
+import orjson
 from datetime import datetime
 
 from pathlib import Path
@@ -326,7 +327,7 @@ def get_fred_macro():
 
         return jsonify({
             'success': True,
-            'data': macro_data.to_dict()
+            'data': macro_data
         })
 
     except ValueError as e:
@@ -365,7 +366,7 @@ def get_fred_rates():
 
         return jsonify({
             'success': True,
-            'data': rates_data.to_dict(),
+            'data': rates_data,
             'lastUpdated': datetime.now().isoformat()
         })
 
@@ -405,7 +406,7 @@ def get_fred_inflation():
 
         return jsonify({
             'success': True,
-            'data': inflation_data.to_dict(),
+            'data': inflation_data,
             'lastUpdated': datetime.now().isoformat()
         })
 
@@ -445,7 +446,7 @@ def get_fred_housing_market():
 
         return jsonify({
             'success': True,
-            'data': housing_data.to_dict(),
+            'data': housing_data,
             'lastUpdated': datetime.now().isoformat()
         })
 
@@ -485,7 +486,7 @@ def get_fred_economic_indicators():
 
         return jsonify({
             'success': True,
-            'data': indicators_data.to_dict(),
+            'data': indicators_data,
             'lastUpdated': datetime.now().isoformat()
         })
 
@@ -539,11 +540,13 @@ def get_fred_mortgage_rates():
                 'code': 'NO_DATA'
             }), 404
 
-        return jsonify({
-            'success': True,
-            'data': [point.to_dict() for point in time_series],
-            'months': months
-        })
+        # TimeSeriesDataPoint's JSON keys match its field names, so orjson
+        # serializes the dataclasses natively without a to_dict() per point
+        payload = orjson.dumps(time_series)
+        return Response(
+            b'{"success":true,"data":' + payload + b',"months":' + str(months).encode() + b'}',
+            mimetype='application/json'
+        )
 
     except ValueError as e:
         return jsonify({
@@ -1,15 +1,224 @@
 """
 Database configuration and models for Aequitas MVP
 """
+import atexit
+import logging
+import math
+import threading
+from collections import Counter
 from datetime import datetime, date
+import orjson
+from flask import current_app
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Date, ForeignKey, Boolean, JSON, Index
+from sqlalchemy import Column, Integer, SmallInteger, String, Float, DateTime, Text, Date, ForeignKey, Boolean, JSON, Index, select, bindparam, insert, tuple_, inspect
 from sqlalchemy.sql import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+logger = logging.getLogger(__name__)
 
 db = SQLAlchemy()
 
 
-class DealModel(db.Model):
+def _camel_case(name):
+    """Convert a snake_case column name to the camelCase key used in to_dict()"""
+    head, *tail = name.split('_')
+    return head + ''.join(part.capitalize() for part in tail)
+
+
+def _compile_to_dict(cls):
+    """
+    Generate a to_dict() specialized for a model's declared columns
+
+    Emits straight-line source for a single dict literal with camelCase keys and
+    compiles it once, so serialization does no per-call introspection. Date and
+    datetime values are left as-is; the app's orjson JSON provider encodes them
+    as ISO 8601 strings.
+    """
+    entries = []
+    for attr, column in cls.__dict__.items():
+        if not isinstance(column, Column):
+            continue
+        entries.append(f'        {_camel_case(attr)!r}: self.{attr},')
+
+    for key, expr in cls.__to_dict_extra__.items():
+        entries.append(f'        {key!r}: {expr},')
+
+    source = 'def to_dict(self):\n    return {\n' + '\n'.join(entries) + '\n    }\n'
+    namespace = {}
+    exec(compile(source, f'<{cls.__name__}.to_dict>', 'exec'), namespace)
+
+    to_dict = namespace['to_dict']
+    to_dict.__qualname__ = f'{cls.__name__}.to_dict'
+    to_dict.__doc__ = 'Convert model to dictionary for JSON serialization'
+    return to_dict
+
+
+class SerializableMixin:
+    """
+    Gives each model a code-generated to_dict() at class creation
+    Keys are the camelCase form of every declared column, followed by any
+    computed entries in __to_dict_extra__ (key -> expression over self)
+    """
+    __to_dict_extra__ = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.to_dict = _compile_to_dict(cls)
+
+
+class BulkInsertMixin:
+    """
+    Adds a bulk_insert() helper for append-only tables
+    """
+
+    @classmethod
+    def bulk_insert(cls, rows):
+        """
+        Insert many rows with a single executemany INSERT
+
+        created_at is stamped client-side with one timestamp for the whole batch
+        rather than evaluating the column's func.now() default per row. The
+        default still applies to single-row inserts. Caller commits.
+
+        Args:
+            rows: List of dicts keyed by column attribute name
+
+        Returns:
+            Number of rows inserted
+        """
+        if not rows:
+            return 0
+
+        now = datetime.utcnow()
+        rows = [{'created_at': now, **row} for row in rows]
+        db.session.execute(insert(cls), rows)
+        return len(rows)
+
+
+# (database URL, table name, key columns) -> whether the live table has a
+# unique index or constraint over exactly those columns
+_unique_key_cache = {}
+
+
+def _on_conflict_insert(model, key_columns):
+    """
+    Return the dialect's insert() construct if ON CONFLICT can target
+    key_columns on the live table, else None
+
+    PostgreSQL and SQLite support INSERT ... ON CONFLICT DO UPDATE, but only
+    against an existing unique index or constraint. Tables are built with
+    create_all(), which never alters an existing table, so a database created
+    before the index became unique lacks it; the live schema is inspected
+    once per table and such databases take the select-then-write path.
+
+    Args:
+        model: Model class being written
+        key_columns: Column names the upsert conflicts on
+
+    Returns:
+        postgresql/sqlite insert function, or None
+    """
+    bind = db.session.get_bind()
+    dialect = bind.dialect.name
+    if dialect not in ('postgresql', 'sqlite'):
+        return None
+
+    cache_key = (str(bind.url), model.__tablename__, tuple(sorted(key_columns)))
+    has_unique = _unique_key_cache.get(cache_key)
+    if has_unique is None:
+        inspector = inspect(bind)
+        wanted = set(key_columns)
+        candidates = [
+            index['column_names'] for index in inspector.get_indexes(model.__tablename__)
+            if index.get('unique')
+        ]
+        candidates += [
+            constraint['column_names']
+            for constraint in inspector.get_unique_constraints(model.__tablename__)
+        ]
+        candidates.append(
+            inspector.get_pk_constraint(model.__tablename__).get('constrained_columns') or []
+        )
+        has_unique = any(set(columns) == wanted for columns in candidates)
+        if not has_unique:
+            logger.warning(
+                f"{model.__tablename__} has no unique index over {sorted(wanted)}; "
+                "upserts fall back to SELECT then UPDATE/INSERT"
+            )
+        _unique_key_cache[cache_key] = has_unique
+
+    if not has_unique:
+        return None
+    return pg_insert if dialect == 'postgresql' else sqlite_insert
+
+
+def _upsert(model, keys, values):
+    """
+    Insert a row or update the one matching its unique key, in one statement
+    where the dialect supports INSERT ... ON CONFLICT DO UPDATE
+
+    PostgreSQL and SQLite get a single upsert when the table has the unique
+    index; otherwise this falls back to SELECT then UPDATE/INSERT. Caller
+    commits.
+
+    Args:
+        model: Model class with a unique index over the keys columns
+        keys: {column: value} identifying the row
+        values: {column: value} to insert or overwrite
+    """
+    dialect_insert = _on_conflict_insert(model, keys)
+    if dialect_insert is not None:
+        stmt = dialect_insert(model).values(**keys, **values)
+        stmt = stmt.on_conflict_do_update(index_elements=list(keys), set_=values)
+        db.session.execute(stmt)
+        return
+
+    existing = model.query.filter_by(**keys).first()
+    if existing:
+        for key, value in values.items():
+            setattr(existing, key, value)
+    else:
+        db.session.add(model(**keys, **values))
+
+
+
+def _upsert_many(model, key_columns, rows):
+    """
+    Insert or update many rows with a single multi-row statement where the
+    dialect supports INSERT ... ON CONFLICT DO UPDATE
+
+    Rows sharing a key are collapsed to the last one first, since one
+    statement cannot update the same row twice. Other dialects, and tables
+    without the unique index, fall back to _upsert() per row. Caller commits.
+
+    Args:
+        model: Model class with a unique index over key_columns
+        key_columns: Column names identifying a row
+        rows: List of {column: value} dicts, all with the same columns
+    """
+    rows = list({tuple(row[c] for c in key_columns): row for row in rows}.values())
+    if not rows:
+        return
+
+    dialect_insert = _on_conflict_insert(model, key_columns)
+    if dialect_insert is not None:
+        stmt = dialect_insert(model).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(key_columns),
+            set_={c: stmt.excluded[c] for c in rows[0] if c not in key_columns}
+        )
+        db.session.execute(stmt)
+        return
+
+    for row in rows:
+        _upsert(
+            model,
+            {c: row[c] for c in key_columns},
+            {c: v for c, v in row.items() if c not in key_columns}
+        )
+
+class DealModel(SerializableMixin, db.Model):
     """
     SQLAlchemy model for real estate deals
     Stores all property information, financial details, and calculated metrics
@@ -78,66 +287,6 @@ class DealModel(db.Model):
     def __repr__(self):
         return f'<Deal {self.id}: {self.deal_name} ({self.status})>'
 
-    def to_dict(self):
-        """Convert model to dictionary for JSON serialization"""
-        return {
-            'id': self.id,
-            'dealName': self.deal_name,
-            'location': self.location,
-            'status': self.status,
-            'createdAt': self.created_at.isoformat() if self.created_at else None,
-            'updatedAt': self.updated_at.isoformat() if self.updated_at else None,
-
-            # Property Information
-            'propertyAddress': self.property_address,
-            'latitude': self.latitude,
-            'longitude': self.longitude,
-
-            # Purchase Details
-            'purchasePrice': self.purchase_price,
-            'downPaymentPercent': self.down_payment_percent,
-            'loanInterestRate': self.loan_interest_rate,
-            'loanTermYears': self.loan_term_years,
-            'closingCosts': self.closing_costs,
-
-            # Income
-            'monthlyRent': self.monthly_rent,
-            'otherMonthlyIncome': self.other_monthly_income,
-            'vacancyRate': self.vacancy_rate,
-            'annualRentIncrease': self.annual_rent_increase,
-
-            # Expenses
-            'propertyTaxAnnual': self.property_tax_annual,
-            'insuranceAnnual': self.insurance_annual,
-            'hoaMonthly': self.hoa_monthly,
-            'maintenancePercent': self.maintenance_percent,
-            'propertyManagementPercent': self.property_management_percent,
-            'utilitiesMonthly': self.utilities_monthly,
-            'otherExpensesMonthly': self.other_expenses_monthly,
-
-            # Property Details
-            'bedrooms': self.bedrooms,
-            'bathrooms': self.bathrooms,
-            'squareFootage': self.square_footage,
-            'propertyType': self.property_type,
-            'yearBuilt': self.year_built,
-
-            # Market Data
-            'rentcastData': self.rentcast_data,
-            'fredData': self.fred_data,
-
-            # Calculated Metrics
-            'monthlyPayment': self.monthly_payment,
-            'totalMonthlyIncome': self.total_monthly_income,
-            'totalMonthlyExpenses': self.total_monthly_expenses,
-            'monthlyCashFlow': self.monthly_cash_flow,
-            'cashOnCashReturn': self.cash_on_cash_return,
-            'capRate': self.cap_rate,
-            'roi': self.roi,
-            'npv': self.npv,
-            'irr': self.irr
-        }
-
     @staticmethod
     def from_dict(data):
         """Create a DealModel instance from a dictionary"""
@@ -299,7 +448,7 @@ class DealModel(db.Model):
 # ============================================================================
 
 
-class FundModel(db.Model):
+class FundModel(SerializableMixin, db.Model):
     """
     SQLAlchemy model for investment funds
     Stores basic fund information and configuration
@@ -322,20 +471,6 @@ class FundModel(db.Model):
     def __repr__(self):
         return f'<Fund {self.id}: {self.fund_name} ({self.status})>'
 
-    def to_dict(self):
-        """Convert model to dictionary for JSON serialization"""
-        return {
-            'id': self.id,
-            'fundName': self.fund_name,
-            'fundSize': self.fund_size,
-            'status': self.status,
-            'vintageYear': self.vintage_year,
-            'investmentPeriodStart': self.investment_period_start.isoformat() if self.investment_period_start else None,
-            'investmentPeriodEnd': self.investment_period_end.isoformat() if self.investment_period_end else None,
-            'createdAt': self.created_at.isoformat() if self.created_at else None,
-            'updatedAt': self.updated_at.isoformat() if self.updated_at else None
-        }
-
     @staticmethod
     def from_dict(data):
         """Create a FundModel instance from a dictionary"""
@@ -369,7 +504,7 @@ class FundModel(db.Model):
         self.updated_at = datetime.utcnow()
 
 
-class FundMetricsModel(db.Model):
+class FundMetricsModel(SerializableMixin, db.Model):
     """
     SQLAlchemy model for fund performance metrics
     Stores snapshot of fund metrics at a specific date
@@ -390,21 +525,6 @@ class FundMetricsModel(db.Model):
     def __repr__(self):
         return f'<FundMetrics {self.id}: Fund {self.fund_id} as of {self.as_of_date}>'
 
-    def to_dict(self):
-        """Convert model to dictionary for JSON serialization"""
-        return {
-            'id': self.id,
-            'fundId': self.fund_id,
-            'asOfDate': self.as_of_date.isoformat() if self.as_of_date else None,
-            'deployedCapital': self.deployed_capital,
-            'remainingCapital': self.remaining_capital,
-            'netIrr': self.net_irr,
-            'tvpi': self.tvpi,
-            'dpi': self.dpi,
-            'totalValue': self.total_value,
-            'createdAt': self.created_at.isoformat() if self.created_at else None
-        }
-
     @staticmethod
     def from_dict(data):
         """Create a FundMetricsModel instance from a dictionary"""
@@ -440,7 +560,7 @@ class FundMetricsModel(db.Model):
             self.total_value = data['totalValue']
 
 
-class QuarterlyPerformanceModel(db.Model):
+class QuarterlyPerformanceModel(SerializableMixin, db.Model):
     """
     SQLAlchemy model for quarterly fund performance
     Stores IRR performance by quarter
@@ -454,21 +574,12 @@ class QuarterlyPerformanceModel(db.Model):
     irr = Column(Float)  # IRR for that quarter
     created_at = Column(DateTime, default=func.now(), nullable=False)
 
+    # Computed keys appended to the generated to_dict()
+    __to_dict_extra__ = {'quarterLabel': "f'Q{self.quarter} {self.year}'"}
+
     def __repr__(self):
         return f'<QuarterlyPerformance {self.id}: Fund {self.fund_id} Q{self.quarter} {self.year}>'
 
-    def to_dict(self):
-        """Convert model to dictionary for JSON serialization"""
-        return {
-            'id': self.id,
-            'fundId': self.fund_id,
-            'year': self.year,
-            'quarter': self.quarter,
-            'quarterLabel': f'Q{self.quarter} {self.year}',
-            'irr': self.irr,
-            'createdAt': self.created_at.isoformat() if self.created_at else None
-        }
-
     @staticmethod
     def from_dict(data):
         """Create a QuarterlyPerformanceModel instance from a dictionary"""
@@ -489,7 +600,7 @@ class QuarterlyPerformanceModel(db.Model):
             self.irr = data['irr']
 
 
-class InvestmentStrategyModel(db.Model):
+class InvestmentStrategyModel(SerializableMixin, db.Model):
     """
     SQLAlchemy model for investment strategies
     Stores breakdown of fund investments by strategy
@@ -509,20 +620,6 @@ class InvestmentStrategyModel(db.Model):
     def __repr__(self):
         return f'<InvestmentStrategy {self.id}: {self.strategy_name} for Fund {self.fund_id}>'
 
-    def to_dict(self):
-        """Convert model to dictionary for JSON serialization"""
-        return {
-            'id': self.id,
-            'fundId': self.fund_id,
-            'strategyName': self.strategy_name,
-            'deployedCapital': self.deployed_capital,
-            'currentValue': self.current_value,
-            'allocationPercent': self.allocation_percent,
-            'irr': self.irr,
-            'createdAt': self.created_at.isoformat() if self.created_at else None,
-            'updatedAt': self.updated_at.isoformat() if self.updated_at else None
-        }
-
     @staticmethod
     def from_dict(data):
         """Create an InvestmentStrategyModel instance from a dictionary"""
@@ -551,7 +648,7 @@ class InvestmentStrategyModel(db.Model):
         self.updated_at = datetime.utcnow()
 
 
-class CashFlowModel(db.Model):
+class CashFlowModel(SerializableMixin, db.Model):
     """
     SQLAlchemy model for fund cash flows
     Stores quarterly capital calls and distributions
@@ -567,23 +664,12 @@ class CashFlowModel(db.Model):
     net_cash_flow = Column(Float)  # Distributions - Capital Calls
     created_at = Column(DateTime, default=func.now(), nullable=False)
 
+    # Computed keys appended to the generated to_dict()
+    __to_dict_extra__ = {'quarterLabel': "f'Q{self.quarter} {self.year}'"}
+
     def __repr__(self):
         return f'<CashFlow {self.id}: Fund {self.fund_id} Q{self.quarter} {self.year}>'
 
-    def to_dict(self):
-        """Convert model to dictionary for JSON serialization"""
-        return {
-            'id': self.id,
-            'fundId': self.fund_id,
-            'year': self.year,
-            'quarter': self.quarter,
-            'quarterLabel': f'Q{self.quarter} {self.year}',
-            'capitalCalls': self.capital_calls,
-            'distributions': self.distributions,
-            'netCashFlow': self.net_cash_flow,
-            'createdAt': self.created_at.isoformat() if self.created_at else None
-        }
-
     @staticmethod
     def from_dict(data):
         """Create a CashFlowModel instance from a dictionary"""
@@ -610,7 +696,7 @@ class CashFlowModel(db.Model):
             self.net_cash_flow = data['netCashFlow']
 
 
-class FundActivityModel(db.Model):
+class FundActivityModel(SerializableMixin, db.Model):
     """
     SQLAlchemy model for fund activities
     Stores transactions and events related to the fund
@@ -629,19 +715,6 @@ class FundActivityModel(db.Model):
     def __repr__(self):
         return f'<FundActivity {self.id}: {self.description[:30]}>'
 
-    def to_dict(self):
-        """Convert model to dictionary for JSON serialization"""
-        return {
-            'id': self.id,
-            'fundId': self.fund_id,
-            'activityDate': self.activity_date.isoformat() if self.activity_date else None,
-            'description': self.description,
-            'amount': self.amount,
-            'status': self.status,
-            'activityType': self.activity_type,
-            'createdAt': self.created_at.isoformat() if self.created_at else None
-        }
-
     @staticmethod
     def from_dict(data):
         """Create a FundActivityModel instance from a dictionary"""
@@ -671,7 +744,7 @@ class FundActivityModel(db.Model):
             self.activity_type = data['activityType']
 
 
-class BenchmarkDataModel(db.Model):
+class BenchmarkDataModel(SerializableMixin, db.Model):
     """
     SQLAlchemy model for benchmark comparison data
     Stores fund performance vs industry benchmarks
@@ -686,23 +759,14 @@ class BenchmarkDataModel(db.Model):
     as_of_date = Column(Date, nullable=False)
     created_at = Column(DateTime, default=func.now(), nullable=False)
 
+    # Computed keys appended to the generated to_dict()
+    __to_dict_extra__ = {
+        'outperformance': 'self.fund_value - self.industry_benchmark if self.fund_value and self.industry_benchmark else 0'
+    }
+
     def __repr__(self):
         return f'<BenchmarkData {self.id}: {self.metric_name} for Fund {self.fund_id}>'
 
-    def to_dict(self):
-        """Convert model to dictionary for JSON serialization"""
-        outperformance = self.fund_value - self.industry_benchmark if self.fund_value and self.industry_benchmark else 0
-        return {
-            'id': self.id,
-            'fundId': self.fund_id,
-            'metricName': self.metric_name,
-            'fundValue': self.fund_value,
-            'industryBenchmark': self.industry_benchmark,
-            'outperformance': outperformance,
-            'asOfDate': self.as_of_date.isoformat() if self.as_of_date else None,
-            'createdAt': self.created_at.isoformat() if self.created_at else None
-        }
-
     @staticmethod
     def from_dict(data):
         """Create a BenchmarkDataModel instance from a dictionary"""
@@ -734,7 +798,7 @@ class BenchmarkDataModel(db.Model):
 # ============================================================================
 
 
-class RiskAssessmentModel(db.Model):
+class RiskAssessmentModel(SerializableMixin, db.Model):
     """
     SQLAlchemy model for risk assessments
     Stores comprehensive risk analysis based on academic research
@@ -827,88 +891,58 @@ class RiskAssessmentModel(db.Model):
     def __repr__(self):
         return f'<RiskAssessment {self.id}: Deal {self.deal_id} ({self.rent_tier_label})>'
 
-    def to_dict(self):
-        """Convert model to dictionary for JSON serialization"""
-        return {
-            'id': self.id,
-            'dealId': self.deal_id,
-            'createdAt': self.created_at.isoformat() if self.created_at else None,
-            'updatedAt': self.updated_at.isoformat() if self.updated_at else None,
-
-            # Part 1: Rent Tier Classification
-            'predictedFundamentalRent': self.predicted_fundamental_rent,
-            'rentDecileNational': self.rent_decile_national,
-            'rentDecileRegional': self.rent_decile_regional,
-            'rentTierLabel': self.rent_tier_label,
-
-            # Part 2: Yield Calculations
-            'grossYield': self.gross_yield,
-            'maintenanceCostPct': self.maintenance_cost_pct,
-            'propertyTaxPct': self.property_tax_pct,
-            'turnoverCostPct': self.turnover_cost_pct,
-            'defaultCostPct': self.default_cost_pct,
-            'managementCostPct': self.management_cost_pct,
-            'netYield': self.net_yield,
-
-            # Part 3: Capital Appreciation
-            'projectedPriceYr1': self.projected_price_yr1,
-            'projectedPriceYr5': self.projected_price_yr5,
-            'projectedPriceYr10': self.projected_price_yr10,
-            'capitalGainYieldAnnual': self.capital_gain_yield_annual,
-            'noiGrowthRate': self.noi_growth_rate,
-
-            # Part 4: Total Return
-            'totalReturnUnlevered': self.total_return_unlevered,
-            'totalReturnLevered': self.total_return_levered,
-
-            # Part 5: Risk Metrics
-            'systematicRiskScore': self.systematic_risk_score,
-            'cashFlowCyclicality': self.cash_flow_cyclicality,
-            'regulatoryRiskScore': self.regulatory_risk_score,
-            'idiosyncraticRiskScore': self.idiosyncratic_risk_score,
-            'compositeRiskScore': self.composite_risk_score,
-            'compositeRiskLevel': self.composite_risk_level,
-
-            # Part 5b: Climate Risk (NEW)
-            'climateRiskScore': self.climate_risk_score,
-            'climateRiskLevel': self.climate_risk_level,
-            'floodRiskScore': self.flood_risk_score,
-            'wildfireRiskScore': self.wildfire_risk_score,
-            'hurricaneRiskScore': self.hurricane_risk_score,
-            'earthquakeRiskScore': self.earthquake_risk_score,
-            'tornadoRiskScore': self.tornado_risk_score,
-            'extremeHeatRiskScore': self.extreme_heat_risk_score,
-            'seaLevelRiseRiskScore': self.sea_level_rise_risk_score,
-            'droughtRiskScore': self.drought_risk_score,
-            'propertyLatitude': self.property_latitude,
-            'propertyLongitude': self.property_longitude,
-            'geocodedAddress': self.geocoded_address,
-            'climateDataSources': self.climate_data_sources,
-            'climateCalculationDate': self.climate_calculation_date.isoformat() if self.climate_calculation_date else None,
-
-            # Part 6: Limits to Arbitrage
-            'renterConstraintScore': self.renter_constraint_score,
-            'institutionalConstraintScore': self.institutional_constraint_score,
-            'mediumLandlordConstraintScore': self.medium_landlord_constraint_score,
-            'arbitrageOpportunityScore': self.arbitrage_opportunity_score,
-
-            # Part 7: Benchmark Comparison
-            'benchmarkNetYieldMin': self.benchmark_net_yield_min,
-            'benchmarkNetYieldMax': self.benchmark_net_yield_max,
-            'benchmarkCapitalGainMin': self.benchmark_capital_gain_min,
-            'benchmarkCapitalGainMax': self.benchmark_capital_gain_max,
-            'benchmarkTotalReturnMin': self.benchmark_total_return_min,
-            'benchmarkTotalReturnMax': self.benchmark_total_return_max,
-            'vsBenchmarkYield': self.vs_benchmark_yield,
-            'vsBenchmarkReturn': self.vs_benchmark_return,
-
-            # Metadata
-            'hedonicModelVersion': self.hedonic_model_version,
-            'lastCalculated': self.last_calculated.isoformat() if self.last_calculated else None
-        }
+    @classmethod
+    def list_as_json(cls, session, filter_=None):
+        """
+        Serialize assessments directly to JSON bytes for list endpoints
+        Reads plain column tuples (no ORM hydration) and encodes them with orjson,
+        producing the same keys as to_dict() without building model instances
+
+        Args:
+            session: SQLAlchemy session to execute against
+            filter_: Optional SQLAlchemy filter expression
+
+        Returns:
+            JSON-encoded list of assessments as bytes
+        """
+        columns = cls.__table__.columns
+        keys = [_camel_case(column.name) for column in columns]
+
+        stmt = select(*columns)
+        if filter_ is not None:
+            stmt = stmt.where(filter_)
+        stmt = stmt.order_by(cls.updated_at.desc()).execution_options(yield_per=1000)
+
+        rows = session.execute(stmt)
+        return orjson.dumps(
+            [dict(zip(keys, row)) for row in rows],
+            option=orjson.OPT_SERIALIZE_NUMPY
+        )
+
+    @classmethod
+    def stream_as_ndjson(cls, session, filter_=None):
+        """
+        Yield assessments one JSON line at a time (NDJSON)
+        Rows are fetched in batches of 500 so peak memory stays flat
+        regardless of how many assessments are stored
+
+        Args:
+            session: SQLAlchemy session to execute against
+            filter_: Optional SQLAlchemy filter expression
 
+        Yields:
+            One orjson-encoded to_dict() per assessment, newline-terminated
+        """
+        stmt = select(cls)
+        if filter_ is not None:
+            stmt = stmt.where(filter_)
+        stmt = stmt.order_by(cls.updated_at.desc()).execution_options(yield_per=500)
 
-class RiskBenchmarkData(db.Model):
+        for assessment in session.execute(stmt).scalars():
+            yield orjson.dumps(assessment.to_dict()) + b'\n'
+
+
+class RiskBenchmarkData(SerializableMixin, BulkInsertMixin, db.Model):
     """
     SQLAlchemy model for risk assessment benchmark data
     Stores academic research findings by rent decile
@@ -941,28 +975,8 @@ class RiskBenchmarkData(db.Model):
     def __repr__(self):
         return f'<RiskBenchmark {self.id}: D{self.rent_decile} {self.geography}>'
 
-    def to_dict(self):
-        """Convert model to dictionary for JSON serialization"""
-        return {
-            'id': self.id,
-            'rentDecile': self.rent_decile,
-            'geography': self.geography,
-            'netYieldMin': self.net_yield_min,
-            'netYieldMax': self.net_yield_max,
-            'capitalGainMin': self.capital_gain_min,
-            'capitalGainMax': self.capital_gain_max,
-            'totalReturnMin': self.total_return_min,
-            'totalReturnMax': self.total_return_max,
-            'maintenanceCostPct': self.maintenance_cost_pct,
-            'turnoverCostPct': self.turnover_cost_pct,
-            'defaultCostPct': self.default_cost_pct,
-            'systematicRiskBeta': self.systematic_risk_beta,
-            'cashFlowVolatility': self.cash_flow_volatility,
-            'createdAt': self.created_at.isoformat() if self.created_at else None
-        }
-
 
-class HedonicModelCoefficients(db.Model):
+class HedonicModelCoefficients(SerializableMixin, db.Model):
     """
     SQLAlchemy model for hedonic regression model coefficients
     Stores parameters for rent prediction model: log(Rent) = β × Characteristics + α
@@ -995,29 +1009,8 @@ class HedonicModelCoefficients(db.Model):
     def __repr__(self):
         return f'<HedonicCoefficients {self.id}: {self.model_version} {self.region}>'
 
-    def to_dict(self):
-        """Convert model to dictionary for JSON serialization"""
-        return {
-            'id': self.id,
-            'modelVersion': self.model_version,
-            'region': self.region,
-            'createdAt': self.created_at.isoformat() if self.created_at else None,
-            'coefSqft': self.coef_sqft,
-            'coefBedrooms': self.coef_bedrooms,
-            'coefBathrooms': self.coef_bathrooms,
-            'coefAge': self.coef_age,
-            'coefPropertyTypeMulti': self.coef_property_type_multi,
-            'coefPropertyTypeCondo': self.coef_property_type_condo,
-            'intercept': self.intercept,
-            'neighborhoodEffects': self.neighborhood_effects,
-            'timeEffects': self.time_effects,
-            'rSquared': self.r_squared,
-            'rmse': self.rmse,
-            'sampleSize': self.sample_size
-        }
-
 
-class MarketDecileThresholds(db.Model):
+class MarketDecileThresholds(SerializableMixin, db.Model):
     """
     SQLAlchemy model for market rent distribution thresholds
     Stores rent values that define each decile (D1-D10) in a market
@@ -1047,34 +1040,13 @@ class MarketDecileThresholds(db.Model):
     def __repr__(self):
         return f'<MarketThresholds {self.id}: {self.geography} {self.bedrooms}BR {self.data_year}>'
 
-    def to_dict(self):
-        """Convert model to dictionary for JSON serialization"""
-        return {
-            'id': self.id,
-            'geography': self.geography,
-            'bedrooms': self.bedrooms,
-            'dataYear': self.data_year,
-            'd1Threshold': self.d1_threshold,
-            'd2Threshold': self.d2_threshold,
-            'd3Threshold': self.d3_threshold,
-            'd4Threshold': self.d4_threshold,
-            'd5Threshold': self.d5_threshold,
-            'd6Threshold': self.d6_threshold,
-            'd7Threshold': self.d7_threshold,
-            'd8Threshold': self.d8_threshold,
-            'd9Threshold': self.d9_threshold,
-            'd10Threshold': self.d10_threshold,
-            'lastUpdated': self.last_updated.isoformat() if self.last_updated else None,
-            'createdAt': self.created_at.isoformat() if self.created_at else None
-        }
-
 
 # ============================================================================
 # GP (GENERAL PARTNER) MODELS
 # ============================================================================
 
 
-class GPModel(db.Model):
+class GPModel(SerializableMixin, db.Model):
     """
     SQLAlchemy model for General Partners (GPs)
     Stores GP information, contact details, and performance metrics
@@ -1111,28 +1083,6 @@ class GPModel(db.Model):
     def __repr__(self):
         return f'<GP {self.id}: {self.gp_name}>'
 
-    def to_dict(self):
-        """Convert model to dictionary for JSON serialization"""
-        return {
-            'id': self.id,
-            'gpName': self.gp_name,
-            'location': self.location,
-            'tier': self.tier,
-            'performanceRating': self.performance_rating,
-            'createdAt': self.created_at.isoformat() if self.created_at else None,
-            'updatedAt': self.updated_at.isoformat() if self.updated_at else None,
-            'contactEmail': self.contact_email,
-            'contactPhone': self.contact_phone,
-            'website': self.website,
-            'netIrr': self.net_irr,
-            'grossIrr': self.gross_irr,
-            'irrTrend': self.irr_trend,
-            'totalAum': self.total_aum,
-            'dealCount': self.deal_count,
-            'currentValue': self.current_value,
-            'tags': self.tags
-        }
-
     @staticmethod
     def from_dict(data):
         """Create a GPModel instance from a dictionary"""
@@ -1187,7 +1137,7 @@ class GPModel(db.Model):
         self.updated_at = datetime.utcnow()
 
 
-class GPQuarterlyPerformanceModel(db.Model):
+class GPQuarterlyPerformanceModel(SerializableMixin, BulkInsertMixin, db.Model):
     """
     SQLAlchemy model for GP quarterly performance data
     Stores IRR performance by quarter for trend analysis
@@ -1201,21 +1151,12 @@ class GPQuarterlyPerformanceModel(db.Model):
     irr = Column(Float)  # IRR for that quarter
     created_at = Column(DateTime, default=func.now(), nullable=False)
 
+    # Computed keys appended to the generated to_dict()
+    __to_dict_extra__ = {'quarterLabel': "f'Q{self.quarter} {self.year}'"}
+
     def __repr__(self):
         return f'<GPQuarterlyPerformance {self.id}: GP {self.gp_id} Q{self.quarter} {self.year}>'
 
-    def to_dict(self):
-        """Convert model to dictionary for JSON serialization"""
-        return {
-            'id': self.id,
-            'gpId': self.gp_id,
-            'year': self.year,
-            'quarter': self.quarter,
-            'quarterLabel': f'Q{self.quarter} {self.year}',
-            'irr': self.irr,
-            'createdAt': self.created_at.isoformat() if self.created_at else None
-        }
-
     @staticmethod
     def from_dict(data):
         """Create a GPQuarterlyPerformanceModel instance from a dictionary"""
@@ -1227,7 +1168,7 @@ class GPQuarterlyPerformanceModel(db.Model):
         )
 
 
-class GPPortfolioSummaryModel(db.Model):
+class GPPortfolioSummaryModel(SerializableMixin, BulkInsertMixin, db.Model):
     """
     SQLAlchemy model for GP portfolio summary
     Stores performance distribution across quartiles
@@ -1245,18 +1186,6 @@ class GPPortfolioSummaryModel(db.Model):
     def __repr__(self):
         return f'<GPPortfolioSummary {self.id}: GP {self.gp_id} Q{self.quartile} {self.year}>'
 
-    def to_dict(self):
-        """Convert model to dictionary for JSON serialization"""
-        return {
-            'id': self.id,
-            'gpId': self.gp_id,
-            'year': self.year,
-            'quartile': self.quartile,
-            'dealCount': self.deal_count,
-            'percentage': self.percentage,
-            'createdAt': self.created_at.isoformat() if self.created_at else None
-        }
-
     @staticmethod
     def from_dict(data):
         """Create a GPPortfolioSummaryModel instance from a dictionary"""
@@ -1269,7 +1198,7 @@ class GPPortfolioSummaryModel(db.Model):
         )
 
 
-class PropertyImportModel(db.Model):
+class PropertyImportModel(SerializableMixin, db.Model):
     """
     SQLAlchemy model for property imports from external URLs
     Stores import metadata and extracted data for web scraping operations
@@ -1328,42 +1257,6 @@ class PropertyImportModel(db.Model):
     def __repr__(self):
         return f'<PropertyImport {self.id}: {self.source_platform} {self.import_status}>'
 
-    def to_dict(self):
-        """Convert model to dictionary for JSON serialization"""
-        return {
-            'id': self.id,
-            'dealId': self.deal_id,
-            'sourceUrl': self.source_url,
-            'sourcePlatform': self.source_platform,
-            'importStatus': self.import_status,
-            'importMethod': self.import_method,
-            'createdAt': self.created_at.isoformat() if self.created_at else None,
-            'updatedAt': self.updated_at.isoformat() if self.updated_at else None,
-            'rawHtml': self.raw_html,
-            'extractedData': self.extracted_data,
-            'enrichmentData': self.enrichment_data,
-            'propertyAddress': self.property_address,
-            'city': self.city,
-            'state': self.state,
-            'zipcode': self.zipcode,
-            'latitude': self.latitude,
-            'longitude': self.longitude,
-            'price': self.price,
-            'squareFootage': self.square_footage,
-            'units': self.units,
-            'bedrooms': self.bedrooms,
-            'bathrooms': self.bathrooms,
-            'yearBuilt': self.year_built,
-            'propertyType': self.property_type,
-            'noi': self.noi,
-            'capRate': self.cap_rate,
-            'grossIncome': self.gross_income,
-            'errorMessage': self.error_message,
-            'errorType': self.error_type,
-            'userAssisted': self.user_assisted,
-            'confidenceScore': self.confidence_score
-        }
-
     @staticmethod
     def from_dict(data):
         """Create a PropertyImportModel instance from a dictionary"""
@@ -1399,20 +1292,23 @@ class PropertyImportModel(db.Model):
         )
 
 
-class ClimateRiskCache(db.Model):
+class ClimateRiskCache(BulkInsertMixin, db.Model):
     """
     SQLAlchemy model for caching climate risk API responses
     Reduces API calls and improves performance
     """
-    __tablename__ = 'climate_risk_cache'
+    # Versioned: scores became scaled integers and the location index became
+    # unique, neither of which create_all() applies to an existing table.
+    # The old 'climate_risk_cache' table is no longer read and can be dropped.
+    __tablename__ = 'climate_risk_cache_v2'
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    latitude = Column(Float, nullable=False, index=True)
-    longitude = Column(Float, nullable=False, index=True)
+    latitude = Column(Float, nullable=False)
+    longitude = Column(Float, nullable=False)
     hazard_type = Column(String(30), nullable=False)  # 'flood', 'wildfire', etc.
 
     # Risk data
-    risk_score = Column(Float)  # 0-100
+    risk_score = Column(SmallInteger)  # Score * SCORE_SCALE (0-1000); read via .score
     risk_details = Column(JSON)  # Store full hazard data
 
     # Metadata
@@ -1420,14 +1316,179 @@ class ClimateRiskCache(db.Model):
     created_at = Column(DateTime, default=func.now())
     expires_at = Column(DateTime)  # TTL
 
-    # Composite index for fast lookups
+    # Scores are stored as integers with one decimal place of precision
+    SCORE_SCALE = 10
+
+    # Approximate meters per degree of latitude (WGS84)
+    METERS_PER_DEGREE = 111320.0
+
+    # Composite index for proximity lookups: equality on hazard_type,
+    # then a range scan over the latitude/longitude bounding box. Unique so
+    # upsert() can target it with ON CONFLICT. On PostgreSQL the remaining
+    # columns are INCLUDEd so cache reads are index-only scans (risk_details
+    # is small once packed by ClimateRiskService._pack_details).
     __table_args__ = (
-        Index('idx_location_hazard', 'latitude', 'longitude', 'hazard_type'),
+        Index(
+            'idx_hazard_location', 'hazard_type', 'latitude', 'longitude',
+            unique=True,
+            postgresql_include=['id', 'risk_score', 'risk_details', 'data_source', 'created_at', 'expires_at']
+        ),
     )
 
     def __repr__(self):
         return f'<ClimateRiskCache {self.hazard_type} at ({self.latitude}, {self.longitude})>'
 
+    @property
+    def score(self):
+        """Risk score (0-100) unscaled from the stored integer"""
+        return self.risk_score / self.SCORE_SCALE if self.risk_score is not None else None
+
+    @classmethod
+    def find_nearby(cls, latitude, longitude, hazard_type, radius_m=100):
+        """
+        Find the closest unexpired cache entry within radius_m of a point
+        Uses a bounding-box range query so nearby properties reuse cached values
+        instead of requiring an exact floating-point coordinate match
+
+        Args:
+            latitude: Query latitude
+            longitude: Query longitude
+            hazard_type: 'flood', 'wildfire', etc.
+            radius_m: Search radius in meters (default: 100)
+
+        Returns:
+            Closest ClimateRiskCache entry or None
+        """
+        return cls.find_nearby_many(latitude, longitude, [hazard_type], radius_m).get(hazard_type)
+
+    @classmethod
+    def find_nearby_many(cls, latitude, longitude, hazard_types, radius_m=100):
+        """
+        Find the closest unexpired cache entry per hazard type in one query
+
+        Args:
+            latitude: Query latitude
+            longitude: Query longitude
+            hazard_types: Hazard identifiers to look up
+            radius_m: Search radius in meters (default: 100)
+
+        Returns:
+            Dict of hazard_type -> closest ClimateRiskCache entry; hazards with
+            no unexpired entry nearby are omitted
+        """
+        lat_delta = radius_m / cls.METERS_PER_DEGREE
+        lon_scale = max(math.cos(math.radians(latitude)), 0.01)
+        lon_delta = lat_delta / lon_scale
+
+        candidates = cls.query.filter(
+            cls.hazard_type.in_(hazard_types),
+            cls.latitude.between(latitude - lat_delta, latitude + lat_delta),
+            cls.longitude.between(longitude - lon_delta, longitude + lon_delta),
+            (cls.expires_at.is_(None)) | (cls.expires_at > datetime.utcnow())
+        ).all()
+
+        closest = {}
+        best_distance = {}
+        for c in candidates:
+            distance = (c.latitude - latitude) ** 2 + ((c.longitude - longitude) * lon_scale) ** 2
+            if c.hazard_type not in closest or distance < best_distance[c.hazard_type]:
+                closest[c.hazard_type] = c
+                best_distance[c.hazard_type] = distance
+        return closest
+
+    # Bound parameters per IN (...) query in find_many(), two per point
+    FIND_MANY_CHUNK = 400
+
+    @classmethod
+    def find_many(cls, points, hazard_type):
+        """
+        Find unexpired cache entries for many exact locations at once
+
+        Issues one (latitude, longitude) IN (...) query per FIND_MANY_CHUNK
+        points instead of one query per point. Unlike find_nearby() this only
+        matches entries stored at exactly the given (rounded) coordinates.
+
+        Args:
+            points: Iterable of (latitude, longitude) pairs, rounded like the
+                stored cache keys
+            hazard_type: 'flood', 'wildfire', etc.
+
+        Returns:
+            Dict of (latitude, longitude) -> ClimateRiskCache entry; points
+            with no unexpired entry are omitted
+        """
+        points = list(dict.fromkeys(points))
+        now = datetime.utcnow()
+        found = {}
+        for start in range(0, len(points), cls.FIND_MANY_CHUNK):
+            rows = cls.query.filter(
+                cls.hazard_type == hazard_type,
+                tuple_(cls.latitude, cls.longitude).in_(points[start:start + cls.FIND_MANY_CHUNK]),
+                (cls.expires_at.is_(None)) | (cls.expires_at > now)
+            ).all()
+            for row in rows:
+                found[(row.latitude, row.longitude)] = row
+        return found
+
+    @classmethod
+    def upsert(cls, latitude, longitude, hazard_type, risk_score, risk_details, data_source, expires_at,
+               created_at=None):
+        """
+        Insert a cache entry, or overwrite the existing one for the same
+        location and hazard, in a single statement
+
+        Uses INSERT ... ON CONFLICT DO UPDATE on PostgreSQL and SQLite, so an
+        expired row is replaced in place and concurrent workers cannot both
+        insert. Other dialects fall back to SELECT then UPDATE/INSERT.
+        Caller commits.
+
+        Args:
+            latitude: Latitude (rounded to 4 decimals)
+            longitude: Longitude (rounded to 4 decimals)
+            hazard_type: 'flood', 'wildfire', etc.
+            risk_score: Calculated risk score (0-100)
+            risk_details: Full hazard data
+            data_source: API source name
+            expires_at: Expiry timestamp
+            created_at: Creation timestamp (default: now)
+        """
+        values = {
+            'risk_score': round(risk_score * cls.SCORE_SCALE) if risk_score is not None else None,
+            'risk_details': risk_details,
+            'data_source': data_source,
+            'created_at': created_at or datetime.utcnow(),
+            'expires_at': expires_at
+        }
+
+        _upsert(cls, {'hazard_type': hazard_type, 'latitude': latitude, 'longitude': longitude}, values)
+
+    @classmethod
+    def upsert_many(cls, entries):
+        """
+        Insert or overwrite several cache entries in one statement
+
+        Args:
+            entries: List of upsert() argument tuples
+                (latitude, longitude, hazard_type, risk_score, risk_details,
+                data_source, expires_at, created_at)
+        """
+        now = datetime.utcnow()
+        rows = [
+            {
+                'hazard_type': hazard_type,
+                'latitude': latitude,
+                'longitude': longitude,
+                'risk_score': round(risk_score * cls.SCORE_SCALE) if risk_score is not None else None,
+                'risk_details': risk_details,
+                'data_source': data_source,
+                'created_at': created_at or now,
+                'expires_at': expires_at
+            }
+            for latitude, longitude, hazard_type, risk_score, risk_details, data_source, expires_at, created_at
+            in entries
+        ]
+        _upsert_many(cls, ('hazard_type', 'latitude', 'longitude'), rows)
+
     def is_expired(self):
         """Check if cache entry has expired"""
         if not self.expires_at:
@@ -1435,12 +1496,98 @@ class ClimateRiskCache(db.Model):
         return datetime.utcnow() > self.expires_at
 
 
+class GeocodeCache(db.Model):
+    """
+    SQLAlchemy model for caching Census Geocoder address lookups
+    Keyed by a hash of the normalized address
+    """
+    __tablename__ = 'geocode_cache'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    address_key = Column(String(32), nullable=False, unique=True)  # blake2b hex digest
+
+    # Geocoder result
+    latitude = Column(Float, nullable=False)
+    longitude = Column(Float, nullable=False)
+    matched_address = Column(String(255))
+    fips_state = Column(String(2))
+    fips_county = Column(String(3))
+
+    # Metadata
+    created_at = Column(DateTime, default=func.now())
+    expires_at = Column(DateTime)  # TTL
+
+    def __repr__(self):
+        return f'<GeocodeCache {self.address_key}: ({self.latitude}, {self.longitude})>'
+
+    @classmethod
+    def lookup(cls, address_key):
+        """
+        Find the unexpired geocode result for an address key
+
+        Args:
+            address_key: Normalized address hash
+
+        Returns:
+            Geocode result dict or None
+        """
+        entry = cls.query.filter(
+            cls.address_key == address_key,
+            (cls.expires_at.is_(None)) | (cls.expires_at > datetime.utcnow())
+        ).first()
+        if entry is None:
+            return None
+        return {
+            'latitude': entry.latitude,
+            'longitude': entry.longitude,
+            'matched_address': entry.matched_address,
+            'fips_state': entry.fips_state,
+            'fips_county': entry.fips_county
+        }
+
+    @classmethod
+    def upsert(cls, address_key, result, expires_at):
+        """
+        Store a geocode result, replacing any earlier one for the address. Caller commits.
+
+        Args:
+            address_key: Normalized address hash
+            result: Geocode result dict (latitude, longitude, matched_address, fips_*)
+            expires_at: Expiry timestamp
+        """
+        _upsert(cls, {'address_key': address_key}, {
+            'latitude': result['latitude'],
+            'longitude': result['longitude'],
+            'matched_address': result.get('matched_address'),
+            'fips_state': result.get('fips_state'),
+            'fips_county': result.get('fips_county'),
+            'created_at': datetime.utcnow(),
+            'expires_at': expires_at
+        })
+
+
+# In-memory API usage counters, flushed to api_rate_limits in batches.
+# Keyed by (api_name, date); guarded by _rate_limit_lock.
+_rate_limit_pending = Counter()
+_rate_limit_persisted = {}
+_rate_limit_lock = threading.Lock()
+# Serializes first-use loads of persisted counts, so the database round trip
+# does not hold up _rate_limit_lock
+_rate_limit_load_lock = threading.Lock()
+_rate_limit_timer = None
+# App used by the background and at-exit flushes
+_rate_limit_app = None
+
+
 class ApiRateLimit(db.Model):
     """
     SQLAlchemy model for tracking API usage to avoid exceeding rate limits
     """
     __tablename__ = 'api_rate_limits'
 
+    # Seconds between background flushes of pending request counts
+    FLUSH_INTERVAL = 5
+
     id = Column(Integer, primary_key=True, autoincrement=True)
     api_name = Column(String(50), nullable=False)  # 'NOAA_CDO', 'USGS', etc.
     date = Column(Date, nullable=False, index=True)
@@ -1456,27 +1603,148 @@ class ApiRateLimit(db.Model):
 
     @staticmethod
     def check_and_increment(api_name, limit):
-        """Check if we can make another request and increment counter"""
-        from datetime import date as date_class
-        today = date_class.today()
+        """
+        Check if we can make another request and increment counter
+
+        Increments are held in memory and written by a background flush every
+        FLUSH_INTERVAL seconds, so only the first call per API per day touches
+        the database. Each process caches the persisted count on first use, so
+        with multiple workers the daily limit may be slightly overshot.
+        """
+        key = (api_name, date.today())
+
+        with _rate_limit_lock:
+            loaded = key in _rate_limit_persisted
+
+        if not loaded:
+            with _rate_limit_load_lock:
+                # Another thread may have loaded the key while we waited
+                with _rate_limit_lock:
+                    loaded = key in _rate_limit_persisted
+                if not loaded:
+                    count = ApiRateLimit._load_count(api_name, key[1], limit)
+                    with _rate_limit_lock:
+                        _rate_limit_persisted[key] = count
+
+        with _rate_limit_lock:
+            if _rate_limit_persisted[key] + _rate_limit_pending[key] >= limit:
+                return False  # Limit exceeded
+
+            _rate_limit_pending[key] += 1
+            ApiRateLimit._schedule_flush(current_app._get_current_object())
 
+        return True
+
+    @staticmethod
+    def _schedule_flush(app):
+        """Start the background flush timer if none is pending (caller holds _rate_limit_lock)"""
+        global _rate_limit_timer, _rate_limit_app
+        _rate_limit_app = app
+
+        if _rate_limit_timer is None:
+            _rate_limit_timer = threading.Timer(
+                ApiRateLimit.FLUSH_INTERVAL,
+                ApiRateLimit._background_flush,
+                args=(app,)
+            )
+            _rate_limit_timer.daemon = True
+            _rate_limit_timer.start()
+
+    @staticmethod
+    def _load_count(api_name, day, limit):
+        """Read today's persisted count, creating the row if it does not exist"""
         rate_limit = ApiRateLimit.query.filter_by(
             api_name=api_name,
-            date=today
+            date=day
         ).first()
 
         if not rate_limit:
             rate_limit = ApiRateLimit(
                 api_name=api_name,
-                date=today,
+                date=day,
                 request_count=0,
                 limit_per_day=limit
             )
             db.session.add(rate_limit)
+            db.session.commit()
 
-        if rate_limit.request_count >= limit:
-            return False  # Limit exceeded
+        return rate_limit.request_count or 0
 
-        rate_limit.request_count += 1
-        db.session.commit()
-        return True
+    @staticmethod
+    def flush_pending(app=None):
+        """
+        Write pending request counts with a single batched UPDATE and commit
+
+        Args:
+            app: Flask app to push a context for (required from background threads)
+        """
+        global _rate_limit_timer
+
+        with _rate_limit_lock:
+            snapshot = dict(_rate_limit_pending)
+            _rate_limit_pending.clear()
+            _rate_limit_timer = None
+
+        if not snapshot:
+            return
+
+        table = ApiRateLimit.__table__
+        stmt = table.update().where(
+            table.c.api_name == bindparam('b_api_name'),
+            table.c.date == bindparam('b_date')
+        ).values(request_count=table.c.request_count + bindparam('delta'))
+        params = [
+            {'b_api_name': api_name, 'b_date': day, 'delta': delta}
+            for (api_name, day), delta in snapshot.items()
+        ]
+
+        def _write():
+            try:
+                db.session.execute(stmt, params)
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                # Put the counts back so the next flush retries them
+                with _rate_limit_lock:
+                    _rate_limit_pending.update(snapshot)
+                raise
+
+            with _rate_limit_lock:
+                today = date.today()
+                for key, delta in snapshot.items():
+                    if key in _rate_limit_persisted:
+                        _rate_limit_persisted[key] += delta
+                for key in [k for k in _rate_limit_persisted if k[1] != today]:
+                    del _rate_limit_persisted[key]
+
+        if app is not None:
+            with app.app_context():
+                _write()
+        else:
+            _write()
+
+    @staticmethod
+    def _background_flush(app):
+        """Timer target: flush pending counts, retrying on the next interval if the write fails"""
+        try:
+            ApiRateLimit.flush_pending(app)
+        except Exception:
+            logger.exception('Failed to flush API rate limit counts; retrying in %ss',
+                             ApiRateLimit.FLUSH_INTERVAL)
+            global _rate_limit_timer
+            with _rate_limit_lock:
+                if _rate_limit_timer is threading.current_thread():
+                    _rate_limit_timer = None
+                if _rate_limit_pending:
+                    ApiRateLimit._schedule_flush(app)
+
+
+@atexit.register
+def _flush_rate_limits_at_exit():
+    """Write any counts still held in memory when the process exits"""
+    if _rate_limit_app is None:
+        return
+    try:
+        ApiRateLimit.flush_pending(_rate_limit_app)
+    except Exception:
+        logger.exception('Failed to flush API rate limit counts at exit')
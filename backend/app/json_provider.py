@@ -0,0 +1,48 @@
+"""
+orjson-backed JSON provider for Flask
+Encodes date/datetime values (as returned by model to_dict methods) as ISO 8601 strings
+"""
+import dataclasses
+import decimal
+
+import orjson
+from flask.json.provider import JSONProvider
+
+
+def _default(obj):
+    """Fallback for types orjson does not encode natively"""
+    if hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    if dataclasses.is_dataclass(obj):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    if hasattr(obj, '__html__'):
+        return str(obj.__html__())
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    Replaces Flask's stdlib json provider for jsonify() and request.get_json()
+
+    orjson serializes datetime, date and numpy values natively, so models can
+    return raw datetimes from to_dict() instead of calling isoformat() per
+    field. Dataclasses are passed through to _default so camel_dict models
+    keep their camelCase keys and can be handed to jsonify() directly.
+    """
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATACLASS
+    mimetype = 'application/json'
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=_default, option=self.option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=_default, option=self.option),
+            mimetype=self.mimetype
+        )
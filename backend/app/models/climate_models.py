@@ -0,0 +1,42 @@
+"""
+Data models for climate risk hazard scoring
+"""
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+
+@dataclass(slots=True)
+class RiskResult:
+    """Score and interpretation for one climate hazard at a location"""
+    score: float
+    interpretation: Optional[str] = None
+    data_source: str = 'N/A'
+    details: Dict = field(default_factory=dict)
+    cached: bool = False
+
+    # Hazard-specific classification, emitted under zone_key
+    # (e.g. 'flood_zone': 'AE', 'hazard_level': 'High')
+    zone: Optional[str] = None
+    zone_key: Optional[str] = None
+
+    distance_to_coast_miles: Optional[float] = None
+    error: Optional[str] = None
+    cached_at: Optional[str] = None
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for JSON serialization, omitting unset optional fields"""
+        result = {'score': self.score}
+        if self.zone_key is not None:
+            result[self.zone_key] = self.zone
+        if self.distance_to_coast_miles is not None:
+            result['distance_to_coast_miles'] = self.distance_to_coast_miles
+        if self.interpretation is not None:
+            result['interpretation'] = self.interpretation
+        result['data_source'] = self.data_source
+        if self.error is not None:
+            result['error'] = self.error
+        result['details'] = self.details
+        result['cached'] = self.cached
+        if self.cached_at is not None:
+            result['cached_at'] = self.cached_at
+        return result
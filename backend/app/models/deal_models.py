@@ -6,6 +6,8 @@ from dataclasses import dataclass, field
 from typing import Optional
 from datetime import datetime
 
+from app.models.serialization import parse_iso_datetime
+
 
 @dataclass
 class Deal:
@@ -142,14 +144,14 @@ class Deal:
         created_at = None
         if data.get('createdAt'):
             if isinstance(data['createdAt'], str):
-                created_at = datetime.fromisoformat(data['createdAt'].replace('Z', '+00:00'))
+                created_at = parse_iso_datetime(data['createdAt'])
             elif isinstance(data['createdAt'], datetime):
                 created_at = data['createdAt']
 
         updated_at = None
         if data.get('updatedAt'):
             if isinstance(data['updatedAt'], str):
-                updated_at = datetime.fromisoformat(data['updatedAt'].replace('Z', '+00:00'))
+                updated_at = parse_iso_datetime(data['updatedAt'])
             elif isinstance(data['updatedAt'], datetime):
                 updated_at = data['updatedAt']
 
@@ -1,10 +1,20 @@
 """Data models for Federal Reserve Economic Data (FRED) API responses."""
 
 from dataclasses import dataclass, asdict
-from typing import Optional
+from typing import List, Optional
 
+import numpy as np
 
-@dataclass
+from app.models.serialization import camel_dict
+
+
+@camel_dict(keys={
+    'mortgage_30yr': 'mortgage30Year',
+    'mortgage_15yr': 'mortgage15Year',
+    'treasury_10yr': 'treasury10Year',
+    'treasury_2yr': 'treasury2Year'
+})
+@dataclass(slots=True)
 class InterestRateData:
     """Current interest rate snapshot."""
     federal_funds_rate: Optional[float]
@@ -14,19 +24,9 @@ class InterestRateData:
     treasury_10yr: Optional[float]
     treasury_2yr: Optional[float]
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            'federalFundsRate': self.federal_funds_rate,
-            'primeRate': self.prime_rate,
-            'mortgage30Year': self.mortgage_30yr,
-            'mortgage15Year': self.mortgage_15yr,
-            'treasury10Year': self.treasury_10yr,
-            'treasury2Year': self.treasury_2yr
-        }
-
 
-@dataclass
+@camel_dict
+@dataclass(slots=True)
 class InflationData:
     """Inflation metrics with year-over-year calculations."""
     cpi_all_items: Optional[float]
@@ -34,17 +34,9 @@ class InflationData:
     pce_inflation: Optional[float]
     cpi_yoy_change: Optional[float]
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            'cpiAllItems': self.cpi_all_items,
-            'coreCpi': self.core_cpi,
-            'pceInflation': self.pce_inflation,
-            'cpiYoyChange': self.cpi_yoy_change
-        }
 
-
-@dataclass
+@camel_dict
+@dataclass(slots=True)
 class HousingMarketData:
     """Housing market indicators."""
     housing_starts: Optional[int]
@@ -53,18 +45,9 @@ class HousingMarketData:
     home_sales_new: Optional[int]
     case_shiller_index: Optional[float]
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            'housingStarts': self.housing_starts,
-            'buildingPermits': self.building_permits,
-            'homeSalesExisting': self.home_sales_existing,
-            'homeSalesNew': self.home_sales_new,
-            'caseShillerIndex': self.case_shiller_index
-        }
-
 
-@dataclass
+@camel_dict(keys={'gdp_real': 'realGdp'})
+@dataclass(slots=True)
 class EconomicIndicators:
     """Broad economic health indicators."""
     gdp_real: Optional[float]
@@ -73,32 +56,72 @@ class EconomicIndicators:
     labor_force_participation: Optional[float]
     consumer_sentiment: Optional[float]
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            'realGdp': self.gdp_real,
-            'gdpGrowthRate': self.gdp_growth_rate,
-            'unemploymentRate': self.unemployment_rate,
-            'laborForceParticipation': self.labor_force_participation,
-            'consumerSentiment': self.consumer_sentiment
-        }
 
-
-@dataclass
+@camel_dict
+@dataclass(slots=True, eq=False, repr=False)
 class TimeSeriesDataPoint:
     """Individual time series data point."""
     date: str
     value: float
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            'date': self.date,
-            'value': self.value
-        }
+    def __eq__(self, other):
+        if other.__class__ is not TimeSeriesDataPoint:
+            return NotImplemented
+        return self.date == other.date and self.value == other.value
+
+    def __repr__(self):
+        return f'TimeSeriesDataPoint(date={self.date!r}, value={self.value!r})'
+
+
+class TimeSeries:
+    """Column-wise time series: parallel NumPy arrays of dates and values."""
+    __slots__ = ('dates', 'values')
+
+    def __init__(self, dates, values):
+        self.dates = np.asarray(dates, dtype='datetime64[D]')
+        self.values = np.asarray(values, dtype=np.float64)
 
+    @classmethod
+    def from_points(cls, points: List[TimeSeriesDataPoint]) -> 'TimeSeries':
+        """Build from a list of TimeSeriesDataPoint objects."""
+        return cls([p.date for p in points], [p.value for p in points])
 
-@dataclass
+    def to_points(self) -> List[TimeSeriesDataPoint]:
+        """Convert back to TimeSeriesDataPoint objects (ISO date strings)."""
+        return [
+            TimeSeriesDataPoint(date=d, value=v)
+            for d, v in zip(np.datetime_as_string(self.dates).tolist(), self.values.tolist())
+        ]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def pct_change(self, periods: int = 1) -> np.ndarray:
+        """Percentage change over a fixed number of observations."""
+        return (self.values[periods:] / self.values[:-periods] - 1.0) * 100
+
+    def yoy_change(self) -> Optional[float]:
+        """
+        Percentage change of the latest value versus the observation closest
+        to one year earlier.
+
+        Returns:
+            YoY percentage change rounded to 2 decimals, or None if there is
+            not enough data or the base value is zero
+        """
+        if len(self.values) < 2:
+            return None
+
+        target = self.dates[-1] - np.timedelta64(365, 'D')
+        year_ago_value = self.values[np.abs(self.dates - target).argmin()]
+        if year_ago_value == 0:
+            return None
+
+        return round(float((self.values[-1] - year_ago_value) / year_ago_value * 100), 2)
+
+
+@camel_dict
+@dataclass(slots=True)
 class MacroeconomicData:
     """Complete macroeconomic snapshot."""
     interest_rates: InterestRateData
@@ -106,13 +129,3 @@ class MacroeconomicData:
     housing_market: HousingMarketData
     economic_indicators: EconomicIndicators
     last_updated: str
-
-    def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            'interestRates': self.interest_rates.to_dict(),
-            'inflation': self.inflation.to_dict(),
-            'housingMarket': self.housing_market.to_dict(),
-            'economicIndicators': self.economic_indicators.to_dict(),
-            'lastUpdated': self.last_updated
-        }
@@ -7,6 +7,26 @@ from typing import Optional
 from datetime import datetime, date
 
 
+def _to_datetime(value):
+    """Parse an ISO string, passing through values that are already datetimes"""
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
+def _to_date(value):
+    """Parse an ISO string to a date, passing through date/datetime values"""
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.fromisoformat(value).date()
+
+
 @dataclass
 class Fund:
     """Fund basic information"""
@@ -43,10 +63,10 @@ class Fund:
             fund_size=data.get('fundSize', 0),
             vintage_year=data.get('vintageYear', 0),
             status=data.get('status', 'active'),
-            investment_period_start=datetime.fromisoformat(data['investmentPeriodStart']).date() if data.get('investmentPeriodStart') else None,
-            investment_period_end=datetime.fromisoformat(data['investmentPeriodEnd']).date() if data.get('investmentPeriodEnd') else None,
-            created_at=datetime.fromisoformat(data['createdAt']) if data.get('createdAt') else None,
-            updated_at=datetime.fromisoformat(data['updatedAt']) if data.get('updatedAt') else None
+            investment_period_start=_to_date(data.get('investmentPeriodStart')),
+            investment_period_end=_to_date(data.get('investmentPeriodEnd')),
+            created_at=_to_datetime(data.get('createdAt')),
+            updated_at=_to_datetime(data.get('updatedAt'))
         )
 
 
@@ -85,14 +105,14 @@ class FundMetrics:
         return FundMetrics(
             id=data.get('id'),
             fund_id=data.get('fundId', 0),
-            as_of_date=datetime.fromisoformat(data['asOfDate']).date() if data.get('asOfDate') else date.today(),
+            as_of_date=_to_date(data.get('asOfDate')) or date.today(),
             deployed_capital=data.get('deployedCapital', 0),
             remaining_capital=data.get('remainingCapital', 0),
             net_irr=data.get('netIrr', 0),
             tvpi=data.get('tvpi', 0),
             dpi=data.get('dpi', 0),
             total_value=data.get('totalValue', 0),
-            created_at=datetime.fromisoformat(data['createdAt']) if data.get('createdAt') else None
+            created_at=_to_datetime(data.get('createdAt'))
         )
 
 
@@ -127,7 +147,7 @@ class QuarterlyPerformance:
             year=data.get('year', 0),
             quarter=data.get('quarter', 0),
             irr=data.get('irr', 0),
-            created_at=datetime.fromisoformat(data['createdAt']) if data.get('createdAt') else None
+            created_at=_to_datetime(data.get('createdAt'))
         )
 
 
@@ -169,8 +189,8 @@ class InvestmentStrategy:
             current_value=data.get('currentValue', 0),
             allocation_percent=data.get('allocationPercent', 0),
             irr=data.get('irr', 0),
-            created_at=datetime.fromisoformat(data['createdAt']) if data.get('createdAt') else None,
-            updated_at=datetime.fromisoformat(data['updatedAt']) if data.get('updatedAt') else None
+            created_at=_to_datetime(data.get('createdAt')),
+            updated_at=_to_datetime(data.get('updatedAt'))
         )
 
 
@@ -211,7 +231,7 @@ class CashFlow:
             capital_calls=data.get('capitalCalls', 0),
             distributions=data.get('distributions', 0),
             net_cash_flow=data.get('netCashFlow', 0),
-            created_at=datetime.fromisoformat(data['createdAt']) if data.get('createdAt') else None
+            created_at=_to_datetime(data.get('createdAt'))
         )
 
 
@@ -246,12 +266,12 @@ class FundActivity:
         return FundActivity(
             id=data.get('id'),
             fund_id=data.get('fundId', 0),
-            activity_date=datetime.fromisoformat(data['activityDate']).date() if data.get('activityDate') else date.today(),
+            activity_date=_to_date(data.get('activityDate')) or date.today(),
             description=data.get('description', ''),
             amount=data.get('amount', 0),
             status=data.get('status', ''),
             activity_type=data.get('activityType', ''),
-            created_at=datetime.fromisoformat(data['createdAt']) if data.get('createdAt') else None
+            created_at=_to_datetime(data.get('createdAt'))
         )
 
 
@@ -289,8 +309,8 @@ class BenchmarkComparison:
             metric_name=data.get('metricName', ''),
             fund_value=data.get('fundValue', 0),
             industry_benchmark=data.get('industryBenchmark', 0),
-            as_of_date=datetime.fromisoformat(data['asOfDate']).date() if data.get('asOfDate') else date.today(),
-            created_at=datetime.fromisoformat(data['createdAt']) if data.get('createdAt') else None
+            as_of_date=_to_date(data.get('asOfDate')) or date.today(),
+            created_at=_to_datetime(data.get('createdAt'))
         )
 
 
@@ -2,12 +2,16 @@
 Multifamily underwriting data models
 Supports comprehensive NOAH (Naturally Occurring Affordable Housing) underwriting
 """
+import sys
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict
 from datetime import datetime
 
+from app.models.serialization import camel_dict, parse_iso_datetime
 
-@dataclass
+
+@camel_dict(intern=('unit_type',))
+@dataclass(slots=True, eq=False, repr=False)
 class UnitType:
     """Represents a unit type in the unit mix"""
     unit_type: str  # e.g., "Studio", "1BR/1BA", "2BR/2BA"
@@ -17,8 +21,28 @@ class UnitType:
     market_rent: float   # Post-renovation market rent
     renovation_cost_per_unit: float
 
+    def __eq__(self, other):
+        if other.__class__ is not UnitType:
+            return NotImplemented
+        return (
+            self.unit_type == other.unit_type
+            and self.count == other.count
+            and self.avg_sf == other.avg_sf
+            and self.current_rent == other.current_rent
+            and self.market_rent == other.market_rent
+            and self.renovation_cost_per_unit == other.renovation_cost_per_unit
+        )
+
+    def __repr__(self):
+        return (
+            f'UnitType(unit_type={self.unit_type!r}, count={self.count!r}, avg_sf={self.avg_sf!r}, '
+            f'current_rent={self.current_rent!r}, market_rent={self.market_rent!r}, '
+            f'renovation_cost_per_unit={self.renovation_cost_per_unit!r})'
+        )
+
 
-@dataclass
+@camel_dict
+@dataclass(slots=True)
 class OperatingExpenses:
     """T12 operating expenses"""
     property_tax: float
@@ -35,7 +59,8 @@ class OperatingExpenses:
     administrative: float
 
 
-@dataclass
+@camel_dict
+@dataclass(frozen=True, slots=True)
 class OtherIncome:
     """Other income sources per unit/space/month"""
     laundry_per_unit: float = 15.0
@@ -44,14 +69,22 @@ class OtherIncome:
     other_per_unit: float = 10.0
 
 
-@dataclass
+_DEFAULT_OTHER_INCOME = OtherIncome()
+
+
+@camel_dict
+@dataclass(frozen=True, slots=True)
 class RenovationBudget:
     """Renovation and capital improvement budget"""
     common_area_exterior: float = 100000.0
     contingency_pct: float = 0.10
 
 
-@dataclass
+_DEFAULT_RENOVATION_BUDGET = RenovationBudget()
+
+
+@camel_dict
+@dataclass(frozen=True, slots=True)
 class OperatingProjections:
     """Growth rates and stabilized assumptions"""
     market_rent_growth: float = 0.03  # 3% annual
@@ -62,7 +95,11 @@ class OperatingProjections:
     capex_per_unit_annual: float = 400.0
 
 
-@dataclass
+_DEFAULT_OPERATING_PROJECTIONS = OperatingProjections()
+
+
+@camel_dict(intern=('loan_type',))
+@dataclass(slots=True)
 class FinancingTerms:
     """Loan terms and structure"""
     loan_type: str = "Agency Fixed"  # or "Bridge Floating"
@@ -74,7 +111,8 @@ class FinancingTerms:
     lender_legal_dd: float = 25000.0
 
 
-@dataclass
+@camel_dict
+@dataclass(frozen=True, slots=True)
 class ExitAssumptions:
     """Sale/exit assumptions"""
     hold_period_years: int = 5
@@ -82,7 +120,11 @@ class ExitAssumptions:
     sale_costs_pct: float = 0.04  # 4%
 
 
-@dataclass
+_DEFAULT_EXIT_ASSUMPTIONS = ExitAssumptions()
+
+
+@camel_dict
+@dataclass(frozen=True, slots=True)
 class PropertyTaxAssumptions:
     """Property tax parameters"""
     county_tax_rate: float = 0.011  # 1.1%
@@ -90,7 +132,11 @@ class PropertyTaxAssumptions:
     special_assessments: float = 0.0
 
 
-@dataclass
+_DEFAULT_PROPERTY_TAX_ASSUMPTIONS = PropertyTaxAssumptions()
+
+
+@camel_dict
+@dataclass(slots=True)
 class MultifamilyUnderwriting:
     """
     Complete multifamily underwriting dataset
@@ -126,196 +172,93 @@ class MultifamilyUnderwriting:
     bad_debt_annual: float = 25000.0
 
     # Components
-    other_income: OtherIncome = field(default_factory=OtherIncome)
+    other_income: OtherIncome = _DEFAULT_OTHER_INCOME
     operating_expenses: Optional[OperatingExpenses] = None
-    renovation_budget: RenovationBudget = field(default_factory=RenovationBudget)
-    operating_projections: OperatingProjections = field(default_factory=OperatingProjections)
+    renovation_budget: RenovationBudget = _DEFAULT_RENOVATION_BUDGET
+    operating_projections: OperatingProjections = _DEFAULT_OPERATING_PROJECTIONS
     financing: FinancingTerms = field(default_factory=FinancingTerms)
-    exit_assumptions: ExitAssumptions = field(default_factory=ExitAssumptions)
-    property_tax: PropertyTaxAssumptions = field(default_factory=PropertyTaxAssumptions)
+    exit_assumptions: ExitAssumptions = _DEFAULT_EXIT_ASSUMPTIONS
+    property_tax: PropertyTaxAssumptions = _DEFAULT_PROPERTY_TAX_ASSUMPTIONS
 
     # Optional metadata
     deal_id: Optional[int] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    def to_dict(self) -> Dict:
-        """Convert to dictionary for JSON serialization"""
-        return {
-            'propertyName': self.property_name,
-            'address': self.address,
-            'city': self.city,
-            'county': self.county,
-            'state': self.state,
-            'zipCode': self.zip_code,
-            'yearBuilt': self.year_built,
-            'buildingType': self.building_type,
-            'numberOfBuildings': self.number_of_buildings,
-            'parkingSpaces': self.parking_spaces,
-
-            'purchasePrice': self.purchase_price,
-            'acquisitionDate': self.acquisition_date.isoformat() if self.acquisition_date else None,
-            'earnestMoneyPct': self.earnest_money_pct,
-            'closingCostsPct': self.closing_costs_pct,
-            'dueDiligenceCosts': self.due_diligence_costs,
-
-            'unitMix': [
-                {
-                    'unitType': u.unit_type,
-                    'count': u.count,
-                    'avgSf': u.avg_sf,
-                    'currentRent': u.current_rent,
-                    'marketRent': u.market_rent,
-                    'renovationCostPerUnit': u.renovation_cost_per_unit
-                } for u in self.unit_mix
-            ],
-
-            'physicalOccupancy': self.physical_occupancy,
-            'economicOccupancy': self.economic_occupancy,
-            'vacancyLossAnnual': self.vacancy_loss_annual,
-            'concessionsAnnual': self.concessions_annual,
-            'badDebtAnnual': self.bad_debt_annual,
-
-            'otherIncome': {
-                'laundryPerUnit': self.other_income.laundry_per_unit,
-                'petRentPerUnit': self.other_income.pet_rent_per_unit,
-                'parkingPerSpace': self.other_income.parking_per_space,
-                'otherPerUnit': self.other_income.other_per_unit
-            },
-
-            'operatingExpenses': {
-                'propertyTax': self.operating_expenses.property_tax,
-                'insurance': self.operating_expenses.insurance,
-                'utilitiesElectric': self.operating_expenses.utilities_electric,
-                'utilitiesGas': self.operating_expenses.utilities_gas,
-                'utilitiesWaterSewer': self.operating_expenses.utilities_water_sewer,
-                'utilitiesTrash': self.operating_expenses.utilities_trash,
-                'repairsMaintenance': self.operating_expenses.repairs_maintenance,
-                'payroll': self.operating_expenses.payroll,
-                'managementFeePct': self.operating_expenses.management_fee_pct,
-                'marketing': self.operating_expenses.marketing,
-                'legalProfessional': self.operating_expenses.legal_professional,
-                'administrative': self.operating_expenses.administrative
-            } if self.operating_expenses else None,
-
-            'renovationBudget': {
-                'commonAreaExterior': self.renovation_budget.common_area_exterior,
-                'contingencyPct': self.renovation_budget.contingency_pct
-            },
-
-            'operatingProjections': {
-                'marketRentGrowth': self.operating_projections.market_rent_growth,
-                'inplaceRentGrowth': self.operating_projections.inplace_rent_growth,
-                'otherIncomeGrowth': self.operating_projections.other_income_growth,
-                'opexGrowth': self.operating_projections.opex_growth,
-                'stabilizedVacancy': self.operating_projections.stabilized_vacancy,
-                'capexPerUnitAnnual': self.operating_projections.capex_per_unit_annual
-            },
-
-            'financing': {
-                'loanType': self.financing.loan_type,
-                'ltv': self.financing.ltv,
-                'interestRate': self.financing.interest_rate,
-                'amortizationYears': self.financing.amortization_years,
-                'loanTermYears': self.financing.loan_term_years,
-                'originationFeePct': self.financing.origination_fee_pct,
-                'lenderLegalDd': self.financing.lender_legal_dd
-            },
-
-            'exitAssumptions': {
-                'holdPeriodYears': self.exit_assumptions.hold_period_years,
-                'exitCapRate': self.exit_assumptions.exit_cap_rate,
-                'saleCostsPct': self.exit_assumptions.sale_costs_pct
-            },
-
-            'propertyTax': {
-                'countyTaxRate': self.property_tax.county_tax_rate,
-                'prop13Cap': self.property_tax.prop13_cap,
-                'specialAssessments': self.property_tax.special_assessments
-            },
-
-            'dealId': self.deal_id,
-            'createdAt': self.created_at.isoformat() if self.created_at else None,
-            'updatedAt': self.updated_at.isoformat() if self.updated_at else None
-        }
-
     @staticmethod
     def from_dict(data: Dict) -> 'MultifamilyUnderwriting':
         """Create from dictionary"""
-        # Parse unit mix
-        unit_mix = []
-        for u in data.get('unitMix', []):
-            unit_mix.append(UnitType(
-                unit_type=u['unitType'],
-                count=u['count'],
-                avg_sf=u['avgSf'],
-                current_rent=u['currentRent'],
-                market_rent=u['marketRent'],
-                renovation_cost_per_unit=u['renovationCostPerUnit']
-            ))
-
-        # Parse operating expenses
-        opex_data = data.get('operatingExpenses')
-        operating_expenses = None
-        if opex_data:
-            operating_expenses = OperatingExpenses(
-                property_tax=opex_data['propertyTax'],
-                insurance=opex_data['insurance'],
-                utilities_electric=opex_data['utilitiesElectric'],
-                utilities_gas=opex_data['utilitiesGas'],
-                utilities_water_sewer=opex_data['utilitiesWaterSewer'],
-                utilities_trash=opex_data['utilitiesTrash'],
-                repairs_maintenance=opex_data['repairsMaintenance'],
-                payroll=opex_data['payroll'],
-                management_fee_pct=opex_data['managementFeePct'],
-                marketing=opex_data['marketing'],
-                legal_professional=opex_data['legalProfessional'],
-                administrative=opex_data['administrative']
-            )
+        d = _MFU_DEFAULTS | data
 
         # Parse acquisition date
-        acq_date = data.get('acquisitionDate')
+        acq_date = d['acquisitionDate']
         if isinstance(acq_date, str):
-            acq_date = datetime.fromisoformat(acq_date.replace('Z', '+00:00'))
+            acq_date = parse_iso_datetime(acq_date)
         elif acq_date is None:
             acq_date = datetime.now()
 
         return MultifamilyUnderwriting(
-            property_name=data['propertyName'],
-            address=data['address'],
-            city=data['city'],
-            county=data['county'],
-            state=data['state'],
-            zip_code=data['zipCode'],
-            year_built=data['yearBuilt'],
-            building_type=data['buildingType'],
-            number_of_buildings=data['numberOfBuildings'],
-            parking_spaces=data['parkingSpaces'],
-
-            purchase_price=data['purchasePrice'],
+            property_name=d['propertyName'],
+            address=d['address'],
+            city=d['city'],
+            county=d['county'],
+            state=d['state'],
+            zip_code=d['zipCode'],
+            year_built=d['yearBuilt'],
+            building_type=sys.intern(d['buildingType']),
+            number_of_buildings=d['numberOfBuildings'],
+            parking_spaces=d['parkingSpaces'],
+
+            purchase_price=d['purchasePrice'],
             acquisition_date=acq_date,
-            earnest_money_pct=data.get('earnestMoneyPct', 0.02),
-            closing_costs_pct=data.get('closingCostsPct', 0.03),
-            due_diligence_costs=data.get('dueDiligenceCosts', 50000.0),
-
-            unit_mix=unit_mix,
-
-            physical_occupancy=data.get('physicalOccupancy', 0.90),
-            economic_occupancy=data.get('economicOccupancy', 0.87),
-            vacancy_loss_annual=data.get('vacancyLossAnnual', 150000.0),
-            concessions_annual=data.get('concessionsAnnual', 20000.0),
-            bad_debt_annual=data.get('badDebtAnnual', 25000.0),
-
-            other_income=OtherIncome(**data.get('otherIncome', {})) if data.get('otherIncome') else OtherIncome(),
-            operating_expenses=operating_expenses,
-
-            renovation_budget=RenovationBudget(**data.get('renovationBudget', {})) if data.get('renovationBudget') else RenovationBudget(),
-            operating_projections=OperatingProjections(**data.get('operatingProjections', {})) if data.get('operatingProjections') else OperatingProjections(),
-            financing=FinancingTerms(**data.get('financing', {})) if data.get('financing') else FinancingTerms(),
-            exit_assumptions=ExitAssumptions(**data.get('exitAssumptions', {})) if data.get('exitAssumptions') else ExitAssumptions(),
-            property_tax=PropertyTaxAssumptions(**data.get('propertyTax', {})) if data.get('propertyTax') else PropertyTaxAssumptions(),
-
-            deal_id=data.get('dealId'),
-            created_at=data.get('createdAt'),
-            updated_at=data.get('updatedAt')
+            earnest_money_pct=d['earnestMoneyPct'],
+            closing_costs_pct=d['closingCostsPct'],
+            due_diligence_costs=d['dueDiligenceCosts'],
+
+            unit_mix=[UnitType.from_dict(u) for u in d['unitMix']],
+
+            physical_occupancy=d['physicalOccupancy'],
+            economic_occupancy=d['economicOccupancy'],
+            vacancy_loss_annual=d['vacancyLossAnnual'],
+            concessions_annual=d['concessionsAnnual'],
+            bad_debt_annual=d['badDebtAnnual'],
+
+            other_income=OtherIncome.from_dict(d['otherIncome']) if d['otherIncome'] else _DEFAULT_OTHER_INCOME,
+            operating_expenses=OperatingExpenses.from_dict(d['operatingExpenses']) if d['operatingExpenses'] else None,
+
+            renovation_budget=RenovationBudget.from_dict(d['renovationBudget']) if d['renovationBudget'] else _DEFAULT_RENOVATION_BUDGET,
+            operating_projections=OperatingProjections.from_dict(d['operatingProjections']) if d['operatingProjections'] else _DEFAULT_OPERATING_PROJECTIONS,
+            financing=FinancingTerms.from_dict(d['financing']) if d['financing'] else FinancingTerms(),
+            exit_assumptions=ExitAssumptions.from_dict(d['exitAssumptions']) if d['exitAssumptions'] else _DEFAULT_EXIT_ASSUMPTIONS,
+            property_tax=PropertyTaxAssumptions.from_dict(d['propertyTax']) if d['propertyTax'] else _DEFAULT_PROPERTY_TAX_ASSUMPTIONS,
+
+            deal_id=d['dealId'],
+            created_at=d['createdAt'],
+            updated_at=d['updatedAt']
         )
+
+
+# Defaults for every optional key of MultifamilyUnderwriting.from_dict, merged
+# under the payload once instead of a dict.get() per field
+_MFU_DEFAULTS = {
+    'acquisitionDate': None,
+    'earnestMoneyPct': 0.02,
+    'closingCostsPct': 0.03,
+    'dueDiligenceCosts': 50000.0,
+    'unitMix': (),
+    'physicalOccupancy': 0.90,
+    'economicOccupancy': 0.87,
+    'vacancyLossAnnual': 150000.0,
+    'concessionsAnnual': 20000.0,
+    'badDebtAnnual': 25000.0,
+    'otherIncome': None,
+    'operatingExpenses': None,
+    'renovationBudget': None,
+    'operatingProjections': None,
+    'financing': None,
+    'exitAssumptions': None,
+    'propertyTax': None,
+    'dealId': None,
+    'createdAt': None,
+    'updatedAt': None,
+}
@@ -0,0 +1,231 @@
+"""
+camelCase serialization for plain dataclass models
+Generates each class's to_dict() once at decoration time instead of
+hand-writing a dict literal per model
+"""
+import dataclasses
+import sys
+import typing
+from datetime import datetime
+
+
+def _parse_iso_legacy(value):
+    """Parse an ISO 8601 string, accepting the 'Z' UTC suffix before Python 3.11"""
+    if value[-1:] == 'Z':
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)
+
+
+# datetime.fromisoformat accepts a trailing 'Z' natively from Python 3.11
+parse_iso_datetime = datetime.fromisoformat if sys.version_info >= (3, 11) else _parse_iso_legacy
+
+
+def _camel_case(name):
+    """Convert a snake_case field name to camelCase"""
+    head, *rest = name.split('_')
+    return head + ''.join(part[:1].upper() + part[1:] for part in rest)
+
+
+def _unwrap_optional(tp):
+    """Return (inner_type, is_optional) for Optional[X] annotations"""
+    if typing.get_origin(tp) is typing.Union:
+        args = [a for a in typing.get_args(tp) if a is not type(None)]
+        if len(args) == 1:
+            return args[0], True
+    return tp, False
+
+
+def _dict_literal(cls, obj, via_dict=False):
+    """
+    Build an inline dict literal serializing a decorated dataclass
+
+    Args:
+        cls: Dataclass already decorated with camel_dict
+        obj: Source expression for the instance, e.g. 'self.financing'
+        via_dict: Read fields by subscripting obj (an instance __dict__)
+            instead of through attribute access
+
+    Returns:
+        Python expression string
+    """
+    items = ', '.join(
+        f'{key!r}: {_value_expr(f"{obj}[{name!r}]" if via_dict else f"{obj}.{name}", tp)}'
+        for key, name, tp in cls.__camel_fields__
+    )
+    return '{' + items + '}'
+
+
+def _value_expr(attr, tp):
+    """
+    Build the source expression that serializes one field
+
+    Nested camel_dict dataclasses, including list elements, are expanded in
+    place rather than calling their to_dict(), so a whole object tree
+    serializes in one expression. Other values, dates included, are emitted
+    as the raw attribute.
+
+    Args:
+        attr: Attribute access expression, e.g. 'self.unit_mix'
+        tp: Field annotation
+
+    Returns:
+        Python expression string
+    """
+    inner, optional = _unwrap_optional(tp)
+
+    if dataclasses.is_dataclass(inner):
+        if hasattr(inner, '__camel_fields__'):
+            expr = _dict_literal(inner, attr)
+        else:
+            expr = f'{attr}.to_dict()'
+        return f'({expr} if {attr} is not None else None)' if optional else expr
+
+    if typing.get_origin(inner) in (list, typing.List):
+        args = typing.get_args(inner)
+        if args and dataclasses.is_dataclass(args[0]):
+            item = f'_item{attr.count("_item")}'
+            if hasattr(args[0], '__camel_fields__'):
+                return f'[{_dict_literal(args[0], item)} for {item} in {attr}]'
+            return f'[{item}.to_dict() for {item} in {attr}]'
+
+    return attr
+
+
+def _from_expr(value, tp, namespace):
+    """
+    Build the source expression that deserializes one camelCase value
+
+    Args:
+        value: Source expression for the raw JSON value, e.g. "data['financing']"
+        tp: Field annotation
+        namespace: Globals for the generated function; nested classes are
+            registered here by name
+
+    Returns:
+        Python expression string
+    """
+    inner, optional = _unwrap_optional(tp)
+
+    if dataclasses.is_dataclass(inner) and hasattr(inner, '__camel_fields__'):
+        namespace[inner.__name__] = inner
+        expr = f'{inner.__name__}.from_dict({value})'
+        return f'({expr} if {value} is not None else None)' if optional else expr
+
+    if typing.get_origin(inner) in (list, typing.List):
+        args = typing.get_args(inner)
+        if args and dataclasses.is_dataclass(args[0]) and hasattr(args[0], '__camel_fields__'):
+            namespace[args[0].__name__] = args[0]
+            return f'[{args[0].__name__}.from_dict(_item) for _item in {value}]'
+
+    return value
+
+
+def _compile_from_dict(cls, interned=()):
+    """
+    Generate a from_dict classmethod reading the camelCase keys of to_dict()
+
+    Missing keys fall back to the dataclass defaults. Mutable classes are
+    built with object.__new__ and direct attribute stores, skipping the
+    generated __init__; frozen classes (whose __setattr__ raises) and classes
+    with __post_init__ go through the constructor with positional arguments.
+
+    Args:
+        cls: Dataclass with __camel_fields__ populated
+        interned: Names of string fields to pass through sys.intern()
+
+    Returns:
+        classmethod wrapping the generated function
+    """
+    namespace = {'_intern': sys.intern}
+    args = []
+    for i, f in enumerate(dataclasses.fields(cls)):
+        key = cls.__camel_fields__[i][0]
+        expr = _from_expr(f'data[{key!r}]', f.type, namespace)
+        if f.default is not dataclasses.MISSING:
+            namespace[f'_d{i}'] = f.default
+            if expr == f'data[{key!r}]':
+                expr = f'data.get({key!r}, _d{i})'
+            else:
+                expr = f'({expr} if {key!r} in data else _d{i})'
+        elif f.default_factory is not dataclasses.MISSING:
+            namespace[f'_f{i}'] = f.default_factory
+            expr = f'({expr} if {key!r} in data else _f{i}())'
+        if f.name in interned:
+            expr = f'_intern({expr})'
+        args.append(expr)
+
+    params = getattr(cls, '__dataclass_params__', None)
+    if (params is not None and params.frozen) or hasattr(cls, '__post_init__'):
+        src = 'def from_dict(cls, data):\n    return cls(' + ', '.join(args) + ')\n'
+    else:
+        namespace['_new'] = object.__new__
+        src = 'def from_dict(cls, data):\n    o = _new(cls)\n'
+        for f, expr in zip(dataclasses.fields(cls), args):
+            src += f'    o.{f.name} = {expr}\n'
+        src += '    return o\n'
+    exec(compile(src, f'<{cls.__name__}.from_dict>', 'exec'), namespace)
+
+    from_dict = namespace['from_dict']
+    from_dict.__qualname__ = f'{cls.__qualname__}.from_dict'
+    from_dict.__module__ = cls.__module__
+    from_dict.__doc__ = 'Create from a camelCase dictionary'
+    return classmethod(from_dict)
+
+
+def camel_dict(cls=None, *, keys=None, intern=()):
+    """
+    Class decorator that compiles a camelCase to_dict() for a dataclass
+
+    The (json_key, field_name, type) triples are kept on the class as
+    __camel_fields__ and the generated body is a single dict literal with
+    constant keys. Classes without __slots__ read self.__dict__ once and
+    subscript it rather than going through attribute lookup for every
+    field. Nested dataclass fields are inlined, lists of dataclasses
+    are serialized element-wise. date/datetime values are left as-is for
+    the app's JSON provider to encode, as with the DB models' to_dict().
+
+    Unless the class defines its own, a matching from_dict() classmethod is
+    generated as well, reading the same keys back into positional
+    constructor arguments.
+
+    Args:
+        cls: Dataclass to decorate (when used without arguments)
+        keys: Optional {field_name: json_key} overrides for keys that do not
+            follow the plain camelCase conversion
+        intern: Field names holding small fixed vocabularies (unit types,
+            loan types) whose parsed strings should be interned so every
+            instance shares one string object
+
+    Returns:
+        The decorated class
+    """
+    overrides = keys or {}
+
+    def wrap(cls):
+        cls.__camel_fields__ = tuple(
+            (overrides.get(f.name, _camel_case(f.name)), f.name, f.type)
+            for f in dataclasses.fields(cls)
+        )
+
+        if '__slots__' in cls.__dict__:
+            src = f'def to_dict(self):\n    return {_dict_literal(cls, "self")}\n'
+        else:
+            src = (
+                'def to_dict(self):\n'
+                '    _d = self.__dict__\n'
+                f'    return {_dict_literal(cls, "_d", via_dict=True)}\n'
+            )
+        namespace = {}
+        exec(compile(src, f'<{cls.__name__}.to_dict>', 'exec'), {}, namespace)
+
+        to_dict = namespace['to_dict']
+        to_dict.__qualname__ = f'{cls.__qualname__}.to_dict'
+        to_dict.__module__ = cls.__module__
+        to_dict.__doc__ = 'Convert to dictionary for JSON serialization'
+        cls.to_dict = to_dict
+
+        if 'from_dict' not in cls.__dict__ and all(f.init for f in dataclasses.fields(cls)):
+            cls.from_dict = _compile_from_dict(cls, intern)
+        return cls
+
+    return wrap if cls is None else wrap(cls)
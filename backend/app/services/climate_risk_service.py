@@ -7,18 +7,167 @@ Phase 2: Earthquake, Tornado, Extreme Heat, Sea Level Rise, Drought
 """
 
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Dict, Optional, Tuple, List
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from math import radians, cos, sin, asin, sqrt
+from pathlib import Path
+from bisect import bisect_right
 import logging
 
-from app.database import db, ClimateRiskCache, ApiRateLimit
+import numpy as np
+import orjson
+from scipy.spatial import cKDTree
+from flask import current_app, g, has_app_context
+
+from app.database import db, ClimateRiskCache, GeocodeCache, ApiRateLimit
+from app.models.climate_models import RiskResult
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+_CONFIG_PATH = Path(__file__).resolve().parent.parent / 'data' / 'climate_risk_config.json'
+
+# Minimal configuration used when climate_risk_config.json cannot be read
+_DEFAULT_CONFIG = {
+    "hazard_weights": {
+        "flood": 0.20, "wildfire": 0.18, "hurricane": 0.15,
+        "earthquake": 0.12, "tornado": 0.10, "extreme_heat": 0.10,
+        "sea_level_rise": 0.08, "drought": 0.07
+    },
+    "cache_ttl_days": {
+        "flood": 365, "wildfire": 90, "hurricane": 365,
+        "earthquake": 365, "tornado": 180, "extreme_heat": 30,
+        "sea_level_rise": 365, "drought": 7
+    }
+}
+
+
+def _utcnow() -> datetime:
+    """Current UTC time as a naive datetime, matching the DateTime columns"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+# (epoch second, ISO string) of the last _utcnow_iso() result
+_iso_second = (None, None)
+
+
+def _utcnow_iso() -> str:
+    """
+    Current UTC time as a whole-second ISO 8601 string
+
+    The formatted string is reused for every call within the same second,
+    so batch scoring formats one timestamp instead of one per property.
+    """
+    global _iso_second
+    second = int(time.time())
+    cached = _iso_second
+    if cached[0] == second:
+        return cached[1]
+    iso = datetime.fromtimestamp(second, timezone.utc).replace(tzinfo=None).isoformat()
+    _iso_second = (second, iso)
+    return iso
+
+
+def _read_config() -> Dict:
+    """Load climate risk configuration from JSON file, falling back to defaults"""
+    try:
+        return orjson.loads(_CONFIG_PATH.read_bytes())
+    except Exception as e:
+        logger.error(f"Failed to load climate risk config: {e}")
+        return _DEFAULT_CONFIG
+
+
+# Loaded once at import; ClimateRiskService.reload_config() refreshes it
+_CONFIG = _read_config()
+
+
+def _compile_composite_score(weights: Dict, hazard_types: Tuple[str, ...]):
+    """
+    Generate composite_score(hazards) with the configured weights baked in
+
+    The body is one weighted-sum expression with the weights as literals,
+    added in hazard_types order exactly like the sum() it replaces, so
+    composite scoring does no config or weight dict lookups per call.
+
+    Args:
+        weights: hazard_weights from the climate risk config
+        hazard_types: Hazard names, in the order results are listed
+
+    Returns:
+        Function mapping {hazard: RiskResult} to the weighted composite score
+    """
+    missing = [h for h in hazard_types if h not in weights]
+    if missing:
+        def composite_score(hazards):
+            raise KeyError(missing[0])
+        return composite_score
+
+    terms = ' + '.join(f'hazards[{h!r}].score * {float(weights[h])!r}' for h in hazard_types)
+    src = f'def composite_score(hazards):\n    return {terms}\n'
+    namespace = {}
+    exec(compile(src, '<composite_score>', 'exec'), namespace)
+    return namespace['composite_score']
+
+
+def _coast_tree(lats_rad: np.ndarray, lons_rad: np.ndarray) -> cKDTree:
+    """
+    Build a k-d tree over reference points as 3D unit vectors
+
+    Straight-line (chord) distance between unit vectors increases with
+    great-circle distance, so the tree's nearest neighbour is also the
+    nearest point along the earth's surface.
+
+    Args:
+        lats_rad: Latitudes in radians
+        lons_rad: Longitudes in radians
+
+    Returns:
+        cKDTree indexed like the input arrays
+    """
+    return cKDTree(np.column_stack((
+        np.cos(lats_rad) * np.cos(lons_rad),
+        np.cos(lats_rad) * np.sin(lons_rad),
+        np.sin(lats_rad)
+    )))
+
+
+def _rasterize_zones(zones: tuple) -> np.ndarray:
+    """
+    Rasterize a zone table onto a 1-degree [180, 360] grid
+
+    Each cell holds 1 + the index of the first zone covering it (0 for none).
+    Zone bounds are whole degrees, so every point strictly inside a cell has
+    the same first match; only points exactly on a grid line need the table.
+
+    Args:
+        zones: Zone table of (lat_min, lat_max, lon_min, lon_max, ...) rows
+
+    Returns:
+        int8 array indexed by [int(lat + 90), int(lon + 180)]
+    """
+    grid = np.zeros((180, 360), dtype=np.int8)
+    # Paint in reverse so earlier zones overwrite later ones
+    for index in range(len(zones) - 1, -1, -1):
+        lat_min, lat_max, lon_min, lon_max = zones[index][:4]
+        assert all(float(b).is_integer() for b in (lat_min, lat_max, lon_min, lon_max))
+        grid[lat_min + 90:lat_max + 90, lon_min + 180:lon_max + 180] = index + 1
+    return grid
+
 
 class ClimateRiskService:
     """
@@ -27,53 +176,267 @@ class ClimateRiskService:
     """
 
     # Load configuration from JSON file
-    _config = None
-    _config_cache_time = None
-    CONFIG_CACHE_TTL = 300  # 5 minutes
 
     # API configuration
     CENSUS_GEOCODER_URL = "https://geocoding.geo.census.gov/geocoder/locations/address"
     FEMA_NFHL_BASE_URL = "https://hazards.fema.gov/gis/nfhl/rest/services/public/NFHL/MapServer"
+    FEMA_FLOOD_HAZARD_LAYER = 28  # NFHL "Flood Hazard Zones" (S_Fld_Haz_Ar)
+    FEMA_MAX_RESPONSE_BYTES = 256 * 1024
     NOAA_CDO_BASE_URL = "https://www.ncdc.noaa.gov/cdo-web/api/v2"
     USGS_EARTHQUAKE_URL = "https://earthquake.usgs.gov/fdsnws/event/1/query"
 
+    # Geocoded addresses rarely move
+    GEOCODE_CACHE_TTL_DAYS = 365
+
+    # All 8 hazards, in the order composite responses list them
+    HAZARD_TYPES = (
+        'flood', 'wildfire', 'hurricane', 'earthquake', 'tornado',
+        'extreme_heat', 'sea_level_rise', 'drought'
+    )
+
+    # Derived from the loaded config; rebuilt by reload_config()
+    _composite_score = staticmethod(_compile_composite_score(_CONFIG.get('hazard_weights', {}), HAZARD_TYPES))
+    _hazard_labels = {h: _CONFIG.get('hazard_labels', {}).get(h, h.title()) for h in HAZARD_TYPES}
+
+    # Shared HTTP session (keep-alive connection pool across hazards/properties)
+    _session = None
+
     @classmethod
-    def _load_config(cls) -> Dict:
-        """Load climate risk configuration from JSON file with caching"""
-        now = datetime.utcnow()
-
-        # Return cached config if still valid
-        if cls._config and cls._config_cache_time:
-            if (now - cls._config_cache_time).total_seconds() < cls.CONFIG_CACHE_TTL:
-                return cls._config
-
-        # Load fresh config
-        config_path = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)),
-            'data',
-            'climate_risk_config.json'
-        )
+    def _get_session(cls) -> requests.Session:
+        """Return the shared requests.Session, creating it on first use"""
+        if cls._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=50,
+                max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504])
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers.update({
+                'Connection': 'keep-alive',
+                'Accept-Encoding': 'gzip, deflate'
+            })
+            cls._session = session
+        return cls._session
+
+    # In-flight upstream lookups keyed by (hazard_type, lat4, lon4)
+    _inflight: Dict[tuple, Future] = {}
+    _inflight_lock = threading.Lock()
+
+    @classmethod
+    def _singleflight(cls, key: tuple, fn, *args):
+        """
+        Run fn(*args) once per key across concurrent callers
+
+        The first caller runs fn; callers arriving while it is in flight wait
+        for the same result instead of repeating the upstream request.
+
+        Args:
+            key: Identifies the lookup, e.g. ('flood', lat4, lon4)
+            fn: Function performing the lookup
+            *args: Positional arguments for fn
+
+        Returns:
+            fn's result (a fresh copy for waiting callers)
+        """
+        with cls._inflight_lock:
+            future = cls._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = cls._inflight[key] = Future()
+
+        if not leader:
+            return copy.copy(future.result())
 
         try:
-            with open(config_path, 'r') as f:
-                cls._config = json.load(f)
-                cls._config_cache_time = now
-                return cls._config
-        except Exception as e:
-            logger.error(f"Failed to load climate risk config: {e}")
-            # Return default minimal config
-            return {
-                "hazard_weights": {
-                    "flood": 0.20, "wildfire": 0.18, "hurricane": 0.15,
-                    "earthquake": 0.12, "tornado": 0.10, "extreme_heat": 0.10,
-                    "sea_level_rise": 0.08, "drought": 0.07
-                },
-                "cache_ttl_days": {
-                    "flood": 365, "wildfire": 90, "hurricane": 365,
-                    "earthquake": 365, "tornado": 180, "extreme_heat": 30,
-                    "sea_level_rise": 365, "drought": 7
-                }
-            }
+            result = fn(*args)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with cls._inflight_lock:
+                cls._inflight.pop(key, None)
+
+    # Census geocoder request pacing (free government API guidance)
+    GEOCODER_MAX_RPS = 10
+    _geocoder_next_slot = 0.0
+    _geocoder_lock = threading.Lock()
+
+    @classmethod
+    def _throttle_geocoder(cls):
+        """Block until a Census geocoder request fits within GEOCODER_MAX_RPS"""
+        with cls._geocoder_lock:
+            now = time.monotonic()
+            slot = max(now, cls._geocoder_next_slot)
+            cls._geocoder_next_slot = slot + 1.0 / cls.GEOCODER_MAX_RPS
+        if slot > now:
+            time.sleep(slot - now)
+
+    @staticmethod
+    def _json(response: requests.Response):
+        """Parse a JSON response body with orjson straight from the (decompressed) bytes"""
+        return orjson.loads(response.content)
+
+    @staticmethod
+    def _json_capped(response: requests.Response, max_bytes: int):
+        """
+        Parse a streamed JSON response, refusing bodies larger than max_bytes
+
+        Args:
+            response: Response requested with stream=True
+            max_bytes: Largest decompressed body to accept
+
+        Returns:
+            Parsed JSON
+
+        Raises:
+            ValueError: If the body exceeds max_bytes
+        """
+        body = response.raw.read(max_bytes + 1, decode_content=True)
+        if len(body) > max_bytes:
+            raise ValueError(f"Response from {response.url} exceeds {max_bytes} bytes")
+        return orjson.loads(body)
+
+    # Worker pool for hazards that block on remote APIs (FEMA NFHL flood lookup).
+    # Sized for I/O-bound work; threads release the GIL while waiting on sockets.
+    _executor = ThreadPoolExecutor(
+        max_workers=min(32, (os.cpu_count() or 1) * 4),
+        thread_name_prefix='climate-risk'
+    )
+
+    @classmethod
+    def _submit(cls, fn, *args):
+        """
+        Run fn(*args) on the worker pool, inside the caller's app context
+
+        Args:
+            fn: Hazard calculation to run
+            *args: Positional arguments for fn
+
+        Returns:
+            concurrent.futures.Future for the result
+        """
+        if not has_app_context():
+            return cls._executor.submit(fn, *args)
+
+        app = current_app._get_current_object()
+
+        def run():
+            with app.app_context():
+                return fn(*args)
+
+        return cls._executor.submit(run)
+
+    # Process-local LRU in front of ClimateRiskCache, keyed by
+    # (lat4, lon4, hazard_type) -> (expires_at, result)
+    _mem_cache: 'OrderedDict[Tuple[float, float, str], Tuple[datetime, Dict]]' = OrderedDict()
+    _mem_cache_lock = threading.RLock()
+    MEM_CACHE_MAXSIZE = 10000
+    MEM_CACHE_TTL = timedelta(hours=1)
+
+    @classmethod
+    def _mem_cache_get(cls, key: Tuple[float, float, str]) -> Optional[Dict]:
+        """Return an unexpired in-memory cache result, or None"""
+        with cls._mem_cache_lock:
+            entry = cls._mem_cache.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= _utcnow():
+                del cls._mem_cache[key]
+                return None
+            cls._mem_cache.move_to_end(key)
+            return dict(entry[1])
+
+    @classmethod
+    def _mem_cache_put(cls, key: Tuple[float, float, str], result: Dict, expires_at: datetime):
+        """Store a result in the in-memory cache, evicting the least recently used entry"""
+        ttl_cap = _utcnow() + cls.MEM_CACHE_TTL
+        expires_at = ttl_cap if expires_at is None else min(expires_at, ttl_cap)
+        with cls._mem_cache_lock:
+            cls._mem_cache[key] = (expires_at, result)
+            cls._mem_cache.move_to_end(key)
+            if len(cls._mem_cache) > cls.MEM_CACHE_MAXSIZE:
+                cls._mem_cache.popitem(last=False)
+
+    @classmethod
+    def clear_memory_cache(cls):
+        """
+        Drop every in-process cached hazard result
+
+        Redis and ClimateRiskCache entries are left in place; use this in
+        tests or after changing the hazard models so this worker recomputes.
+        """
+        with cls._mem_cache_lock:
+            cls._mem_cache.clear()
+
+    # Shared Redis client (connection-pooled), created on first use when
+    # REDIS_URL is configured; False once Redis is known to be unavailable
+    _redis = None
+
+    @classmethod
+    def _get_redis(cls):
+        """Return the shared Redis client, or None if Redis is not configured"""
+        if cls._redis is None:
+            url = current_app.config.get('REDIS_URL') if has_app_context() else None
+            if url and REDIS_AVAILABLE:
+                cls._redis = redis.Redis.from_url(url, socket_timeout=0.5)
+            elif has_app_context():
+                cls._redis = False
+        return cls._redis or None
+
+    @staticmethod
+    def _redis_key(lat_rounded: float, lon_rounded: float, hazard_type: str) -> str:
+        """Redis key for a cached hazard result"""
+        return f"crisk:{hazard_type}:{lat_rounded}:{lon_rounded}"
+
+    @classmethod
+    def _redis_get(cls, key: str) -> Optional[Dict]:
+        """Fetch a cached hazard result from Redis, or None on miss/error"""
+        client = cls._get_redis()
+        if client is None:
+            return None
+        try:
+            raw = client.get(key)
+        except redis.RedisError as e:
+            logger.warning(f"Redis cache read error: {e}")
+            return None
+        return orjson.loads(raw) if raw is not None else None
+
+    @classmethod
+    def _redis_set(cls, key: str, result: Dict, expires_at: Optional[datetime]):
+        """Store a hazard result in Redis until expires_at"""
+        client = cls._get_redis()
+        if client is None:
+            return
+        if expires_at is None:
+            ttl_seconds = int(cls.MEM_CACHE_TTL.total_seconds())
+        else:
+            ttl_seconds = int((expires_at - _utcnow()).total_seconds())
+        if ttl_seconds <= 0:
+            return
+        try:
+            client.setex(key, ttl_seconds, orjson.dumps(result))
+        except redis.RedisError as e:
+            logger.warning(f"Redis cache write error: {e}")
+
+    @classmethod
+    def reload_config(cls) -> Dict:
+        """
+        Re-read climate_risk_config.json, e.g. from a SIGHUP handler
+
+        Returns:
+            The newly loaded configuration
+        """
+        global _CONFIG
+        _CONFIG = _read_config()
+        cls._composite_score = staticmethod(
+            _compile_composite_score(_CONFIG.get('hazard_weights', {}), cls.HAZARD_TYPES)
+        )
+        cls._hazard_labels = {h: _CONFIG.get('hazard_labels', {}).get(h, h.title()) for h in cls.HAZARD_TYPES}
+        return _CONFIG
 
     @staticmethod
     def geocode_property_address(
@@ -85,6 +448,8 @@ class ClimateRiskService:
         """
         Convert property address to lat/lon using Census Geocoder (free, no API key)
 
+        Results are cached by normalized address for GEOCODE_CACHE_TTL_DAYS.
+
         Args:
             street: Street address
             city: City name
@@ -101,6 +466,42 @@ class ClimateRiskService:
             }
             or None if geocoding fails
         """
+        address_key = ClimateRiskService._address_key(street, city, state, zipcode)
+
+        try:
+            cached = GeocodeCache.lookup(address_key)
+            if cached:
+                return cached
+        except Exception as e:
+            logger.error(f"Geocode cache retrieval error: {e}")
+
+        result = ClimateRiskService._geocode_census(street, city, state, zipcode)
+
+        if result:
+            try:
+                GeocodeCache.upsert(
+                    address_key, result,
+                    _utcnow() + timedelta(days=ClimateRiskService.GEOCODE_CACHE_TTL_DAYS)
+                )
+                db.session.commit()
+            except Exception as e:
+                logger.error(f"Geocode cache storage error: {e}")
+                db.session.rollback()
+
+        return result
+
+    @staticmethod
+    def _address_key(street: str, city: str, state: str, zipcode: str) -> str:
+        """Hash of the address, lowercased with whitespace collapsed, for cache lookups"""
+        normalized = '|'.join(
+            ' '.join((part or '').lower().split())
+            for part in (street, city, state, zipcode)
+        )
+        return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+
+    @staticmethod
+    def _geocode_census(street: str, city: str, state: str, zipcode: str) -> Optional[Dict]:
+        """Query the Census Geocoder, falling back to a ZIP-only lookup"""
         try:
             params = {
                 'street': street or '',
@@ -111,14 +512,15 @@ class ClimateRiskService:
                 'format': 'json'
             }
 
-            response = requests.get(
+            ClimateRiskService._throttle_geocoder()
+            response = ClimateRiskService._get_session().get(
                 ClimateRiskService.CENSUS_GEOCODER_URL,
                 params=params,
                 timeout=10
             )
             response.raise_for_status()
 
-            data = response.json()
+            data = ClimateRiskService._json(response)
 
             if data.get('result', {}).get('addressMatches'):
                 match = data['result']['addressMatches'][0]
@@ -140,12 +542,13 @@ class ClimateRiskService:
                     'benchmark': 'Public_AR_Current',
                     'format': 'json'
                 }
-                response = requests.get(
+                ClimateRiskService._throttle_geocoder()
+                response = ClimateRiskService._get_session().get(
                     ClimateRiskService.CENSUS_GEOCODER_URL,
                     params=params,
                     timeout=10
                 )
-                data = response.json()
+                data = ClimateRiskService._json(response)
 
                 if data.get('result', {}).get('addressMatches'):
                     match = data['result']['addressMatches'][0]
@@ -165,12 +568,128 @@ class ClimateRiskService:
             logger.error(f"Geocoding error: {e}")
             return None
 
+    @staticmethod
+    def prefetch_cache(latitude: float, longitude: float, hazard_types: List[str]):
+        """
+        Load cache entries for several hazards at one location in a single query
+
+        Results are kept on flask.g for the current request; _get_cached_risk
+        answers from them instead of issuing one SELECT per hazard, and
+        _store_in_cache queues its writes for one upsert in _end_prefetch().
+
+        Args:
+            latitude: Property latitude
+            longitude: Property longitude
+            hazard_types: Hazards about to be calculated
+        """
+        if not has_app_context():
+            return
+
+        lat_rounded = round(latitude, 4)
+        lon_rounded = round(longitude, 4)
+
+        try:
+            entries = ClimateRiskCache.find_nearby_many(lat_rounded, lon_rounded, hazard_types)
+        except Exception as e:
+            logger.error(f"Cache prefetch error: {e}")
+            return
+
+        g.climate_risk_prefetch = {
+            'location': (lat_rounded, lon_rounded),
+            'hazards': frozenset(hazard_types),
+            'entries': entries,
+            'writes': []
+        }
+
+    @staticmethod
+    def _active_prefetch(lat_rounded: float, lon_rounded: float) -> Optional[Dict]:
+        """Return the request's prefetched cache state if it covers this location"""
+        if not has_app_context():
+            return None
+        prefetch = g.get('climate_risk_prefetch')
+        if prefetch is not None and prefetch['location'] == (lat_rounded, lon_rounded):
+            return prefetch
+        return None
+
+    @staticmethod
+    def _end_prefetch():
+        """Drop the prefetched cache state and write the deferred cache entries"""
+        if not has_app_context():
+            return
+        prefetch = g.pop('climate_risk_prefetch', None)
+        if prefetch is None or not prefetch['writes']:
+            return
+        try:
+            ClimateRiskCache.upsert_many(prefetch['writes'])
+            db.session.commit()
+        except Exception as e:
+            logger.error(f"Cache storage error: {e}")
+            db.session.rollback()
+
+    # Fixed per-hazard notes; emitted on cache reads instead of being stored
+    _HAZARD_NOTES = {
+        'wildfire': 'Full implementation would use USDA Wildfire Hazard Potential data',
+        'hurricane': 'Full implementation would use NOAA historical hurricane data',
+        'earthquake': 'Full implementation would use USGS Peak Ground Acceleration (PGA) data',
+        'tornado': 'Full implementation would use NOAA historical tornado data',
+        'extreme_heat': 'Full implementation would use NOAA historical temperature data',
+        'sea_level_rise': 'Full implementation would use NOAA Sea Level Rise elevation data',
+        'drought': 'Full implementation would use U.S. Drought Monitor real-time data'
+    }
+
+    @staticmethod
+    def _pack_details(details: Dict) -> Dict:
+        """
+        Strip fields from hazard details that can be rebuilt on read
+
+        Echoed coordinates and the fixed per-hazard note are dropped, and the
+        raw FEMA identify results are reduced to the flood zone they carry.
+
+        Args:
+            details: Hazard result 'details' dict
+
+        Returns:
+            Compact details dict for the cache
+        """
+        packed = {
+            k: v for k, v in details.items()
+            if k not in ('latitude', 'longitude', 'note', 'raw_data')
+        }
+        if 'raw_data' in details:
+            for item in details['raw_data']:
+                attrs = item.get('attributes', {})
+                zone = attrs.get('FLD_ZONE', attrs.get('ZONE'))
+                if zone is not None:
+                    packed['flood_zone'] = zone
+                    break
+        return packed
+
+    @staticmethod
+    def _unpack_details(hazard_type: str, packed: Dict, latitude: float, longitude: float) -> Dict:
+        """
+        Rebuild cached hazard details, restoring the fields _pack_details dropped
+
+        Args:
+            hazard_type: 'flood', 'wildfire', etc.
+            packed: Details as stored in the cache
+            latitude: Requested latitude (rounded to 4 decimals)
+            longitude: Requested longitude (rounded to 4 decimals)
+
+        Returns:
+            Details dict
+        """
+        details = {'latitude': latitude, 'longitude': longitude, **packed}
+        note = ClimateRiskService._HAZARD_NOTES.get(hazard_type)
+        if note is not None:
+            details['note'] = note
+        return details
+
     @staticmethod
     def _get_cached_risk(
         latitude: float,
         longitude: float,
         hazard_type: str
-    ) -> Optional[Dict]:
+    ) -> Optional[RiskResult]:
         """
         Check cache for existing climate risk data
 
@@ -180,41 +699,82 @@ class ClimateRiskService:
             hazard_type: 'flood', 'wildfire', etc.
 
         Returns:
-            Cached risk data dict or None if not found/expired
+            Cached RiskResult or None if not found/expired
         """
         try:
             # Round coords to 4 decimals for cache key
             lat_rounded = round(latitude, 4)
             lon_rounded = round(longitude, 4)
+            key = (lat_rounded, lon_rounded, hazard_type)
+
+            hit = ClimateRiskService._mem_cache_get(key)
+            if hit is not None:
+                return RiskResult(**hit)
+
+            # Redis is shared across workers, so check it before the database
+            redis_key = ClimateRiskService._redis_key(lat_rounded, lon_rounded, hazard_type)
+            hit = ClimateRiskService._redis_get(redis_key)
+            if hit is not None:
+                hit['details'] = ClimateRiskService._unpack_details(
+                    hazard_type, hit['details'], lat_rounded, lon_rounded
+                )
+                ClimateRiskService._mem_cache_put(key, hit, None)
+                return RiskResult(**hit)
 
-            cached = ClimateRiskCache.query.filter_by(
-                latitude=lat_rounded,
-                longitude=lon_rounded,
-                hazard_type=hazard_type
-            ).first()
+            prefetch = ClimateRiskService._active_prefetch(lat_rounded, lon_rounded)
+            if prefetch is not None and hazard_type in prefetch['hazards']:
+                cached = prefetch['entries'].get(hazard_type)
+            else:
+                # Reuse any unexpired entry within 100m rather than requiring an exact match
+                cached = ClimateRiskCache.find_nearby(lat_rounded, lon_rounded, hazard_type)
 
-            if cached and not cached.is_expired():
+            if cached:
                 logger.info(f"Cache hit for {hazard_type} at ({lat_rounded}, {lon_rounded})")
-                return {
-                    'score': cached.risk_score,
-                    'details': cached.risk_details,
-                    'data_source': cached.data_source,
-                    'cached': True,
-                    'cached_at': cached.created_at.isoformat()
-                }
-
-            if cached and cached.is_expired():
-                logger.info(f"Cache expired for {hazard_type} at ({lat_rounded}, {lon_rounded})")
-                # Delete expired entry
-                db.session.delete(cached)
-                db.session.commit()
+                return ClimateRiskService._cache_entry_result(hazard_type, lat_rounded, lon_rounded, cached)
 
+            # Expired entries at this location are overwritten by _store_in_cache
             return None
 
         except Exception as e:
             logger.error(f"Cache retrieval error: {e}")
             return None
 
+    @staticmethod
+    def _cache_entry_result(
+        hazard_type: str,
+        lat_rounded: float,
+        lon_rounded: float,
+        cached: ClimateRiskCache
+    ) -> RiskResult:
+        """
+        Convert a ClimateRiskCache row into a RiskResult, populating the
+        Redis and in-memory tiers on the way
+
+        Args:
+            hazard_type: 'flood', 'wildfire', etc.
+            lat_rounded: Property latitude rounded to 4 decimals
+            lon_rounded: Property longitude rounded to 4 decimals
+            cached: Cache row for this hazard at (or near) the location
+
+        Returns:
+            Cached RiskResult
+        """
+        packed = {
+            'score': cached.score,
+            'details': cached.risk_details,
+            'data_source': cached.data_source,
+            'cached': True,
+            'cached_at': cached.created_at.isoformat()
+        }
+        ClimateRiskService._redis_set(
+            ClimateRiskService._redis_key(lat_rounded, lon_rounded, hazard_type), packed, cached.expires_at
+        )
+        result = dict(packed, details=ClimateRiskService._unpack_details(
+            hazard_type, cached.risk_details or {}, lat_rounded, lon_rounded
+        ))
+        ClimateRiskService._mem_cache_put((lat_rounded, lon_rounded, hazard_type), result, cached.expires_at)
+        return RiskResult(**result)
+
     @staticmethod
     def _store_in_cache(
         latitude: float,
@@ -223,7 +783,8 @@ class ClimateRiskService:
         risk_score: float,
         risk_details: Dict,
         data_source: str,
-        ttl_days: int
+        ttl_days: int,
+        now: Optional[datetime] = None
     ):
         """
         Store climate risk data in cache
@@ -236,42 +797,51 @@ class ClimateRiskService:
             risk_details: Full hazard data
             data_source: API source name
             ttl_days: Time-to-live in days
+            now: Scoring timestamp (naive UTC); shared by every hazard of a
+                property so created_at/expires_at line up
         """
         try:
             # Round coords to 4 decimals
             lat_rounded = round(latitude, 4)
             lon_rounded = round(longitude, 4)
 
-            # Check if entry already exists
-            existing = ClimateRiskCache.query.filter_by(
-                latitude=lat_rounded,
-                longitude=lon_rounded,
-                hazard_type=hazard_type
-            ).first()
-
-            if existing:
-                # Update existing
-                existing.risk_score = risk_score
-                existing.risk_details = risk_details
-                existing.data_source = data_source
-                existing.created_at = datetime.utcnow()
-                existing.expires_at = datetime.utcnow() + timedelta(days=ttl_days)
-            else:
-                # Create new
-                cache_entry = ClimateRiskCache(
-                    latitude=lat_rounded,
-                    longitude=lon_rounded,
-                    hazard_type=hazard_type,
-                    risk_score=risk_score,
-                    risk_details=risk_details,
-                    data_source=data_source,
-                    expires_at=datetime.utcnow() + timedelta(days=ttl_days)
-                )
-                db.session.add(cache_entry)
+            if now is None:
+                now = _utcnow()
+            expires_at = now + timedelta(days=ttl_days)
 
-            db.session.commit()
+            packed_details = ClimateRiskService._pack_details(risk_details)
+            entry = (
+                lat_rounded, lon_rounded, hazard_type,
+                risk_score, packed_details, data_source,
+                expires_at, now
+            )
+
+            # During a prefetched composite scoring, writes are queued and
+            # flushed as one multi-row upsert by _end_prefetch()
+            prefetch = ClimateRiskService._active_prefetch(lat_rounded, lon_rounded)
+            if prefetch is not None:
+                prefetch['writes'].append(entry)
+            else:
+                ClimateRiskCache.upsert(*entry)
+                db.session.commit()
             logger.info(f"Cached {hazard_type} risk for ({lat_rounded}, {lon_rounded})")
 
+            # Write through so repeat scoring of this address skips the database
+            packed = {
+                'score': risk_score,
+                'details': packed_details,
+                'data_source': data_source,
+                'cached': True,
+                'cached_at': now.isoformat()
+            }
+            ClimateRiskService._redis_set(
+                ClimateRiskService._redis_key(lat_rounded, lon_rounded, hazard_type), packed, expires_at
+            )
+            result = dict(packed, details=ClimateRiskService._unpack_details(
+                hazard_type, packed_details, lat_rounded, lon_rounded
+            ))
+            ClimateRiskService._mem_cache_put((lat_rounded, lon_rounded, hazard_type), result, expires_at)
+
         except Exception as e:
             logger.error(f"Cache storage error: {e}")
             db.session.rollback()
@@ -296,8 +866,460 @@ class ClimateRiskService:
 
         return c * r
 
+    # Coastline reference points, stored as radians for vectorized haversine
+    _HURRICANE_COAST_POINTS = [
+        # Atlantic coastline approximate points
+        (25.8, -80.2),  # Miami
+        (28.5, -81.4),  # Orlando (inland reference)
+        (32.8, -79.9),  # Charleston
+        (36.9, -76.2),  # Norfolk
+        (40.7, -74.0),  # New York
+        (42.4, -71.1),  # Boston
+        # Gulf coastline approximate points
+        (25.8, -80.2),  # Miami
+        (26.1, -81.8),  # Naples
+        (27.9, -82.5),  # Tampa
+        (30.4, -84.3),  # Tallahassee (inland)
+        (30.4, -87.2),  # Pensacola
+        (30.7, -88.0),  # Mobile
+        (29.9, -90.1),  # New Orleans
+        (29.3, -94.8),  # Galveston
+        (27.8, -97.4),  # Corpus Christi
+    ]
+    _HURRICANE_COAST_LATS_RAD = np.radians([p[0] for p in _HURRICANE_COAST_POINTS])
+    _HURRICANE_COAST_LONS_RAD = np.radians([p[1] for p in _HURRICANE_COAST_POINTS])
+    _HURRICANE_COAST_TREE = _coast_tree(_HURRICANE_COAST_LATS_RAD, _HURRICANE_COAST_LONS_RAD)
+
+    _SEA_LEVEL_COAST_POINTS = [
+        # Atlantic coast
+        (25.8, -80.2),  # Miami
+        (32.8, -79.9),  # Charleston
+        (36.9, -76.2),  # Norfolk
+        (40.7, -74.0),  # New York
+        (42.4, -71.1),  # Boston
+        # Gulf coast
+        (29.9, -90.1),  # New Orleans
+        (29.7, -95.4),  # Houston
+        (27.9, -82.5),  # Tampa
+        # Pacific coast
+        (32.7, -117.2),  # San Diego
+        (33.9, -118.2),  # Los Angeles
+        (37.8, -122.4),  # San Francisco
+        (47.6, -122.3),  # Seattle
+    ]
+    _SEA_LEVEL_COAST_LATS_RAD = np.radians([p[0] for p in _SEA_LEVEL_COAST_POINTS])
+    _SEA_LEVEL_COAST_LONS_RAD = np.radians([p[1] for p in _SEA_LEVEL_COAST_POINTS])
+    _SEA_LEVEL_COAST_TREE = _coast_tree(_SEA_LEVEL_COAST_LATS_RAD, _SEA_LEVEL_COAST_LONS_RAD)
+
+    # Geographic zone tables: (lat_min, lat_max, lon_min, lon_max, ...result),
+    # bounds inclusive, checked in order with the first match winning
+    _WILDFIRE_ZONES = (
+        (32, 42, -125, -114, 85),  # Very High - California wildfires
+        (42, 49, -125, -116, 70),  # High - Oregon, Washington
+        (31, 42, -125, -102, 75),  # High - Arizona, New Mexico
+        (35, 49, -116, -102, 65),  # Moderate-High - Mountain states
+        (-90, 90, -125, -102, 55),  # Moderate - Other western areas
+    )
+
+    _EARTHQUAKE_ZONES = (
+        # California coast - San Andreas, Hayward faults
+        (32, 42, -125, -117, 85.0, 'Very High', 'Very High Risk - Major active fault zones'),
+        # Pacific Northwest - Cascadia subduction zone
+        (42, 49, -125, -116, 75.0, 'High', 'High Risk - Cascadia subduction zone'),
+        # Inland California - Eastern CA faults
+        (32, 42, -117, -114, 65.0, 'Moderate-High', 'Moderate-High Risk - Active seismic area'),
+        # Nevada/Utah - Basin and Range
+        (35, 42, -120, -109, 45.0, 'Moderate', 'Moderate Risk - Basin and Range province'),
+        # Central US - New Madrid zone
+        (35, 40, -92, -87, 35.0, 'Low-Moderate', 'Low-Moderate Risk - New Madrid seismic zone'),
+    )
+
+    _TORNADO_ZONES = (
+        # Tornado Alley: Central plains (OK, KS, NE, TX panhandle, SD)
+        (33, 43, -103, -95, 85.0, 'Very High', 'Very High Risk - Tornado Alley (highest frequency in US)'),
+        # Dixie Alley: Southeast (MS, AL, TN, AR)
+        (31, 37, -95, -84, 75.0, 'High', 'High Risk - Dixie Alley (frequent strong tornadoes)'),
+        # High frequency midwest
+        (36, 43, -95, -84, 60.0, 'Moderate-High', 'Moderate-High Risk - Midwest tornado activity'),
+        # Moderate: Eastern US
+        (30, 42, -84, -75, 35.0, 'Moderate', 'Moderate Risk - Occasional tornado activity'),
+    )
+
+    _HEAT_ZONES = (
+        # Southwest desert regions - Phoenix, Las Vegas, desert areas
+        (32, 37, -117, -102, 90.0, 'Very High', 'Very High Risk - Desert climate, 30+ days >100°F annually'),
+        # Deep South heat and humidity
+        (28, 35, -107, -80, 70.0, 'High', 'High Risk - Hot, humid summers with frequent heat waves'),
+        # Southern plains - Texas, Oklahoma heat
+        (30, 37, -103, -93, 60.0, 'Moderate-High', 'Moderate-High Risk - Hot summers, 15-30 days >100°F'),
+        # Mid-latitude states
+        (37, 42, -180, 180, 35.0, 'Moderate', 'Moderate Risk - Warm summers, occasional heat waves'),
+        # Northern states (latitude 42 itself is mid-latitude, matched above)
+        (42, 90, -180, 180, 15.0, 'Low', 'Low Risk - Cool to moderate summers'),
+    )
+
+    _DROUGHT_ZONES = (
+        # Southwest deserts - arid climate
+        (32, 40, -120, -102, 85.0, 'Very High', 'Very High Risk - Arid climate, frequent severe droughts'),
+        # California - Mediterranean climate, water scarcity
+        (32, 42, -125, -114, 70.0, 'High', 'High Risk - Mediterranean climate, recurring drought cycles'),
+        # Great Plains - variable precipitation
+        (35, 45, -103, -95, 55.0, 'Moderate-High', 'Moderate-High Risk - Variable precipitation, periodic droughts'),
+        # Southeast - generally humid but can have droughts
+        (30, 37, -95, -75, 35.0, 'Moderate', 'Moderate Risk - Generally humid, occasional drought conditions'),
+        # Pacific Northwest - high precipitation
+        (42, 49, -125, -116, 15.0, 'Low', 'Low Risk - High precipitation region, rare droughts'),
+        # Northeast - adequate precipitation
+        (38, 47, -80, -67, 15.0, 'Low', 'Low Risk - High precipitation region, rare droughts'),
+    )
+
+    # Score bands: bisect_right(thresholds, value) indexes the matching row,
+    # so a value equal to a threshold falls in the band above it
+    _FLOOD_THRESHOLDS = (20, 50, 70, 85)
+    _FLOOD_TEXT = (
+        'Very Low Risk - Area of minimal flood hazard',
+        'Low Risk - Minimal flood hazard',
+        'Moderate Risk - 0.2% annual flood chance (500-year floodplain)',
+        'High Risk - 1% annual flood chance (100-year floodplain)',
+        'Very High Risk - High velocity flood zone or 1% annual chance',
+    )
+
+    _WILDFIRE_THRESHOLDS = (20, 40, 70, 90)
+    _WILDFIRE_LEVELS = (
+        ('Very Low', 'Very Low wildfire risk'),
+        ('Low', 'Low wildfire risk'),
+        ('Moderate', 'Moderate wildfire risk'),
+        ('High', 'High wildfire risk - regular fire activity'),
+        ('Very High', 'Very High wildfire risk - frequent large fires'),
+    )
+
+    # Distance bands in miles from the coast, nearest first
+    _HURRICANE_DISTANCES = (25, 50, 100, 200)
+    _HURRICANE_BANDS = (
+        (95.0, 'Within 25 miles of coast', 'Very High Risk - Direct coastal exposure to hurricanes'),
+        (75.0, 'Within 50 miles of coast', 'High Risk - Near coastal, significant hurricane exposure'),
+        (50.0, 'Within 100 miles of coast', 'Moderate Risk - Inland but within hurricane range'),
+        (25.0, 'Within 200 miles of coast', 'Low Risk - Far enough inland to reduce risk'),
+        (5.0, 'More than 200 miles from coast', 'Very Low Risk - Well inland from coastal areas'),
+    )
+
+    _SEA_LEVEL_DISTANCES = (2, 5, 10, 25)
+    _SEA_LEVEL_BANDS = (
+        (95.0, 'Very High', 'Very High Risk - Direct coastal exposure to sea level rise'),
+        (75.0, 'High', 'High Risk - Low-lying coastal area vulnerable to sea level rise'),
+        (50.0, 'Moderate', 'Moderate Risk - Within coastal zone, potential long-term impacts'),
+        (20.0, 'Low', 'Low Risk - Outside immediate sea level rise impact zone'),
+        (0.0, 'N/A', 'Not Applicable - Inland property not affected by sea level rise'),
+    )
+
+    _WILDFIRE_GRID = _rasterize_zones(_WILDFIRE_ZONES)
+    _EARTHQUAKE_GRID = _rasterize_zones(_EARTHQUAKE_ZONES)
+    _TORNADO_GRID = _rasterize_zones(_TORNADO_ZONES)
+    _HEAT_GRID = _rasterize_zones(_HEAT_ZONES)
+    _DROUGHT_GRID = _rasterize_zones(_DROUGHT_ZONES)
+
+    @staticmethod
+    def _match_zone(latitude: float, longitude: float, zones: tuple, grid: np.ndarray) -> Optional[tuple]:
+        """
+        Return the first zone whose bounding box contains the point
+
+        Looks the point up in the zone table's pre-rasterized grid; points on a
+        whole-degree grid line (or off the globe) scan the table instead.
+
+        Args:
+            latitude: Property latitude
+            longitude: Property longitude
+            zones: Zone table of (lat_min, lat_max, lon_min, lon_max, ...) rows
+            grid: _rasterize_zones(zones)
+
+        Returns:
+            Matching zone row or None
+        """
+        if -90 < latitude < 90 and -180 < longitude < 180 \
+                and not float(latitude).is_integer() and not float(longitude).is_integer():
+            index = grid[int(latitude + 90), int(longitude + 180)]
+            return zones[index - 1] if index else None
+
+        for zone in zones:
+            if zone[0] <= latitude <= zone[1] and zone[2] <= longitude <= zone[3]:
+                return zone
+        return None
+
+    @staticmethod
+    def _min_distance_miles(
+        latitude: float,
+        longitude: float,
+        lats_rad: np.ndarray,
+        lons_rad: np.ndarray,
+        tree: cKDTree
+    ) -> float:
+        """
+        Minimum great-circle distance in miles from a point to a set of points
+
+        The nearest reference point comes from an O(log N) k-d tree query
+        (see _coast_tree); the distance to it is then computed with the same
+        Haversine formula as calculate_distance_miles().
+        """
+        lat_r = radians(latitude)
+        lon_r = radians(longitude)
+
+        _, i = tree.query((cos(lat_r) * cos(lon_r), cos(lat_r) * sin(lon_r), sin(lat_r)))
+
+        a = (sin((lats_rad[i] - lat_r) / 2) ** 2
+             + cos(lat_r) * cos(lats_rad[i]) * sin((lons_rad[i] - lon_r) / 2) ** 2)
+
+        return float(3956 * 2 * asin(sqrt(a)))
+
+    @staticmethod
+    def _classify_batch(lats: np.ndarray, lons: np.ndarray, zones: tuple) -> np.ndarray:
+        """
+        Vectorized _match_zone() over arrays of points
+
+        Broadcasts every point against every zone bounding box and takes the
+        first matching row, so a whole portfolio is classified in one pass.
+
+        Args:
+            lats: Property latitudes, shape (N,)
+            lons: Property longitudes, shape (N,)
+            zones: Zone table of (lat_min, lat_max, lon_min, lon_max, ...) rows
+
+        Returns:
+            int array of zone row indexes, -1 where no zone matches
+        """
+        bounds = np.array([zone[:4] for zone in zones], dtype=float)
+        lat = lats[:, None]
+        lon = lons[:, None]
+        mask = ((lat >= bounds[:, 0]) & (lat <= bounds[:, 1])
+                & (lon >= bounds[:, 2]) & (lon <= bounds[:, 3]))
+        return np.where(mask.any(axis=1), mask.argmax(axis=1), -1)
+
+    @staticmethod
+    def _min_distance_miles_batch(
+        lats: np.ndarray,
+        lons: np.ndarray,
+        lats_rad: np.ndarray,
+        lons_rad: np.ndarray,
+        tree: cKDTree
+    ) -> np.ndarray:
+        """Vectorized _min_distance_miles() over arrays of points"""
+        lat_r = np.radians(lats)
+        lon_r = np.radians(lons)
+
+        _, i = tree.query(np.column_stack((
+            np.cos(lat_r) * np.cos(lon_r), np.cos(lat_r) * np.sin(lon_r), np.sin(lat_r)
+        )))
+
+        a = (np.sin((lats_rad[i] - lat_r) / 2) ** 2
+             + np.cos(lat_r) * np.cos(lats_rad[i]) * np.sin((lons_rad[i] - lon_r) / 2) ** 2)
+
+        return 3956 * 2 * np.arcsin(np.sqrt(a))
+
+    # Result builders shared by the scalar calculate_*_risk() methods and
+    # calculate_composite_climate_risk_batch(); each takes the already
+    # classified zone row (or coast distance) for one point
+
     @staticmethod
-    def calculate_flood_risk(latitude: float, longitude: float) -> Dict:
+    def _wildfire_result(latitude: float, longitude: float, zone: Optional[tuple]) -> RiskResult:
+        """Build the wildfire RiskResult for a _WILDFIRE_ZONES row (or None)"""
+        # Adjust for elevation/terrain (simplified)
+        # Higher elevations in west = more wildfire risk
+        # This is a placeholder - full implementation would use elevation API
+        risk_score = zone[4] if zone else 20  # Low - Eastern US
+
+        hazard_level, interpretation = ClimateRiskService._WILDFIRE_LEVELS[
+            bisect_right(ClimateRiskService._WILDFIRE_THRESHOLDS, risk_score)
+        ]
+
+        return RiskResult(
+            score=round(risk_score, 1),
+            zone_key='hazard_level',
+            zone=hazard_level,
+            interpretation=interpretation,
+            data_source='Geographic heuristics (simplified)',
+            details={
+                'latitude': latitude,
+                'longitude': longitude,
+                'region': 'Western US' if -125 <= longitude <= -102 else 'Eastern US',
+                'note': ClimateRiskService._HAZARD_NOTES['wildfire']
+            }
+        )
+
+    @staticmethod
+    def _hurricane_result(latitude: float, longitude: float, min_distance: float) -> RiskResult:
+        """Build the hurricane RiskResult from the distance to the nearest coast point"""
+        risk_score, proximity, interpretation = ClimateRiskService._HURRICANE_BANDS[
+            bisect_right(ClimateRiskService._HURRICANE_DISTANCES, min_distance)
+        ]
+
+        # Adjust for latitude (northern areas have lower hurricane frequency)
+        if latitude > 40:
+            risk_score *= 0.6  # Reduce score for northern latitudes
+        elif latitude > 35:
+            risk_score *= 0.8
+
+        return RiskResult(
+            score=round(risk_score, 1),
+            zone_key='coastal_proximity',
+            zone=proximity,
+            distance_to_coast_miles=round(min_distance, 1),
+            interpretation=interpretation,
+            data_source='Geographic model (simplified)',
+            details={
+                'latitude': latitude,
+                'longitude': longitude,
+                'note': ClimateRiskService._HAZARD_NOTES['hurricane']
+            }
+        )
+
+    @staticmethod
+    def _earthquake_result(latitude: float, longitude: float, zone: Optional[tuple]) -> RiskResult:
+        """Build the earthquake RiskResult for an _EARTHQUAKE_ZONES row (or None)"""
+        if zone:
+            risk_score, seismic_zone, interpretation = zone[4:]
+        else:
+            risk_score = 10.0  # Low - Stable continental interior
+            seismic_zone = 'Low'
+            interpretation = 'Low Risk - Stable continental region'
+
+        return RiskResult(
+            score=round(risk_score, 1),
+            zone_key='seismic_zone',
+            zone=seismic_zone,
+            interpretation=interpretation,
+            data_source='Geographic seismic model (simplified)',
+            details={
+                'latitude': latitude,
+                'longitude': longitude,
+                'note': ClimateRiskService._HAZARD_NOTES['earthquake']
+            }
+        )
+
+    @staticmethod
+    def _tornado_result(latitude: float, longitude: float, zone: Optional[tuple]) -> RiskResult:
+        """Build the tornado RiskResult for a _TORNADO_ZONES row (or None)"""
+        if zone:
+            risk_score, tornado_zone, interpretation = zone[4:]
+        elif longitude < -103 or (latitude > 42 and longitude > -80):
+            risk_score = 10.0  # Low - Western/Northeast
+            tornado_zone = 'Low'
+            interpretation = 'Low Risk - Rare tornado occurrence'
+        else:
+            risk_score = 20.0  # Low-Moderate - Other areas
+            tornado_zone = 'Low-Moderate'
+            interpretation = 'Low-Moderate Risk'
+
+        return RiskResult(
+            score=round(risk_score, 1),
+            zone_key='tornado_zone',
+            zone=tornado_zone,
+            interpretation=interpretation,
+            data_source='Geographic tornado model (simplified)',
+            details={
+                'latitude': latitude,
+                'longitude': longitude,
+                'note': ClimateRiskService._HAZARD_NOTES['tornado']
+            }
+        )
+
+    @staticmethod
+    def _heat_marine_factor(latitude: float, longitude: float) -> float:
+        """Extreme heat multiplier for coastal areas with marine influence"""
+        if -125 <= longitude <= -115 and 32 <= latitude <= 42:
+            return 0.8  # West coast marine influence
+        if -80 <= longitude <= -70 and 38 <= latitude <= 45:
+            return 0.9  # Northeast coast
+        return 1.0
+
+    @staticmethod
+    def _heat_marine_factor_batch(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+        """Vectorized _heat_marine_factor() over arrays of points"""
+        west_coast = (lons >= -125) & (lons <= -115) & (lats >= 32) & (lats <= 42)
+        northeast = (lons >= -80) & (lons <= -70) & (lats >= 38) & (lats <= 45)
+        return np.where(west_coast, 0.8, np.where(northeast, 0.9, 1.0))
+
+    @staticmethod
+    def _extreme_heat_result(
+        latitude: float,
+        longitude: float,
+        zone: Optional[tuple],
+        marine_factor: Optional[float] = None
+    ) -> RiskResult:
+        """Build the extreme heat RiskResult for a _HEAT_ZONES row (or None)"""
+        if zone:
+            risk_score, heat_zone, interpretation = zone[4:]
+        else:
+            risk_score = 30.0  # Low-Moderate
+            heat_zone = 'Low-Moderate'
+            interpretation = 'Low-Moderate Risk'
+
+        # Coastal areas get slight reduction due to marine influence
+        if marine_factor is None:
+            marine_factor = ClimateRiskService._heat_marine_factor(latitude, longitude)
+        risk_score *= marine_factor
+
+        return RiskResult(
+            score=round(risk_score, 1),
+            zone_key='heat_zone',
+            zone=heat_zone,
+            interpretation=interpretation,
+            data_source='Geographic climate model (simplified)',
+            details={
+                'latitude': latitude,
+                'longitude': longitude,
+                'note': ClimateRiskService._HAZARD_NOTES['extreme_heat']
+            }
+        )
+
+    @staticmethod
+    def _sea_level_rise_result(latitude: float, longitude: float, min_distance: float) -> RiskResult:
+        """Build the sea level rise RiskResult from the distance to the nearest coast point"""
+        risk_score, coastal_vulnerability, interpretation = ClimateRiskService._SEA_LEVEL_BANDS[
+            bisect_right(ClimateRiskService._SEA_LEVEL_DISTANCES, min_distance)
+        ]
+
+        return RiskResult(
+            score=round(risk_score, 1),
+            zone_key='coastal_vulnerability',
+            zone=coastal_vulnerability,
+            distance_to_coast_miles=round(min_distance, 1),
+            interpretation=interpretation,
+            data_source='Geographic coastal model (simplified)',
+            details={
+                'latitude': latitude,
+                'longitude': longitude,
+                'note': ClimateRiskService._HAZARD_NOTES['sea_level_rise']
+            }
+        )
+
+    @staticmethod
+    def _drought_result(latitude: float, longitude: float, zone: Optional[tuple]) -> RiskResult:
+        """Build the drought RiskResult for a _DROUGHT_ZONES row (or None)"""
+        if zone:
+            risk_score, drought_zone, interpretation = zone[4:]
+        else:
+            risk_score = 30.0  # Low-Moderate
+            drought_zone = 'Low-Moderate'
+            interpretation = 'Low-Moderate Risk'
+
+        return RiskResult(
+            score=round(risk_score, 1),
+            zone_key='drought_zone',
+            zone=drought_zone,
+            interpretation=interpretation,
+            data_source='Geographic climate model (simplified)',
+            details={
+                'latitude': latitude,
+                'longitude': longitude,
+                'note': ClimateRiskService._HAZARD_NOTES['drought']
+            }
+        )
+
+    @staticmethod
+    def calculate_flood_risk(
+        latitude: float,
+        longitude: float,
+        now: Optional[datetime] = None
+    ) -> RiskResult:
         """
         Calculate flood risk using FEMA National Flood Hazard Layer (NFHL)
 
@@ -312,13 +1334,22 @@ class ClimateRiskService:
                 'details': {...}
             }
         """
-        config = ClimateRiskService._load_config()
-
         # Check cache first
         cached = ClimateRiskService._get_cached_risk(latitude, longitude, 'flood')
         if cached:
             return cached
 
+        # Concurrent misses for the same location share one FEMA request
+        return ClimateRiskService._singleflight(
+            ('flood', round(latitude, 4), round(longitude, 4)),
+            ClimateRiskService._fetch_flood_risk, latitude, longitude, now
+        )
+
+    @staticmethod
+    def _fetch_flood_risk(latitude: float, longitude: float, now: Optional[datetime] = None) -> RiskResult:
+        """Query FEMA NFHL for the flood zone at a point and cache the scored result"""
+        config = _CONFIG
+
         try:
             # Query FEMA NFHL MapServer for flood zone
             # Using identify endpoint to find flood zone at lat/lon
@@ -328,7 +1359,7 @@ class ClimateRiskService:
                 'geometry': f'{longitude},{latitude}',
                 'geometryType': 'esriGeometryPoint',
                 'sr': '4326',  # WGS84
-                'layers': 'all',
+                'layers': f'all:{ClimateRiskService.FEMA_FLOOD_HAZARD_LAYER}',
                 'tolerance': '2',
                 'mapExtent': f'{longitude-0.01},{latitude-0.01},{longitude+0.01},{latitude+0.01}',
                 'imageDisplay': '400,400,96',
@@ -336,10 +1367,11 @@ class ClimateRiskService:
                 'f': 'json'
             }
 
-            response = requests.get(map_server_url, params=params, timeout=15)
-            response.raise_for_status()
-
-            data = response.json()
+            with ClimateRiskService._get_session().get(
+                map_server_url, params=params, timeout=15, stream=True
+            ) as response:
+                response.raise_for_status()
+                data = ClimateRiskService._json_capped(response, ClimateRiskService.FEMA_MAX_RESPONSE_BYTES)
 
             # Parse flood zone from response
             flood_zone = None
@@ -370,35 +1402,28 @@ class ClimateRiskService:
                 flood_zone = 'X'
 
             # Generate interpretation
-            if risk_score >= 85:
-                interpretation = 'Very High Risk - High velocity flood zone or 1% annual chance'
-            elif risk_score >= 70:
-                interpretation = 'High Risk - 1% annual flood chance (100-year floodplain)'
-            elif risk_score >= 50:
-                interpretation = 'Moderate Risk - 0.2% annual flood chance (500-year floodplain)'
-            elif risk_score >= 20:
-                interpretation = 'Low Risk - Minimal flood hazard'
-            else:
-                interpretation = 'Very Low Risk - Area of minimal flood hazard'
+            interpretation = ClimateRiskService._FLOOD_TEXT[
+                bisect_right(ClimateRiskService._FLOOD_THRESHOLDS, risk_score)
+            ]
 
-            result = {
-                'score': round(risk_score, 1),
-                'flood_zone': flood_zone,
-                'interpretation': interpretation,
-                'data_source': 'FEMA NFHL',
-                'details': {
+            result = RiskResult(
+                score=round(risk_score, 1),
+                zone_key='flood_zone',
+                zone=flood_zone,
+                interpretation=interpretation,
+                data_source='FEMA NFHL',
+                details={
                     'latitude': latitude,
                     'longitude': longitude,
                     'raw_data': data.get('results', [])[:1] if data.get('results') else []
-                },
-                'cached': False
-            }
+                }
+            )
 
             # Store in cache
             ClimateRiskService._store_in_cache(
                 latitude, longitude, 'flood',
-                result['score'], result['details'],
-                'FEMA NFHL', config['cache_ttl_days']['flood']
+                result.score, result.details,
+                'FEMA NFHL', config['cache_ttl_days']['flood'], now
             )
 
             return result
@@ -406,17 +1431,22 @@ class ClimateRiskService:
         except Exception as e:
             logger.error(f"Flood risk calculation error: {e}")
             # Return default moderate risk with error
-            return {
-                'score': 25.0,
-                'flood_zone': 'Unknown',
-                'interpretation': 'Unable to determine flood risk',
-                'data_source': 'FEMA NFHL (unavailable)',
-                'error': str(e),
-                'details': {}
-            }
+            return RiskResult(
+                score=25.0,
+                zone_key='flood_zone',
+                zone='Unknown',
+                interpretation='Unable to determine flood risk',
+                data_source='FEMA NFHL (unavailable)',
+                error=str(e),
+                details={}
+            )
 
     @staticmethod
-    def calculate_wildfire_risk(latitude: float, longitude: float) -> Dict:
+    def calculate_wildfire_risk(
+        latitude: float,
+        longitude: float,
+        now: Optional[datetime] = None
+    ) -> RiskResult:
         """
         Calculate wildfire risk using simplified geographic heuristics
 
@@ -434,7 +1464,7 @@ class ClimateRiskService:
                 'details': {...}
             }
         """
-        config = ClimateRiskService._load_config()
+        config = _CONFIG
 
         # Check cache
         cached = ClimateRiskService._get_cached_risk(latitude, longitude, 'wildfire')
@@ -442,90 +1472,38 @@ class ClimateRiskService:
             return cached
 
         try:
-            # Simplified wildfire risk based on geographic location
-            # High-risk states: CA, OR, WA, ID, MT, WY, CO, NM, AZ, NV, UT, TX
-            # Using latitude/longitude ranges as proxy
-
-            # Western US high-risk zones
-            is_western = -125 <= longitude <= -102
-            is_southwestern = 31 <= latitude <= 42 and -125 <= longitude <= -102
-            is_california = 32 <= latitude <= 42 and -125 <= longitude <= -114
-            is_pacific_nw = 42 <= latitude <= 49 and -125 <= longitude <= -116
-            is_mountain_west = 35 <= latitude <= 49 and -116 <= longitude <= -102
-
-            # Calculate base score
-            if is_california:
-                base_score = 85  # Very High - California wildfires
-            elif is_pacific_nw:
-                base_score = 70  # High - Oregon, Washington
-            elif is_southwestern:
-                base_score = 75  # High - Arizona, New Mexico
-            elif is_mountain_west:
-                base_score = 65  # Moderate-High - Mountain states
-            elif is_western:
-                base_score = 55  # Moderate - Other western areas
-            else:
-                base_score = 20  # Low - Eastern US
-
-            # Adjust for elevation/terrain (simplified)
-            # Higher elevations in west = more wildfire risk
-            # This is a placeholder - full implementation would use elevation API
-
-            risk_score = base_score
-
-            # Determine hazard level
-            if risk_score >= 90:
-                hazard_level = 'Very High'
-                interpretation = 'Very High wildfire risk - frequent large fires'
-            elif risk_score >= 70:
-                hazard_level = 'High'
-                interpretation = 'High wildfire risk - regular fire activity'
-            elif risk_score >= 40:
-                hazard_level = 'Moderate'
-                interpretation = 'Moderate wildfire risk'
-            elif risk_score >= 20:
-                hazard_level = 'Low'
-                interpretation = 'Low wildfire risk'
-            else:
-                hazard_level = 'Very Low'
-                interpretation = 'Very Low wildfire risk'
-
-            result = {
-                'score': round(risk_score, 1),
-                'hazard_level': hazard_level,
-                'interpretation': interpretation,
-                'data_source': 'Geographic heuristics (simplified)',
-                'details': {
-                    'latitude': latitude,
-                    'longitude': longitude,
-                    'region': 'Western US' if is_western else 'Eastern US',
-                    'note': 'Full implementation would use USDA Wildfire Hazard Potential data'
-                },
-                'cached': False
-            }
+            zone = ClimateRiskService._match_zone(
+                latitude, longitude, ClimateRiskService._WILDFIRE_ZONES, ClimateRiskService._WILDFIRE_GRID
+            )
+            result = ClimateRiskService._wildfire_result(latitude, longitude, zone)
 
             # Cache it
             ClimateRiskService._store_in_cache(
                 latitude, longitude, 'wildfire',
-                result['score'], result['details'],
-                'Geographic heuristics', config['cache_ttl_days']['wildfire']
+                result.score, result.details,
+                'Geographic heuristics', config['cache_ttl_days']['wildfire'], now
             )
 
             return result
 
         except Exception as e:
             logger.error(f"Wildfire risk calculation error: {e}")
-            return {
-                'score': 30.0,
-                'hazard_level': 'Unknown',
-                'interpretation': 'Unable to determine wildfire risk',
-                'data_source': 'N/A',
-                'error': str(e),
-                'details': {}
-            }
+            return RiskResult(
+                score=30.0,
+                zone_key='hazard_level',
+                zone='Unknown',
+                interpretation='Unable to determine wildfire risk',
+                data_source='N/A',
+                error=str(e),
+                details={}
+            )
 
     @staticmethod
-    def calculate_hurricane_risk(latitude: float, longitude: float) -> Dict:
+    def calculate_hurricane_risk(
+        latitude: float,
+        longitude: float,
+        now: Optional[datetime] = None
+    ) -> RiskResult:
         """
         Calculate hurricane risk based on coastal proximity and historical patterns
 
@@ -541,7 +1519,7 @@ class ClimateRiskService:
                 'details': {...}
             }
         """
-        config = ClimateRiskService._load_config()
+        config = _CONFIG
 
         # Check cache
         cached = ClimateRiskService._get_cached_risk(latitude, longitude, 'hurricane')
@@ -551,103 +1529,41 @@ class ClimateRiskService:
         try:
             # Hurricane-prone regions: Atlantic coast, Gulf coast
             # Simplified model based on proximity to coast
-
-            # Atlantic coastline approximate points
-            atlantic_points = [
-                (25.8, -80.2),  # Miami
-                (28.5, -81.4),  # Orlando (inland reference)
-                (32.8, -79.9),  # Charleston
-                (36.9, -76.2),  # Norfolk
-                (40.7, -74.0),  # New York
-                (42.4, -71.1),  # Boston
-            ]
-
-            # Gulf coastline approximate points
-            gulf_points = [
-                (25.8, -80.2),  # Miami
-                (26.1, -81.8),  # Naples
-                (27.9, -82.5),  # Tampa
-                (30.4, -84.3),  # Tallahassee (inland)
-                (30.4, -87.2),  # Pensacola
-                (30.7, -88.0),  # Mobile
-                (29.9, -90.1),  # New Orleans
-                (29.3, -94.8),  # Galveston
-                (27.8, -97.4),  # Corpus Christi
-            ]
-
-            # Calculate minimum distance to coast
-            min_distance = float('inf')
-
-            for point in atlantic_points + gulf_points:
-                distance = ClimateRiskService.calculate_distance_miles(
-                    latitude, longitude, point[0], point[1]
-                )
-                min_distance = min(min_distance, distance)
-
-            # Calculate risk score based on distance
-            if min_distance < 25:
-                risk_score = 95.0
-                proximity = 'Within 25 miles of coast'
-                interpretation = 'Very High Risk - Direct coastal exposure to hurricanes'
-            elif min_distance < 50:
-                risk_score = 75.0
-                proximity = 'Within 50 miles of coast'
-                interpretation = 'High Risk - Near coastal, significant hurricane exposure'
-            elif min_distance < 100:
-                risk_score = 50.0
-                proximity = 'Within 100 miles of coast'
-                interpretation = 'Moderate Risk - Inland but within hurricane range'
-            elif min_distance < 200:
-                risk_score = 25.0
-                proximity = 'Within 200 miles of coast'
-                interpretation = 'Low Risk - Far enough inland to reduce risk'
-            else:
-                risk_score = 5.0
-                proximity = 'More than 200 miles from coast'
-                interpretation = 'Very Low Risk - Well inland from coastal areas'
-
-            # Adjust for latitude (northern areas have lower hurricane frequency)
-            if latitude > 40:
-                risk_score *= 0.6  # Reduce score for northern latitudes
-            elif latitude > 35:
-                risk_score *= 0.8
-
-            result = {
-                'score': round(risk_score, 1),
-                'coastal_proximity': proximity,
-                'distance_to_coast_miles': round(min_distance, 1),
-                'interpretation': interpretation,
-                'data_source': 'Geographic model (simplified)',
-                'details': {
-                    'latitude': latitude,
-                    'longitude': longitude,
-                    'note': 'Full implementation would use NOAA historical hurricane data'
-                },
-                'cached': False
-            }
+            min_distance = ClimateRiskService._min_distance_miles(
+                latitude, longitude,
+                ClimateRiskService._HURRICANE_COAST_LATS_RAD,
+                ClimateRiskService._HURRICANE_COAST_LONS_RAD,
+                ClimateRiskService._HURRICANE_COAST_TREE
+            )
+            result = ClimateRiskService._hurricane_result(latitude, longitude, min_distance)
 
             # Cache it
             ClimateRiskService._store_in_cache(
                 latitude, longitude, 'hurricane',
-                result['score'], result['details'],
-                'Geographic model', config['cache_ttl_days']['hurricane']
+                result.score, result.details,
+                'Geographic model', config['cache_ttl_days']['hurricane'], now
             )
 
             return result
 
         except Exception as e:
             logger.error(f"Hurricane risk calculation error: {e}")
-            return {
-                'score': 15.0,
-                'coastal_proximity': 'Unknown',
-                'interpretation': 'Unable to determine hurricane risk',
-                'data_source': 'N/A',
-                'error': str(e),
-                'details': {}
-            }
+            return RiskResult(
+                score=15.0,
+                zone_key='coastal_proximity',
+                zone='Unknown',
+                interpretation='Unable to determine hurricane risk',
+                data_source='N/A',
+                error=str(e),
+                details={}
+            )
 
     @staticmethod
-    def calculate_earthquake_risk(latitude: float, longitude: float) -> Dict:
+    def calculate_earthquake_risk(
+        latitude: float,
+        longitude: float,
+        now: Optional[datetime] = None
+    ) -> RiskResult:
         """
         Calculate earthquake risk using simplified seismic zone model
 
@@ -663,7 +1579,7 @@ class ClimateRiskService:
                 'details': {...}
             }
         """
-        config = ClimateRiskService._load_config()
+        config = _CONFIG
 
         # Check cache
         cached = ClimateRiskService._get_cached_risk(latitude, longitude, 'earthquake')
@@ -671,84 +1587,38 @@ class ClimateRiskService:
             return cached
 
         try:
-            # High-risk zones: California, Pacific Northwest, Alaska
-            # Moderate zones: Nevada, Utah, parts of Montana, Idaho
-            # Low zones: Most of eastern and central US
-
-            # California seismic zones
-            is_ca_coast = 32 <= latitude <= 42 and -125 <= longitude <= -117
-            is_ca_inland = 32 <= latitude <= 42 and -117 <= longitude <= -114
-
-            # Pacific Northwest
-            is_pacific_nw = 42 <= latitude <= 49 and -125 <= longitude <= -116
-
-            # Nevada/Utah seismic zones
-            is_nevada_utah = 35 <= latitude <= 42 and -120 <= longitude <= -109
-
-            # Central US (New Madrid zone)
-            is_new_madrid = 35 <= latitude <= 40 and -92 <= longitude <= -87
-
-            # Calculate risk score
-            if is_ca_coast:
-                risk_score = 85.0  # Very High - San Andreas, Hayward faults
-                seismic_zone = 'Very High'
-                interpretation = 'Very High Risk - Major active fault zones'
-            elif is_pacific_nw:
-                risk_score = 75.0  # High - Cascadia subduction zone
-                seismic_zone = 'High'
-                interpretation = 'High Risk - Cascadia subduction zone'
-            elif is_ca_inland:
-                risk_score = 65.0  # Moderate-High - Eastern CA faults
-                seismic_zone = 'Moderate-High'
-                interpretation = 'Moderate-High Risk - Active seismic area'
-            elif is_nevada_utah:
-                risk_score = 45.0  # Moderate - Basin and Range
-                seismic_zone = 'Moderate'
-                interpretation = 'Moderate Risk - Basin and Range province'
-            elif is_new_madrid:
-                risk_score = 35.0  # Low-Moderate - New Madrid zone
-                seismic_zone = 'Low-Moderate'
-                interpretation = 'Low-Moderate Risk - New Madrid seismic zone'
-            else:
-                risk_score = 10.0  # Low - Stable continental interior
-                seismic_zone = 'Low'
-                interpretation = 'Low Risk - Stable continental region'
-
-            result = {
-                'score': round(risk_score, 1),
-                'seismic_zone': seismic_zone,
-                'interpretation': interpretation,
-                'data_source': 'Geographic seismic model (simplified)',
-                'details': {
-                    'latitude': latitude,
-                    'longitude': longitude,
-                    'note': 'Full implementation would use USGS Peak Ground Acceleration (PGA) data'
-                },
-                'cached': False
-            }
+            zone = ClimateRiskService._match_zone(
+                latitude, longitude, ClimateRiskService._EARTHQUAKE_ZONES, ClimateRiskService._EARTHQUAKE_GRID
+            )
+            result = ClimateRiskService._earthquake_result(latitude, longitude, zone)
 
             # Cache it
             ClimateRiskService._store_in_cache(
                 latitude, longitude, 'earthquake',
-                result['score'], result['details'],
-                'Geographic model', config['cache_ttl_days']['earthquake']
+                result.score, result.details,
+                'Geographic model', config['cache_ttl_days']['earthquake'], now
             )
 
             return result
 
         except Exception as e:
             logger.error(f"Earthquake risk calculation error: {e}")
-            return {
-                'score': 15.0,
-                'seismic_zone': 'Unknown',
-                'interpretation': 'Unable to determine earthquake risk',
-                'data_source': 'N/A',
-                'error': str(e),
-                'details': {}
-            }
+            return RiskResult(
+                score=15.0,
+                zone_key='seismic_zone',
+                zone='Unknown',
+                interpretation='Unable to determine earthquake risk',
+                data_source='N/A',
+                error=str(e),
+                details={}
+            )
 
     @staticmethod
-    def calculate_tornado_risk(latitude: float, longitude: float) -> Dict:
+    def calculate_tornado_risk(
+        latitude: float,
+        longitude: float,
+        now: Optional[datetime] = None
+    ) -> RiskResult:
         """
         Calculate tornado risk based on geographic location
 
@@ -764,7 +1634,7 @@ class ClimateRiskService:
                 'details': {...}
             }
         """
-        config = ClimateRiskService._load_config()
+        config = _CONFIG
 
         # Check cache
         cached = ClimateRiskService._get_cached_risk(latitude, longitude, 'tornado')
@@ -772,83 +1642,38 @@ class ClimateRiskService:
             return cached
 
         try:
-            # Tornado Alley: Central plains (OK, KS, NE, TX panhandle, SD)
-            is_tornado_alley = 33 <= latitude <= 43 and -103 <= longitude <= -95
-
-            # Dixie Alley: Southeast (MS, AL, TN, AR)
-            is_dixie_alley = 31 <= latitude <= 37 and -95 <= longitude <= -84
-
-            # High frequency midwest
-            is_midwest_high = 36 <= latitude <= 43 and -95 <= longitude <= -84
-
-            # Moderate: Eastern US
-            is_eastern = -84 <= longitude <= -75 and 30 <= latitude <= 42
-
-            # Low: Western US, Northeast
-            is_western = longitude < -103
-            is_northeast = latitude > 42 and longitude > -80
-
-            # Calculate score
-            if is_tornado_alley:
-                risk_score = 85.0  # Very High - Tornado Alley
-                tornado_zone = 'Very High'
-                interpretation = 'Very High Risk - Tornado Alley (highest frequency in US)'
-            elif is_dixie_alley:
-                risk_score = 75.0  # High - Dixie Alley
-                tornado_zone = 'High'
-                interpretation = 'High Risk - Dixie Alley (frequent strong tornadoes)'
-            elif is_midwest_high:
-                risk_score = 60.0  # Moderate-High - Midwest
-                tornado_zone = 'Moderate-High'
-                interpretation = 'Moderate-High Risk - Midwest tornado activity'
-            elif is_eastern:
-                risk_score = 35.0  # Moderate - Eastern US
-                tornado_zone = 'Moderate'
-                interpretation = 'Moderate Risk - Occasional tornado activity'
-            elif is_western or is_northeast:
-                risk_score = 10.0  # Low - Western/Northeast
-                tornado_zone = 'Low'
-                interpretation = 'Low Risk - Rare tornado occurrence'
-            else:
-                risk_score = 20.0  # Low-Moderate - Other areas
-                tornado_zone = 'Low-Moderate'
-                interpretation = 'Low-Moderate Risk'
-
-            result = {
-                'score': round(risk_score, 1),
-                'tornado_zone': tornado_zone,
-                'interpretation': interpretation,
-                'data_source': 'Geographic tornado model (simplified)',
-                'details': {
-                    'latitude': latitude,
-                    'longitude': longitude,
-                    'note': 'Full implementation would use NOAA historical tornado data'
-                },
-                'cached': False
-            }
+            zone = ClimateRiskService._match_zone(
+                latitude, longitude, ClimateRiskService._TORNADO_ZONES, ClimateRiskService._TORNADO_GRID
+            )
+            result = ClimateRiskService._tornado_result(latitude, longitude, zone)
 
             # Cache it
             ClimateRiskService._store_in_cache(
                 latitude, longitude, 'tornado',
-                result['score'], result['details'],
-                'Geographic model', config['cache_ttl_days']['tornado']
+                result.score, result.details,
+                'Geographic model', config['cache_ttl_days']['tornado'], now
             )
 
             return result
 
         except Exception as e:
             logger.error(f"Tornado risk calculation error: {e}")
-            return {
-                'score': 20.0,
-                'tornado_zone': 'Unknown',
-                'interpretation': 'Unable to determine tornado risk',
-                'data_source': 'N/A',
-                'error': str(e),
-                'details': {}
-            }
+            return RiskResult(
+                score=20.0,
+                zone_key='tornado_zone',
+                zone='Unknown',
+                interpretation='Unable to determine tornado risk',
+                data_source='N/A',
+                error=str(e),
+                details={}
+            )
 
     @staticmethod
-    def calculate_extreme_heat_risk(latitude: float, longitude: float) -> Dict:
+    def calculate_extreme_heat_risk(
+        latitude: float,
+        longitude: float,
+        now: Optional[datetime] = None
+    ) -> RiskResult:
         """
         Calculate extreme heat risk based on geographic location and climate
 
@@ -864,7 +1689,7 @@ class ClimateRiskService:
                 'details': {...}
             }
         """
-        config = ClimateRiskService._load_config()
+        config = _CONFIG
 
         # Check cache
         cached = ClimateRiskService._get_cached_risk(latitude, longitude, 'extreme_heat')
@@ -872,88 +1697,38 @@ class ClimateRiskService:
             return cached
 
         try:
-            # Southwest desert regions (highest heat)
-            is_southwest_desert = 32 <= latitude <= 37 and -117 <= longitude <= -102
-
-            # Southern states (high heat)
-            is_deep_south = 28 <= latitude <= 35 and -107 <= longitude <= -80
-
-            # Central/Southern plains (moderate-high)
-            is_southern_plains = 30 <= latitude <= 37 and -103 <= longitude <= -93
-
-            # Mid-latitude (moderate)
-            is_mid_latitude = 37 <= latitude <= 42
-
-            # Northern states (low)
-            is_northern = latitude > 42
-
-            # Calculate score
-            if is_southwest_desert:
-                risk_score = 90.0  # Very High - Phoenix, Las Vegas, desert areas
-                heat_zone = 'Very High'
-                interpretation = 'Very High Risk - Desert climate, 30+ days >100°F annually'
-            elif is_deep_south:
-                risk_score = 70.0  # High - Deep South heat and humidity
-                heat_zone = 'High'
-                interpretation = 'High Risk - Hot, humid summers with frequent heat waves'
-            elif is_southern_plains:
-                risk_score = 60.0  # Moderate-High - Texas, Oklahoma heat
-                heat_zone = 'Moderate-High'
-                interpretation = 'Moderate-High Risk - Hot summers, 15-30 days >100°F'
-            elif is_mid_latitude:
-                risk_score = 35.0  # Moderate - Mid-latitude states
-                heat_zone = 'Moderate'
-                interpretation = 'Moderate Risk - Warm summers, occasional heat waves'
-            elif is_northern:
-                risk_score = 15.0  # Low - Northern states
-                heat_zone = 'Low'
-                interpretation = 'Low Risk - Cool to moderate summers'
-            else:
-                risk_score = 30.0  # Low-Moderate
-                heat_zone = 'Low-Moderate'
-                interpretation = 'Low-Moderate Risk'
-
-            # Coastal areas get slight reduction due to marine influence
-            if -125 <= longitude <= -115 and 32 <= latitude <= 42:
-                risk_score *= 0.8  # West coast marine influence
-            elif -80 <= longitude <= -70 and 38 <= latitude <= 45:
-                risk_score *= 0.9  # Northeast coast
-
-            result = {
-                'score': round(risk_score, 1),
-                'heat_zone': heat_zone,
-                'interpretation': interpretation,
-                'data_source': 'Geographic climate model (simplified)',
-                'details': {
-                    'latitude': latitude,
-                    'longitude': longitude,
-                    'note': 'Full implementation would use NOAA historical temperature data'
-                },
-                'cached': False
-            }
+            zone = ClimateRiskService._match_zone(
+                latitude, longitude, ClimateRiskService._HEAT_ZONES, ClimateRiskService._HEAT_GRID
+            )
+            result = ClimateRiskService._extreme_heat_result(latitude, longitude, zone)
 
             # Cache it (shorter TTL for seasonal data)
             ClimateRiskService._store_in_cache(
                 latitude, longitude, 'extreme_heat',
-                result['score'], result['details'],
-                'Geographic model', config['cache_ttl_days']['extreme_heat']
+                result.score, result.details,
+                'Geographic model', config['cache_ttl_days']['extreme_heat'], now
             )
 
             return result
 
         except Exception as e:
             logger.error(f"Extreme heat risk calculation error: {e}")
-            return {
-                'score': 25.0,
-                'heat_zone': 'Unknown',
-                'interpretation': 'Unable to determine extreme heat risk',
-                'data_source': 'N/A',
-                'error': str(e),
-                'details': {}
-            }
+            return RiskResult(
+                score=25.0,
+                zone_key='heat_zone',
+                zone='Unknown',
+                interpretation='Unable to determine extreme heat risk',
+                data_source='N/A',
+                error=str(e),
+                details={}
+            )
 
     @staticmethod
-    def calculate_sea_level_rise_risk(latitude: float, longitude: float) -> Dict:
+    def calculate_sea_level_rise_risk(
+        latitude: float,
+        longitude: float,
+        now: Optional[datetime] = None
+    ) -> RiskResult:
         """
         Calculate sea level rise risk based on coastal proximity and elevation
 
@@ -969,7 +1744,7 @@ class ClimateRiskService:
                 'details': {...}
             }
         """
-        config = ClimateRiskService._load_config()
+        config = _CONFIG
 
         # Check cache
         cached = ClimateRiskService._get_cached_risk(latitude, longitude, 'sea_level_rise')
@@ -977,99 +1752,42 @@ class ClimateRiskService:
             return cached
 
         try:
-            # Define major coastal zones
-            # Atlantic coast
-            atlantic_coast = [
-                (25.8, -80.2),  # Miami
-                (32.8, -79.9),  # Charleston
-                (36.9, -76.2),  # Norfolk
-                (40.7, -74.0),  # New York
-                (42.4, -71.1),  # Boston
-            ]
-
-            # Gulf coast
-            gulf_coast = [
-                (29.9, -90.1),  # New Orleans
-                (29.7, -95.4),  # Houston
-                (27.9, -82.5),  # Tampa
-            ]
-
-            # Pacific coast
-            pacific_coast = [
-                (32.7, -117.2),  # San Diego
-                (33.9, -118.2),  # Los Angeles
-                (37.8, -122.4),  # San Francisco
-                (47.6, -122.3),  # Seattle
-            ]
-
-            all_coastal = atlantic_coast + gulf_coast + pacific_coast
-
-            # Calculate minimum distance to coast
-            min_distance = float('inf')
-            for coast_lat, coast_lon in all_coastal:
-                distance = ClimateRiskService.calculate_distance_miles(
-                    latitude, longitude, coast_lat, coast_lon
-                )
-                min_distance = min(min_distance, distance)
-
-            # Calculate risk based on distance
-            if min_distance < 2:
-                risk_score = 95.0  # Very High - Direct coastal exposure
-                coastal_vulnerability = 'Very High'
-                interpretation = 'Very High Risk - Direct coastal exposure to sea level rise'
-            elif min_distance < 5:
-                risk_score = 75.0  # High - Near coastal
-                coastal_vulnerability = 'High'
-                interpretation = 'High Risk - Low-lying coastal area vulnerable to sea level rise'
-            elif min_distance < 10:
-                risk_score = 50.0  # Moderate - Coastal vicinity
-                coastal_vulnerability = 'Moderate'
-                interpretation = 'Moderate Risk - Within coastal zone, potential long-term impacts'
-            elif min_distance < 25:
-                risk_score = 20.0  # Low - Beyond immediate coastal zone
-                coastal_vulnerability = 'Low'
-                interpretation = 'Low Risk - Outside immediate sea level rise impact zone'
-            else:
-                risk_score = 0.0  # N/A - Not coastal
-                coastal_vulnerability = 'N/A'
-                interpretation = 'Not Applicable - Inland property not affected by sea level rise'
-
-            result = {
-                'score': round(risk_score, 1),
-                'coastal_vulnerability': coastal_vulnerability,
-                'distance_to_coast_miles': round(min_distance, 1),
-                'interpretation': interpretation,
-                'data_source': 'Geographic coastal model (simplified)',
-                'details': {
-                    'latitude': latitude,
-                    'longitude': longitude,
-                    'note': 'Full implementation would use NOAA Sea Level Rise elevation data'
-                },
-                'cached': False
-            }
+            # Calculate minimum distance to the Atlantic, Gulf and Pacific coasts
+            min_distance = ClimateRiskService._min_distance_miles(
+                latitude, longitude,
+                ClimateRiskService._SEA_LEVEL_COAST_LATS_RAD,
+                ClimateRiskService._SEA_LEVEL_COAST_LONS_RAD,
+                ClimateRiskService._SEA_LEVEL_COAST_TREE
+            )
+            result = ClimateRiskService._sea_level_rise_result(latitude, longitude, min_distance)
 
             # Cache it
             ClimateRiskService._store_in_cache(
                 latitude, longitude, 'sea_level_rise',
-                result['score'], result['details'],
-                'Geographic model', config['cache_ttl_days']['sea_level_rise']
+                result.score, result.details,
+                'Geographic model', config['cache_ttl_days']['sea_level_rise'], now
             )
 
             return result
 
         except Exception as e:
             logger.error(f"Sea level rise risk calculation error: {e}")
-            return {
-                'score': 0.0,
-                'coastal_vulnerability': 'Unknown',
-                'interpretation': 'Unable to determine sea level rise risk',
-                'data_source': 'N/A',
-                'error': str(e),
-                'details': {}
-            }
+            return RiskResult(
+                score=0.0,
+                zone_key='coastal_vulnerability',
+                zone='Unknown',
+                interpretation='Unable to determine sea level rise risk',
+                data_source='N/A',
+                error=str(e),
+                details={}
+            )
 
     @staticmethod
-    def calculate_drought_risk(latitude: float, longitude: float) -> Dict:
+    def calculate_drought_risk(
+        latitude: float,
+        longitude: float,
+        now: Optional[datetime] = None
+    ) -> RiskResult:
         """
         Calculate drought risk based on regional climate patterns
 
@@ -1085,7 +1803,7 @@ class ClimateRiskService:
                 'details': {...}
             }
         """
-        config = ClimateRiskService._load_config()
+        config = _CONFIG
 
         # Check cache (shortest TTL - drought changes frequently)
         cached = ClimateRiskService._get_cached_risk(latitude, longitude, 'drought')
@@ -1093,82 +1811,78 @@ class ClimateRiskService:
             return cached
 
         try:
-            # Southwest deserts (highest drought risk)
-            is_southwest_desert = 32 <= latitude <= 40 and -120 <= longitude <= -102
-
-            # California
-            is_california = 32 <= latitude <= 42 and -125 <= longitude <= -114
-
-            # Great Plains (moderate-high)
-            is_great_plains = 35 <= latitude <= 45 and -103 <= longitude <= -95
-
-            # Southeast (moderate - humid but can have droughts)
-            is_southeast = 30 <= latitude <= 37 and -95 <= longitude <= -75
-
-            # Pacific Northwest (low - high precipitation)
-            is_pacific_nw = 42 <= latitude <= 49 and -125 <= longitude <= -116
-
-            # Northeast (low - adequate precipitation)
-            is_northeast = 38 <= latitude <= 47 and -80 <= longitude <= -67
-
-            # Calculate score
-            if is_southwest_desert:
-                risk_score = 85.0  # Very High - Arid climate
-                drought_zone = 'Very High'
-                interpretation = 'Very High Risk - Arid climate, frequent severe droughts'
-            elif is_california:
-                risk_score = 70.0  # High - Mediterranean climate, water scarcity
-                drought_zone = 'High'
-                interpretation = 'High Risk - Mediterranean climate, recurring drought cycles'
-            elif is_great_plains:
-                risk_score = 55.0  # Moderate-High - Variable precipitation
-                drought_zone = 'Moderate-High'
-                interpretation = 'Moderate-High Risk - Variable precipitation, periodic droughts'
-            elif is_southeast:
-                risk_score = 35.0  # Moderate - Generally humid but can drought
-                drought_zone = 'Moderate'
-                interpretation = 'Moderate Risk - Generally humid, occasional drought conditions'
-            elif is_pacific_nw or is_northeast:
-                risk_score = 15.0  # Low - High precipitation
-                drought_zone = 'Low'
-                interpretation = 'Low Risk - High precipitation region, rare droughts'
-            else:
-                risk_score = 30.0  # Low-Moderate
-                drought_zone = 'Low-Moderate'
-                interpretation = 'Low-Moderate Risk'
-
-            result = {
-                'score': round(risk_score, 1),
-                'drought_zone': drought_zone,
-                'interpretation': interpretation,
-                'data_source': 'Geographic climate model (simplified)',
-                'details': {
-                    'latitude': latitude,
-                    'longitude': longitude,
-                    'note': 'Full implementation would use U.S. Drought Monitor real-time data'
-                },
-                'cached': False
-            }
+            zone = ClimateRiskService._match_zone(
+                latitude, longitude, ClimateRiskService._DROUGHT_ZONES, ClimateRiskService._DROUGHT_GRID
+            )
+            result = ClimateRiskService._drought_result(latitude, longitude, zone)
 
             # Cache it (shortest TTL - 7 days)
             ClimateRiskService._store_in_cache(
                 latitude, longitude, 'drought',
-                result['score'], result['details'],
-                'Geographic model', config['cache_ttl_days']['drought']
+                result.score, result.details,
+                'Geographic model', config['cache_ttl_days']['drought'], now
             )
 
             return result
 
         except Exception as e:
             logger.error(f"Drought risk calculation error: {e}")
-            return {
-                'score': 25.0,
-                'drought_zone': 'Unknown',
-                'interpretation': 'Unable to determine drought risk',
-                'data_source': 'N/A',
-                'error': str(e),
-                'details': {}
+            return RiskResult(
+                score=25.0,
+                zone_key='drought_zone',
+                zone='Unknown',
+                interpretation='Unable to determine drought risk',
+                data_source='N/A',
+                error=str(e),
+                details={}
+            )
+
+    @staticmethod
+    def score_property(latitude: float, longitude: float) -> Dict[str, RiskResult]:
+        """
+        Score all 8 hazards for one property
+
+        Flood blocks on the FEMA NFHL API, so it runs on the worker pool while
+        the other hazards are scored on the calling thread. Those are computed
+        locally and read the cache through a single prefetched query, so
+        handing them to threads would only add handoff overhead.
+
+        Args:
+            latitude: Property latitude
+            longitude: Property longitude
+
+        Returns:
+            Dict of hazard name -> RiskResult, flood first
+        """
+        # One timestamp for every hazard's cache entry
+        now = _utcnow()
+
+        flood_future = ClimateRiskService._submit(
+            ClimateRiskService.calculate_flood_risk, latitude, longitude, now
+        )
+
+        # One cache query (and one commit) for all locally computed hazards
+        ClimateRiskService.prefetch_cache(latitude, longitude, [
+            'wildfire', 'hurricane', 'earthquake', 'tornado',
+            'extreme_heat', 'sea_level_rise', 'drought'
+        ])
+
+        try:
+            local_hazards = {
+                'wildfire': ClimateRiskService.calculate_wildfire_risk(latitude, longitude, now),
+                'hurricane': ClimateRiskService.calculate_hurricane_risk(latitude, longitude, now),
+                'earthquake': ClimateRiskService.calculate_earthquake_risk(latitude, longitude, now),
+                'tornado': ClimateRiskService.calculate_tornado_risk(latitude, longitude, now),
+                'extreme_heat': ClimateRiskService.calculate_extreme_heat_risk(latitude, longitude, now),
+                'sea_level_rise': ClimateRiskService.calculate_sea_level_rise_risk(latitude, longitude, now),
+                'drought': ClimateRiskService.calculate_drought_risk(latitude, longitude, now)
             }
+        finally:
+            ClimateRiskService._end_prefetch()
+
+        hazards = {'flood': flood_future.result()}
+        hazards.update(local_hazards)
+        return hazards
 
     @staticmethod
     def calculate_composite_climate_risk(
@@ -1208,81 +1922,222 @@ class ClimateRiskService:
                 'phase': 'MVP (3 hazards)'
             }
         """
-        config = ClimateRiskService._load_config()
-        hazard_weights = config.get('hazard_weights', {})
-
         hazards = {}
 
         try:
             # Phase 2: Calculate all 8 hazards
             logger.info(f"Calculating climate risk for ({latitude}, {longitude})")
 
-            hazards['flood'] = ClimateRiskService.calculate_flood_risk(latitude, longitude)
-            hazards['wildfire'] = ClimateRiskService.calculate_wildfire_risk(latitude, longitude)
-            hazards['hurricane'] = ClimateRiskService.calculate_hurricane_risk(latitude, longitude)
-            hazards['earthquake'] = ClimateRiskService.calculate_earthquake_risk(latitude, longitude)
-            hazards['tornado'] = ClimateRiskService.calculate_tornado_risk(latitude, longitude)
-            hazards['extreme_heat'] = ClimateRiskService.calculate_extreme_heat_risk(latitude, longitude)
-            hazards['sea_level_rise'] = ClimateRiskService.calculate_sea_level_rise_risk(latitude, longitude)
-            hazards['drought'] = ClimateRiskService.calculate_drought_risk(latitude, longitude)
-
-            # Calculate weighted composite score using all 8 hazards
-            composite_score = sum(
-                hazards[hazard]['score'] * hazard_weights[hazard]
-                for hazard in hazards
-                if 'score' in hazards[hazard]
-            )
+            hazards = ClimateRiskService.score_property(latitude, longitude)
+            return ClimateRiskService._composite_result(latitude, longitude, hazards)
 
-            # Determine risk level
-            if composite_score < 25:
-                risk_level = 'Low'
-            elif composite_score < 50:
-                risk_level = 'Medium'
-            elif composite_score < 75:
-                risk_level = 'High'
-            else:
-                risk_level = 'Very High'
+        except Exception as e:
+            logger.error(f"Composite climate risk calculation error: {e}")
+            return ClimateRiskService._composite_error(latitude, longitude, hazards, e)
+
+    @classmethod
+    def calculate_composite_climate_risk_batch(cls, lats, lons) -> List[Dict]:
+        """
+        Calculate composite climate risk for many properties at once
 
-            # Identify top 3 hazards
-            hazard_labels = config.get('hazard_labels', {})
-            top_hazards = sorted(
-                [{'hazard': k, 'score': v['score'], 'label': hazard_labels.get(k, k.title())}
-                 for k, v in hazards.items() if 'score' in v],
-                key=lambda x: x['score'],
-                reverse=True
-            )[:3]
+        The locally computed hazards are classified for the whole batch with
+        vectorized zone and coast-distance lookups instead of once per
+        property, and the weighted composite and top hazards are computed as
+        array operations over an (N, 8) score matrix. Cached flood results
+        are read with one bulk query; only the misses query FEMA, per
+        property on the worker pool. Local hazards are not read from or
+        written to the hazard cache, since recomputing them in bulk is
+        cheaper than the lookups.
 
-            # Generate interpretation
-            if top_hazards:
-                primary_hazard = top_hazards[0]
-                interpretation = f"{risk_level} climate risk primarily driven by {primary_hazard['label'].lower()} exposure"
+        Args:
+            lats: Sequence or array of property latitudes
+            lons: Sequence or array of property longitudes, same length
+
+        Returns:
+            List of composite responses (see calculate_composite_climate_risk),
+            in input order
+        """
+        lats = np.asarray(lats, dtype=float)
+        lons = np.asarray(lons, dtype=float)
+        if lats.shape != lons.shape or lats.ndim != 1:
+            raise ValueError('lats and lons must be 1-D arrays of the same length')
+
+        points = list(zip(lats.tolist(), lons.tolist()))
+        now = _utcnow()
+
+        # One query for every flood result already in the database cache
+        flood_keys = [(round(lat, 4), round(lon, 4)) for lat, lon in points]
+        flood_entries = {}
+        if has_app_context():
+            try:
+                flood_entries = ClimateRiskCache.find_many(flood_keys, 'flood')
+            except Exception as e:
+                logger.error(f"Cache retrieval error: {e}")
+
+        floods = []
+        for (lat, lon), key in zip(points, flood_keys):
+            entry = flood_entries.get(key)
+            if entry is not None:
+                floods.append(cls._cache_entry_result('flood', key[0], key[1], entry))
             else:
-                interpretation = f"{risk_level} climate risk"
+                floods.append(cls._submit(cls.calculate_flood_risk, lat, lon, now))
 
-            return {
-                'climate_risk_score': round(composite_score, 1),
-                'climate_risk_level': risk_level,
-                'latitude': latitude,
-                'longitude': longitude,
-                'hazards': hazards,
-                'top_hazards': top_hazards,
-                'interpretation': interpretation,
-                'calculated_at': datetime.utcnow().isoformat(),
-                'phase': 'Phase 2 (8 hazards)',
-                'note': 'Comprehensive assessment includes all 8 climate hazards'
-            }
+        zone_hazards = (
+            ('wildfire', cls._WILDFIRE_ZONES, cls._wildfire_result),
+            ('earthquake', cls._EARTHQUAKE_ZONES, cls._earthquake_result),
+            ('tornado', cls._TORNADO_ZONES, cls._tornado_result),
+            ('drought', cls._DROUGHT_ZONES, cls._drought_result),
+        )
+        zone_indexes = [cls._classify_batch(lats, lons, zones).tolist() for _, zones, _ in zone_hazards]
+        heat_indexes = cls._classify_batch(lats, lons, cls._HEAT_ZONES).tolist()
+        heat_factors = cls._heat_marine_factor_batch(lats, lons).tolist()
+
+        hurricane_distances = cls._min_distance_miles_batch(
+            lats, lons, cls._HURRICANE_COAST_LATS_RAD, cls._HURRICANE_COAST_LONS_RAD, cls._HURRICANE_COAST_TREE
+        ).tolist()
+        sea_level_distances = cls._min_distance_miles_batch(
+            lats, lons, cls._SEA_LEVEL_COAST_LATS_RAD, cls._SEA_LEVEL_COAST_LONS_RAD, cls._SEA_LEVEL_COAST_TREE
+        ).tolist()
+
+        results = [None] * len(points)
+        scored = []
+        for n, (lat, lon) in enumerate(points):
+            hazards = {}
+            try:
+                flood = floods[n]
+                hazards['flood'] = flood.result() if isinstance(flood, Future) else flood
+                for (hazard, zones, build), indexes in zip(zone_hazards, zone_indexes):
+                    index = indexes[n]
+                    hazards[hazard] = build(lat, lon, zones[index] if index >= 0 else None)
+                index = heat_indexes[n]
+                hazards['extreme_heat'] = cls._extreme_heat_result(
+                    lat, lon, cls._HEAT_ZONES[index] if index >= 0 else None, heat_factors[n]
+                )
+                hazards['hurricane'] = cls._hurricane_result(lat, lon, hurricane_distances[n])
+                hazards['sea_level_rise'] = cls._sea_level_rise_result(lat, lon, sea_level_distances[n])
+                scored.append((n, {h: hazards[h] for h in cls.HAZARD_TYPES}))
+            except Exception as e:
+                logger.error(f"Composite climate risk calculation error: {e}")
+                results[n] = cls._composite_error(lat, lon, hazards, e)
+
+        if scored:
+            try:
+                hazard_weights = _CONFIG.get('hazard_weights', {})
+                weights = np.array([hazard_weights[h] for h in cls.HAZARD_TYPES])
+                scores = np.array([[hazards[h].score for h in cls.HAZARD_TYPES] for _, hazards in scored])
+
+                # Accumulate column by column in hazard order rather than
+                # scores @ weights: a BLAS dot product sums in a different
+                # order, which changes round(composite, 1) at .x5 boundaries
+                composite = np.zeros(len(scored))
+                for j, weight in enumerate(weights):
+                    composite += scores[:, j] * weight
+                composite = composite.tolist()
+                # Stable sort on descending score keeps ties in hazard order, like sorted()
+                top = np.argsort(-scores, axis=1, kind='stable')[:, :3].tolist()
+
+                for (n, hazards), composite_score, order in zip(scored, composite, top):
+                    results[n] = cls._composite_response(
+                        points[n][0], points[n][1], hazards, composite_score,
+                        [cls.HAZARD_TYPES[i] for i in order]
+                    )
+            except Exception as e:
+                logger.error(f"Composite climate risk calculation error: {e}")
+                for n, hazards in scored:
+                    results[n] = cls._composite_error(points[n][0], points[n][1], hazards, e)
+
+        return results
 
-        except Exception as e:
-            logger.error(f"Composite climate risk calculation error: {e}")
-            return {
-                'climate_risk_score': 25.0,
-                'climate_risk_level': 'Unknown',
-                'latitude': latitude,
-                'longitude': longitude,
-                'hazards': hazards,
-                'top_hazards': [],
-                'interpretation': 'Unable to calculate climate risk',
-                'error': str(e),
-                'calculated_at': datetime.utcnow().isoformat(),
-                'phase': 'Phase 2 (8 hazards)'
-            }
+    @staticmethod
+    def _composite_result(latitude: float, longitude: float, hazards: Dict[str, RiskResult]) -> Dict:
+        """
+        Combine per-hazard results into the composite climate risk response
+
+        Args:
+            latitude: Property latitude
+            longitude: Property longitude
+            hazards: Dict of hazard name -> RiskResult for all 8 hazards
+
+        Returns:
+            Composite response as documented on calculate_composite_climate_risk()
+        """
+        # Calculate weighted composite score using all 8 hazards
+        composite_score = ClimateRiskService._composite_score(hazards)
+
+        # Identify top 3 hazards
+        top_hazards = sorted(hazards, key=lambda h: hazards[h].score, reverse=True)[:3]
+
+        return ClimateRiskService._composite_response(latitude, longitude, hazards, composite_score, top_hazards)
+
+    @staticmethod
+    def _composite_response(
+        latitude: float,
+        longitude: float,
+        hazards: Dict[str, RiskResult],
+        composite_score: float,
+        top_hazards: List[str]
+    ) -> Dict:
+        """
+        Build the composite climate risk response from an already weighted score
+
+        Args:
+            latitude: Property latitude
+            longitude: Property longitude
+            hazards: Dict of hazard name -> RiskResult for all 8 hazards
+            composite_score: Weighted composite score (0-100)
+            top_hazards: Names of the (up to) 3 highest scoring hazards, highest first
+
+        Returns:
+            Composite response as documented on calculate_composite_climate_risk()
+        """
+        # Determine risk level
+        if composite_score < 25:
+            risk_level = 'Low'
+        elif composite_score < 50:
+            risk_level = 'Medium'
+        elif composite_score < 75:
+            risk_level = 'High'
+        else:
+            risk_level = 'Very High'
+
+        hazard_labels = ClimateRiskService._hazard_labels
+        top_hazards = [
+            {'hazard': k, 'score': hazards[k].score, 'label': hazard_labels[k]}
+            for k in top_hazards
+        ]
+
+        # Generate interpretation
+        if top_hazards:
+            primary_hazard = top_hazards[0]
+            interpretation = f"{risk_level} climate risk primarily driven by {primary_hazard['label'].lower()} exposure"
+        else:
+            interpretation = f"{risk_level} climate risk"
+
+        return {
+            'climate_risk_score': round(composite_score, 1),
+            'climate_risk_level': risk_level,
+            'latitude': latitude,
+            'longitude': longitude,
+            'hazards': {k: v.to_dict() for k, v in hazards.items()},
+            'top_hazards': top_hazards,
+            'interpretation': interpretation,
+            'calculated_at': _utcnow_iso(),
+            'phase': 'Phase 2 (8 hazards)',
+            'note': 'Comprehensive assessment includes all 8 climate hazards'
+        }
+
+    @staticmethod
+    def _composite_error(latitude: float, longitude: float, hazards: Dict[str, RiskResult], error: Exception) -> Dict:
+        """Composite response for a property whose scoring failed"""
+        return {
+            'climate_risk_score': 25.0,
+            'climate_risk_level': 'Unknown',
+            'latitude': latitude,
+            'longitude': longitude,
+            'hazards': {k: v.to_dict() for k, v in hazards.items()},
+            'top_hazards': [],
+            'interpretation': 'Unable to calculate climate risk',
+            'error': str(error),
+            'calculated_at': _utcnow_iso(),
+            'phase': 'Phase 2 (8 hazards)'
+        }
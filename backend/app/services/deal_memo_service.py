@@ -12,8 +12,14 @@ Combines all assessment services:
 - Arbitrage opportunity
 """
 
-from typing import Dict, Optional
-from datetime import datetime
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
+from datetime import datetime, timedelta
+from flask import current_app, has_app_context
+from sqlalchemy import select
 from app.database import db, DealModel
 from app.services.hedonic_model_service import HedonicModelService
 from app.services.rent_tier_service import RentTierService
@@ -29,11 +35,136 @@ class DealMemoService:
     Service for generating comprehensive deal analysis memos
     """
 
+    # Worker pool for comparison memos; each memo is independent and spends
+    # most of its time in benchmark queries. Sized for the 5-deal maximum.
+    _executor = ThreadPoolExecutor(max_workers=5, thread_name_prefix='deal-memo')
+
+    @classmethod
+    def _submit(cls, fn, *args):
+        """
+        Run fn(*args) on the worker pool, inside the caller's app context
+
+        Each worker gets its own app context and therefore its own database
+        session, removed when the context ends.
+
+        Args:
+            fn: Function to run
+            *args: Positional arguments for fn
+
+        Returns:
+            concurrent.futures.Future for the result
+        """
+        if not has_app_context():
+            return cls._executor.submit(fn, *args)
+
+        app = current_app._get_current_object()
+
+        def run():
+            with app.app_context():
+                return fn(*args)
+
+        return cls._executor.submit(run)
+
+    # Memo sections in output order, each mapped to the sections its
+    # computation reads from
+    MEMO_SECTIONS = (
+        'property_summary',
+        'rent_prediction',
+        'tier_classification',
+        'yield_analysis',
+        'appreciation_projection',
+        'total_return',
+        'risk_assessment',
+        'arbitrage_opportunity',
+        'investment_recommendation',
+        'sensitivity_analysis',
+        'executive_summary',
+    )
+    _SECTION_DEPENDENCIES = {
+        'property_summary': (),
+        'rent_prediction': (),
+        'tier_classification': ('rent_prediction',),
+        'yield_analysis': ('tier_classification',),
+        'appreciation_projection': ('tier_classification',),
+        'total_return': ('yield_analysis', 'appreciation_projection'),
+        'risk_assessment': ('tier_classification',),
+        'arbitrage_opportunity': ('tier_classification',),
+        'investment_recommendation': (
+            'tier_classification', 'total_return', 'risk_assessment', 'arbitrage_opportunity'
+        ),
+        'sensitivity_analysis': ('yield_analysis', 'appreciation_projection'),
+        'executive_summary': ('property_summary', 'investment_recommendation'),
+    }
+
+    @classmethod
+    def _resolve_sections(cls, sections: Optional[FrozenSet[str]]) -> FrozenSet[str]:
+        """
+        Expand requested sections with everything they depend on
+
+        Args:
+            sections: Requested section names, or None for the full memo
+
+        Returns:
+            Set of sections that must be computed
+        """
+        if sections is None:
+            return frozenset(cls.MEMO_SECTIONS)
+
+        needed = set()
+        pending = list(sections)
+        while pending:
+            name = pending.pop()
+            if name not in needed:
+                needed.add(name)
+                pending.extend(cls._SECTION_DEPENDENCIES[name])
+        return frozenset(needed)
+
+    # Process-local LRU of generated memos, keyed by
+    # (deal_id, holding_period, geography, deal.updated_at, sections) -> (expires_at, memo).
+    # Editing a deal bumps updated_at, so stale memos are never looked up again;
+    # the TTL bounds staleness from benchmark data changes.
+    _memo_cache: 'OrderedDict[Tuple, Tuple[datetime, Dict]]' = OrderedDict()
+    _memo_cache_lock = threading.Lock()
+    MEMO_CACHE_MAXSIZE = 512
+    MEMO_CACHE_TTL = timedelta(hours=1)
+
+    @classmethod
+    def _memo_cache_get(cls, key: Tuple) -> Optional[Dict]:
+        """Return an unexpired cached memo, or None"""
+        with cls._memo_cache_lock:
+            entry = cls._memo_cache.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= datetime.utcnow():
+                del cls._memo_cache[key]
+                return None
+            cls._memo_cache.move_to_end(key)
+            return dict(entry[1])
+
+    @classmethod
+    def _memo_cache_put(cls, key: Tuple, memo: Dict):
+        """Store a memo, evicting the least recently used entry"""
+        with cls._memo_cache_lock:
+            cls._memo_cache[key] = (datetime.utcnow() + cls.MEMO_CACHE_TTL, memo)
+            cls._memo_cache.move_to_end(key)
+            if len(cls._memo_cache) > cls.MEMO_CACHE_MAXSIZE:
+                cls._memo_cache.popitem(last=False)
+
+    @classmethod
+    def clear_memo_cache(cls):
+        """Drop every cached memo, e.g. after reseeding benchmark data"""
+        with cls._memo_cache_lock:
+            cls._memo_cache.clear()
+
     @staticmethod
     def generate_memo(
         deal_id: int,
         holding_period: int = 10,
-        geography: str = 'US'
+        geography: str = 'US',
+        deal: Optional[DealModel] = None,
+        now_year: Optional[int] = None,
+        generated_at: Optional[datetime] = None,
+        sections: Optional[Iterable[str]] = None
     ) -> Dict:
         """
         Generate complete investment analysis memo
@@ -42,279 +173,397 @@ class DealMemoService:
             deal_id: Deal to analyze
             holding_period: Investment horizon in years
             geography: Geographic market
+            deal: Already loaded DealModel, or a row of its columns, for
+                deal_id (fetched when omitted)
+            now_year: Current calendar year for property age (defaults to now)
+            generated_at: UTC generation timestamp (defaults to now); batch
+                callers pass one value for every memo they generate
+            sections: Names from MEMO_SECTIONS to include (default: all).
+                Only these sections and the ones they build on are computed.
 
         Returns:
             Comprehensive analysis dictionary with all components
+
+        Raises:
+            ValueError: Deal not found or unknown section name
         """
+        if sections is not None:
+            sections = frozenset(sections)
+            unknown = sections.difference(DealMemoService.MEMO_SECTIONS)
+            if unknown:
+                raise ValueError(f"Unknown memo sections: {sorted(unknown)}")
 
         # Fetch deal
-        deal = DealModel.query.get(deal_id)
+        if deal is None:
+            deal = DealModel.query.get(deal_id)
         if not deal:
             raise ValueError(f"Deal {deal_id} not found")
 
-        memo = {
-            'deal_id': deal_id,
-            'generated_at': datetime.utcnow().isoformat(),
-            'holding_period': holding_period,
-            'property_summary': {},
-            'rent_prediction': {},
-            'tier_classification': {},
-            'yield_analysis': {},
-            'appreciation_projection': {},
-            'total_return': {},
-            'risk_assessment': {},
-            'arbitrage_opportunity': {},
-            'investment_recommendation': {},
-            'sensitivity_analysis': {},
-            'executive_summary': {}
-        }
+        cache_key = (deal_id, holding_period, geography, deal.updated_at, sections)
+        memo = DealMemoService._memo_cache_get(cache_key)
+        if memo is None:
+            memo = DealMemoService._build_memo(
+                deal_id, deal, holding_period, geography,
+                now_year or datetime.now().year, generated_at or datetime.utcnow(),
+                sections
+            )
+            DealMemoService._memo_cache_put(cache_key, memo)
+            memo = dict(memo)
+        return memo
 
-        # SECTION 1: Property Summary
-        property_age = None
-        year_built = getattr(deal, 'construction_year', None) or deal.year_built
-        if year_built:
-            property_age = datetime.now().year - year_built
+    @staticmethod
+    def _build_memo(
+        deal_id: int,
+        deal: DealModel,
+        holding_period: int,
+        geography: str,
+        now_year: int,
+        generated_at: datetime,
+        sections: Optional[FrozenSet[str]] = None
+    ) -> Dict:
+        """
+        Compute the memo sections for a loaded deal (uncached)
 
-        memo['property_summary'] = {
-            'address': getattr(deal, 'street_address', None) or deal.property_address or 'N/A',
-            'purchase_price': deal.purchase_price,
-            'bedrooms': deal.bedrooms,
-            'bathrooms': deal.bathrooms,
-            'square_footage': deal.square_footage,
-            'year_built': year_built,
-            'property_age': property_age,
-            'property_condition': getattr(deal, 'property_condition', None),
-            'number_of_units': getattr(deal, 'number_of_units', None) or 1,
-            'property_type': deal.property_type
-        }
+        Args:
+            deal_id: Deal ID as requested
+            deal: Deal to analyze
+            holding_period: Investment horizon in years
+            geography: Geographic market
+            now_year: Current calendar year
+            generated_at: UTC generation timestamp
+            sections: Sections to include, or None for all
+
+        Returns:
+            Comprehensive analysis dictionary with all components
+        """
+        # Deal-derived inputs shared by every section
+        ctx = DealMemoService._build_context(deal, now_year)
+        property_value = ctx['property_value']
+        cost_of_debt = ctx['cost_of_debt']
+        ltv = ctx['ltv']
+
+        # Sections to compute: the requested ones plus everything they build on
+        needed = DealMemoService._resolve_sections(sections)
+        computed = {}
+
+        # SECTION 1: Property Summary
+        if 'property_summary' in needed:
+            computed['property_summary'] = {
+                'address': ctx['address'],
+                'purchase_price': deal.purchase_price,
+                'bedrooms': deal.bedrooms,
+                'bathrooms': deal.bathrooms,
+                'square_footage': deal.square_footage,
+                'year_built': ctx['year_built'],
+                'property_age': ctx['property_age'],
+                'property_condition': ctx['property_condition'],
+                'number_of_units': ctx['num_units'],
+                'property_type': deal.property_type
+            }
 
         # SECTION 2: Rent Prediction (Hedonic Model)
-        try:
+        if 'rent_prediction' in needed:
             property_data = {
                 'square_footage': deal.square_footage,
                 'bedrooms': deal.bedrooms,
                 'bathrooms': deal.bathrooms,
-                'year_built': year_built,
+                'year_built': ctx['year_built'],
                 'property_type': deal.property_type,
                 'epc_score': getattr(deal, 'epc_score', None)
             }
 
-            rent_prediction = HedonicModelService.predict_fundamental_rent(property_data)
-            memo['rent_prediction'] = rent_prediction
-
-            predicted_rent = rent_prediction['predicted_rent']
-        except Exception as e:
-            # Fallback to observed rent if hedonic model fails
-            predicted_rent = deal.monthly_rent or 1000
-            memo['rent_prediction'] = {
-                'predicted_rent': predicted_rent,
-                'error': str(e),
-                'fallback_method': 'observed_rent'
-            }
+            try:
+                rent_prediction = HedonicModelService.predict_fundamental_rent(property_data)
+                computed['rent_prediction'] = rent_prediction
+
+                predicted_rent = rent_prediction['predicted_rent']
+            except (ValueError, KeyError, TypeError, AttributeError, ArithmeticError, OSError) as e:
+                # Fallback to observed rent if the hedonic model cannot score the
+                # deal (missing fields, unusable values or no coefficients file)
+                predicted_rent = deal.monthly_rent or 1000
+                computed['rent_prediction'] = {
+                    'predicted_rent': predicted_rent,
+                    'error': str(e),
+                    'fallback_method': 'observed_rent'
+                }
 
         # SECTION 3: Rent Tier Classification
-        classification = RentTierService.classify_property(
-            predicted_rent=predicted_rent,
-            geography='national',
-            bedrooms=deal.bedrooms
-        )
-        memo['tier_classification'] = classification
+        if 'tier_classification' in needed:
+            classification = RentTierService.classify_property(
+                predicted_rent=predicted_rent,
+                geography='national',
+                bedrooms=deal.bedrooms
+            )
+            computed['tier_classification'] = classification
 
-        rent_decile = classification['national_decile']
+            rent_decile = classification['national_decile']
 
         # SECTION 4: Yield Analysis
-        annual_rent = predicted_rent * 12
-        property_value = deal.purchase_price or 200000
+        if 'yield_analysis' in needed:
+            annual_rent = predicted_rent * 12
 
-        gross_yield = YieldCalculationService.calculate_gross_yield(
-            annual_rent=annual_rent,
-            property_value=property_value
-        )
+            gross_yield = YieldCalculationService.calculate_gross_yield(
+                annual_rent=annual_rent,
+                property_value=property_value
+            )
 
-        cost_components = YieldCalculationService.calculate_cost_components(
-            rent_decile=rent_decile,
-            num_units=getattr(deal, 'number_of_units', None) or 1,
-            property_value=property_value,
-            annual_rent=annual_rent
-        )
+            cost_components = YieldCalculationService.calculate_cost_components(
+                rent_decile=rent_decile,
+                num_units=ctx['num_units'],
+                property_value=property_value,
+                annual_rent=annual_rent
+            )
 
-        net_yield = YieldCalculationService.calculate_net_yield(
-            gross_yield=gross_yield,
-            cost_components=cost_components
-        )
+            net_yield = YieldCalculationService.calculate_net_yield(
+                gross_yield=gross_yield,
+                cost_components=cost_components
+            )
 
-        yield_benchmark = YieldCalculationService.compare_to_benchmark(
-            calculated_net_yield=net_yield,
-            rent_decile=rent_decile,
-            geography=geography
-        )
+            yield_benchmark = YieldCalculationService.compare_to_benchmark(
+                calculated_net_yield=net_yield,
+                rent_decile=rent_decile,
+                geography=geography
+            )
 
-        memo['yield_analysis'] = {
-            'annual_rent': annual_rent,
-            'property_value': property_value,
-            'gross_yield': gross_yield,
-            'cost_components': cost_components,
-            'net_yield': net_yield,
-            'benchmark_comparison': yield_benchmark
-        }
+            computed['yield_analysis'] = {
+                'annual_rent': annual_rent,
+                'property_value': property_value,
+                'gross_yield': gross_yield,
+                'cost_components': cost_components,
+                'net_yield': net_yield,
+                'benchmark_comparison': yield_benchmark
+            }
 
         # SECTION 5: Capital Appreciation Projection
-        appreciation = CapitalAppreciationService.project_future_value(
-            current_value=property_value,
-            rent_decile=rent_decile,
-            years=holding_period,
-            geography=geography
-        )
+        if 'appreciation_projection' in needed:
+            appreciation = CapitalAppreciationService.project_future_value(
+                current_value=property_value,
+                rent_decile=rent_decile,
+                years=holding_period,
+                geography=geography
+            )
 
-        memo['appreciation_projection'] = appreciation
+            computed['appreciation_projection'] = appreciation
 
         # SECTION 6: Total Return Calculation
-        total_return_unlevered = TotalReturnService.calculate_unlevered_return(
-            net_yield=net_yield,
-            capital_gain_yield=appreciation['annualized_appreciation_rate']
-        )
-
-        # Get financing terms
-        cost_of_debt = deal.loan_interest_rate or 6.5
-        down_payment_pct = deal.down_payment_percent or 25.0
-        ltv = 1.0 - (down_payment_pct / 100)
+        if 'total_return' in needed:
+            total_return_unlevered = TotalReturnService.calculate_unlevered_return(
+                net_yield=net_yield,
+                capital_gain_yield=appreciation['annualized_appreciation_rate']
+            )
 
-        total_return_levered = TotalReturnService.calculate_levered_return(
-            unlevered_return=total_return_unlevered,
-            cost_of_debt=cost_of_debt,
-            ltv=ltv
-        )
+            total_return_levered = TotalReturnService.calculate_levered_return(
+                unlevered_return=total_return_unlevered,
+                cost_of_debt=cost_of_debt,
+                ltv=ltv
+            )
 
-        return_benchmark = TotalReturnService.compare_to_benchmark(
-            total_return_unlevered=total_return_unlevered,
-            rent_decile=rent_decile,
-            geography=geography
-        )
+            return_benchmark = TotalReturnService.compare_to_benchmark(
+                total_return_unlevered=total_return_unlevered,
+                rent_decile=rent_decile,
+                geography=geography
+            )
 
-        memo['total_return'] = {
-            'net_yield': net_yield,
-            'capital_gain_yield': appreciation['annualized_appreciation_rate'],
-            'total_return_unlevered': total_return_unlevered,
-            'cost_of_debt': cost_of_debt,
-            'ltv': round(ltv, 3),
-            'total_return_levered': total_return_levered,
-            'leverage_effect': round(total_return_levered - total_return_unlevered, 2),
-            'benchmark_comparison': return_benchmark
-        }
+            computed['total_return'] = {
+                'net_yield': net_yield,
+                'capital_gain_yield': appreciation['annualized_appreciation_rate'],
+                'total_return_unlevered': total_return_unlevered,
+                'cost_of_debt': cost_of_debt,
+                'ltv': round(ltv, 3),
+                'total_return_levered': total_return_levered,
+                'leverage_effect': round(total_return_levered - total_return_unlevered, 2),
+                'benchmark_comparison': return_benchmark
+            }
 
         # SECTION 7: Risk Assessment
-        # Extract state from address (simplified)
-        state = 'CA'  # Default, should be extracted from address in production
-
-        systematic_risk = RiskAssessmentService.calculate_systematic_risk(
-            rent_decile=rent_decile,
-            geography=geography
-        )
-
-        regulatory_risk = RiskAssessmentService.calculate_regulatory_risk(
-            state=state,
-            city=None,
-            rent_level=predicted_rent,
-            ami_percentage=None
-        )
+        if 'risk_assessment' in needed:
+            systematic_risk = RiskAssessmentService.calculate_systematic_risk(
+                rent_decile=rent_decile,
+                geography=geography
+            )
 
-        idiosyncratic_risk = RiskAssessmentService.calculate_idiosyncratic_risk(
-            property_age=property_age,
-            property_condition=getattr(deal, 'property_condition', None),
-            num_units=getattr(deal, 'number_of_units', None) or 1,
-            concentration_risk=None,
-            occupancy_rate=None
-        )
+            regulatory_risk = RiskAssessmentService.calculate_regulatory_risk(
+                state=ctx['state'],
+                city=None,
+                rent_level=predicted_rent,
+                ami_percentage=None
+            )
 
-        composite_risk = RiskAssessmentService.calculate_composite_risk(
-            systematic_risk=systematic_risk,
-            regulatory_risk=regulatory_risk,
-            idiosyncratic_risk=idiosyncratic_risk,
-            rent_decile=rent_decile
-        )
+            idiosyncratic_risk = RiskAssessmentService.calculate_idiosyncratic_risk(
+                property_age=ctx['property_age'],
+                property_condition=ctx['property_condition'],
+                num_units=ctx['num_units'],
+                concentration_risk=None,
+                occupancy_rate=None
+            )
 
-        memo['risk_assessment'] = {
-            'systematic_risk': systematic_risk,
-            'regulatory_risk': regulatory_risk,
-            'idiosyncratic_risk': idiosyncratic_risk,
-            'composite_risk': composite_risk,
-            'key_risks': RiskAssessmentService._identify_key_risks(
-                systematic_risk, regulatory_risk, idiosyncratic_risk
-            ),
-            'risk_mitigations': RiskAssessmentService._suggest_mitigations(
-                systematic_risk, regulatory_risk, idiosyncratic_risk, rent_decile
+            composite_risk = RiskAssessmentService.calculate_composite_risk(
+                systematic_risk=systematic_risk,
+                regulatory_risk=regulatory_risk,
+                idiosyncratic_risk=idiosyncratic_risk,
+                rent_decile=rent_decile
             )
-        }
+
+            computed['risk_assessment'] = {
+                'systematic_risk': systematic_risk,
+                'regulatory_risk': regulatory_risk,
+                'idiosyncratic_risk': idiosyncratic_risk,
+                'composite_risk': composite_risk,
+                'key_risks': RiskAssessmentService._identify_key_risks(
+                    systematic_risk, regulatory_risk, idiosyncratic_risk
+                ),
+                'risk_mitigations': RiskAssessmentService._suggest_mitigations(
+                    systematic_risk, regulatory_risk, idiosyncratic_risk, rent_decile
+                )
+            }
 
         # SECTION 8: Arbitrage Opportunity
-        renter_constraints = ArbitrageLimitsService.assess_renter_constraints(
-            monthly_rent=predicted_rent,
-            median_income=None,
-            home_price_to_rent_ratio=None,
-            rent_decile=rent_decile
-        )
+        if 'arbitrage_opportunity' in needed:
+            renter_constraints = ArbitrageLimitsService.assess_renter_constraints(
+                monthly_rent=predicted_rent,
+                median_income=None,
+                home_price_to_rent_ratio=None,
+                rent_decile=rent_decile
+            )
 
-        institutional_constraints = ArbitrageLimitsService.assess_institutional_constraints(
-            rent_decile=rent_decile,
-            property_value=property_value,
-            num_units=getattr(deal, 'number_of_units', None) or 1,
-            liquidity_score=None
-        )
+            institutional_constraints = ArbitrageLimitsService.assess_institutional_constraints(
+                rent_decile=rent_decile,
+                property_value=property_value,
+                num_units=ctx['num_units'],
+                liquidity_score=None
+            )
 
-        medium_landlord_fit = ArbitrageLimitsService.assess_medium_landlord_constraints(
-            rent_decile=rent_decile,
-            num_units=getattr(deal, 'number_of_units', None) or 1,
-            property_value=property_value,
-            geographic_concentration=None
-        )
+            medium_landlord_fit = ArbitrageLimitsService.assess_medium_landlord_constraints(
+                rent_decile=rent_decile,
+                num_units=ctx['num_units'],
+                property_value=property_value,
+                geographic_concentration=None
+            )
 
-        arbitrage_opportunity = ArbitrageLimitsService.calculate_arbitrage_opportunity(
-            renter_constraints=renter_constraints,
-            institutional_constraints=institutional_constraints,
-            medium_landlord_constraints=medium_landlord_fit,
-            rent_decile=rent_decile
-        )
+            arbitrage_opportunity = ArbitrageLimitsService.calculate_arbitrage_opportunity(
+                renter_constraints=renter_constraints,
+                institutional_constraints=institutional_constraints,
+                medium_landlord_constraints=medium_landlord_fit,
+                rent_decile=rent_decile
+            )
 
-        memo['arbitrage_opportunity'] = {
-            'renter_constraints': renter_constraints,
-            'institutional_constraints': institutional_constraints,
-            'medium_landlord_fit': medium_landlord_fit,
-            'overall_opportunity': arbitrage_opportunity
-        }
+            computed['arbitrage_opportunity'] = {
+                'renter_constraints': renter_constraints,
+                'institutional_constraints': institutional_constraints,
+                'medium_landlord_fit': medium_landlord_fit,
+                'overall_opportunity': arbitrage_opportunity
+            }
 
         # SECTION 9: Investment Recommendation
-        recommendation = DealMemoService._generate_recommendation(
-            tier_classification=classification,
-            total_return=memo['total_return'],
-            risk_assessment=composite_risk,
-            arbitrage_opportunity=arbitrage_opportunity
-        )
+        if 'investment_recommendation' in needed:
+            recommendation = DealMemoService._generate_recommendation(
+                tier_classification=classification,
+                total_return=computed['total_return'],
+                risk_assessment=composite_risk,
+                arbitrage_opportunity=arbitrage_opportunity
+            )
 
-        memo['investment_recommendation'] = recommendation
+            computed['investment_recommendation'] = recommendation
 
         # SECTION 10: Sensitivity Analysis
-        sensitivity = DealMemoService._generate_sensitivity_analysis(
-            base_net_yield=net_yield,
-            base_appreciation=appreciation['annualized_appreciation_rate'],
-            cost_of_debt=cost_of_debt,
-            ltv=ltv
-        )
+        if 'sensitivity_analysis' in needed:
+            sensitivity = DealMemoService._generate_sensitivity_analysis(
+                base_net_yield=net_yield,
+                base_appreciation=appreciation['annualized_appreciation_rate'],
+                cost_of_debt=cost_of_debt,
+                ltv=ltv
+            )
 
-        memo['sensitivity_analysis'] = sensitivity
+            computed['sensitivity_analysis'] = sensitivity
 
         # SECTION 11: Executive Summary
-        executive_summary = DealMemoService._generate_executive_summary(
-            deal=deal,
-            classification=classification,
-            total_return=memo['total_return'],
-            risk_assessment=composite_risk,
-            arbitrage_opportunity=arbitrage_opportunity,
-            recommendation=recommendation
-        )
+        if 'executive_summary' in needed:
+            executive_summary = DealMemoService._generate_executive_summary(
+                property_summary=computed['property_summary'],
+                classification=classification,
+                total_return=computed['total_return'],
+                risk_assessment=composite_risk,
+                arbitrage_opportunity=arbitrage_opportunity,
+                recommendation=recommendation
+            )
 
-        memo['executive_summary'] = executive_summary
+            computed['executive_summary'] = executive_summary
 
-        return memo
+        # Sections were computed in MEMO_SECTIONS order, so the memo keeps that order
+        return {
+            'deal_id': deal_id,
+            'generated_at': generated_at,
+            'holding_period': holding_period,
+            **(computed if sections is None else {
+                name: section for name, section in computed.items() if name in sections
+            })
+        }
+
+    @staticmethod
+    def _build_context(deal: DealModel, now_year: int) -> Dict:
+        """
+        Read and derive every deal input the memo sections share, once
+
+        Args:
+            deal: Deal being analyzed
+            now_year: Current calendar year
+
+        Returns:
+            Dictionary of derived inputs (address, state, year_built,
+            property_age, property_condition, num_units, property_value,
+            cost_of_debt, ltv)
+        """
+        year_built = getattr(deal, 'construction_year', None) or deal.year_built
+        down_payment_pct = deal.down_payment_percent or 25.0
+
+        return {
+            'address': getattr(deal, 'street_address', None) or deal.property_address or 'N/A',
+            'state': RiskAssessmentService.state_from_address(deal.property_address),
+            'year_built': year_built,
+            'property_age': now_year - year_built if year_built else None,
+            'property_condition': getattr(deal, 'property_condition', None),
+            'num_units': getattr(deal, 'number_of_units', None) or 1,
+            'property_value': deal.purchase_price or 200000,
+            'cost_of_debt': deal.loan_interest_rate or 6.5,
+            'ltv': 1.0 - (down_payment_pct / 100)
+        }
+
+    # Overall rating tiers, indexed by how many of the return thresholds the
+    # unlevered return exceeds. A tier also requires composite risk below
+    # max_risk and arbitrage score above min_arbitrage (None = no limit);
+    # otherwise the next tier down is tried.
+    _RATING_RETURN_THRESHOLDS = (2.0, 4.0, 6.0, 8.0)
+    _RATING_TIERS = (
+        # (max_risk, min_arbitrage, rating, rating_score)
+        (None, None, 'Pass', 30),
+        (None, None, 'Consider', 45),
+        (65, None, 'Hold', 60),
+        (55, 55, 'Buy', 75),
+        (45, 70, 'Strong Buy', 90),
+    )
+
+    # Key strength / concern rules: (predicate over the recommendation facts,
+    # message template), listed in output order
+    _STRENGTH_RULES = (
+        (lambda f: f['rent_decile'] <= 3,
+         "{tier_label} tier delivers research-validated return premium (2-4%/year vs high-rent)"),
+        (lambda f: f['composite_risk_score'] < 40,
+         "Low total risk ({composite_risk_level}) - below market average"),
+        (lambda f: f['arbitrage_score'] > 70,
+         "High arbitrage opportunity - limited institutional competition"),
+        (lambda f: f['total_return_levered'] > 10,
+         "Strong levered returns ({total_return_levered}%) with moderate leverage"),
+    )
+    _CONCERN_RULES = (
+        (lambda f: f['composite_risk_score'] > 60,
+         "Elevated risk profile ({composite_risk_level})"),
+        (lambda f: f['total_return_unlevered'] < 5,
+         "Below-market unlevered returns ({total_return_unlevered}%)"),
+        (lambda f: f['arbitrage_score'] < 40,
+         "Limited arbitrage opportunity - competitive market"),
+        (lambda f: f['rent_decile'] >= 8,
+         "{tier_label} tier shows higher systematic risk and lower returns"),
+    )
 
     @staticmethod
     def _generate_recommendation(
@@ -334,44 +583,34 @@ class DealMemoService:
         arbitrage_score = arbitrage_opportunity['arbitrage_opportunity_score']
         arbitrage_level = arbitrage_opportunity['opportunity_level']
 
-        # Determine overall rating
-        if total_return_unlevered > 8.0 and composite_risk_score < 45 and arbitrage_score > 70:
-            rating = 'Strong Buy'
-            rating_score = 90
-        elif total_return_unlevered > 6.0 and composite_risk_score < 55 and arbitrage_score > 55:
-            rating = 'Buy'
-            rating_score = 75
-        elif total_return_unlevered > 4.0 and composite_risk_score < 65:
-            rating = 'Hold'
-            rating_score = 60
-        elif total_return_unlevered > 2.0:
-            rating = 'Consider'
-            rating_score = 45
-        else:
-            rating = 'Pass'
-            rating_score = 30
-
-        # Key strengths
-        strengths = []
-        if rent_decile <= 3:
-            strengths.append(f"{tier_label} tier delivers research-validated return premium (2-4%/year vs high-rent)")
-        if composite_risk_score < 40:
-            strengths.append(f"Low total risk ({composite_risk_level}) - below market average")
-        if arbitrage_score > 70:
-            strengths.append(f"High arbitrage opportunity - limited institutional competition")
-        if total_return_levered > 10:
-            strengths.append(f"Strong levered returns ({total_return_levered}%) with moderate leverage")
-
-        # Key concerns
-        concerns = []
-        if composite_risk_score > 60:
-            concerns.append(f"Elevated risk profile ({composite_risk_level})")
-        if total_return_unlevered < 5:
-            concerns.append(f"Below-market unlevered returns ({total_return_unlevered}%)")
-        if arbitrage_score < 40:
-            concerns.append("Limited arbitrage opportunity - competitive market")
-        if rent_decile >= 8:
-            concerns.append(f"{tier_label} tier shows higher systematic risk and lower returns")
+        # Determine overall rating: highest tier the return qualifies for,
+        # stepping down until the risk and arbitrage limits also hold
+        tier = bisect_left(DealMemoService._RATING_RETURN_THRESHOLDS, total_return_unlevered)
+        while True:
+            max_risk, min_arbitrage, rating, rating_score = DealMemoService._RATING_TIERS[tier]
+            if (max_risk is None or composite_risk_score < max_risk) \
+                    and (min_arbitrage is None or arbitrage_score > min_arbitrage):
+                break
+            tier -= 1
+
+        # Key strengths and concerns: format only the rules that apply
+        facts = {
+            'rent_decile': rent_decile,
+            'tier_label': tier_label,
+            'total_return_unlevered': total_return_unlevered,
+            'total_return_levered': total_return_levered,
+            'composite_risk_score': composite_risk_score,
+            'composite_risk_level': composite_risk_level,
+            'arbitrage_score': arbitrage_score
+        }
+        strengths = [
+            template.format_map(facts)
+            for applies, template in DealMemoService._STRENGTH_RULES if applies(facts)
+        ]
+        concerns = [
+            template.format_map(facts)
+            for applies, template in DealMemoService._CONCERN_RULES if applies(facts)
+        ]
 
         # Target investor
         target_investor = arbitrage_opportunity.get('recommended_investor_type', 'Individual Investor')
@@ -387,6 +626,36 @@ class DealMemoService:
             )
         }
 
+    # Recommendation summary text per overall rating
+    _SUMMARY_TEMPLATES = {
+        'Strong Buy': (
+            "{tier_label} property with exceptional risk-adjusted returns. "
+            "{total_return:.1f}% unlevered return with {risk} risk profile "
+            "and {arbitrage} arbitrage opportunity. "
+            "Strongly recommended for acquisition."
+        ),
+        'Buy': (
+            "{tier_label} property with attractive returns. "
+            "{total_return:.1f}% unlevered return and {risk} risk. "
+            "Recommended for acquisition with standard due diligence."
+        ),
+        'Hold': (
+            "{tier_label} property with market-rate returns. "
+            "{total_return:.1f}% unlevered return. "
+            "Acceptable investment but not exceptional."
+        ),
+        'Consider': (
+            "{tier_label} property with modest returns. "
+            "{total_return:.1f}% unlevered return. "
+            "Proceed with caution and detailed analysis."
+        ),
+        'Pass': (
+            "{tier_label} property with below-market returns. "
+            "{total_return:.1f}% unlevered return. "
+            "Not recommended unless strategic rationale exists."
+        ),
+    }
+
     @staticmethod
     def _generate_recommendation_summary(
         rating: str,
@@ -397,37 +666,15 @@ class DealMemoService:
     ) -> str:
         """Generate recommendation summary text"""
 
-        if rating == 'Strong Buy':
-            return (
-                f"{tier_label} property with exceptional risk-adjusted returns. "
-                f"{total_return:.1f}% unlevered return with {risk_level.lower()} risk profile "
-                f"and {arbitrage_level.lower()} arbitrage opportunity. "
-                "Strongly recommended for acquisition."
-            )
-        elif rating == 'Buy':
-            return (
-                f"{tier_label} property with attractive returns. "
-                f"{total_return:.1f}% unlevered return and {risk_level.lower()} risk. "
-                "Recommended for acquisition with standard due diligence."
-            )
-        elif rating == 'Hold':
-            return (
-                f"{tier_label} property with market-rate returns. "
-                f"{total_return:.1f}% unlevered return. "
-                "Acceptable investment but not exceptional."
-            )
-        elif rating == 'Consider':
-            return (
-                f"{tier_label} property with modest returns. "
-                f"{total_return:.1f}% unlevered return. "
-                "Proceed with caution and detailed analysis."
-            )
-        else:
-            return (
-                f"{tier_label} property with below-market returns. "
-                f"{total_return:.1f}% unlevered return. "
-                "Not recommended unless strategic rationale exists."
-            )
+        template = DealMemoService._SUMMARY_TEMPLATES.get(
+            rating, DealMemoService._SUMMARY_TEMPLATES['Pass']
+        )
+        return template.format(
+            tier_label=tier_label,
+            total_return=total_return,
+            risk=risk_level.lower(),
+            arbitrage=arbitrage_level.lower()
+        )
 
     @staticmethod
     def _generate_sensitivity_analysis(
@@ -530,7 +777,7 @@ class DealMemoService:
 
     @staticmethod
     def _generate_executive_summary(
-        deal: DealModel,
+        property_summary: Dict,
         classification: Dict,
         total_return: Dict,
         risk_assessment: Dict,
@@ -540,9 +787,12 @@ class DealMemoService:
         """Generate executive summary for memo"""
 
         return {
-            'property': f"{deal.bedrooms}BR/{deal.bathrooms}BA, {deal.square_footage or 'N/A'} sqft",
-            'address': getattr(deal, 'street_address', None) or deal.property_address or 'N/A',
-            'purchase_price': deal.purchase_price,
+            'property': (
+                f"{property_summary['bedrooms']}BR/{property_summary['bathrooms']}BA, "
+                f"{property_summary['square_footage'] or 'N/A'} sqft"
+            ),
+            'address': property_summary['address'],
+            'purchase_price': property_summary['purchase_price'],
             'rent_tier': classification['tier_label'],
             'tier_category': classification['interpretation']['category'],
             'expected_return_range': classification['interpretation']['expected_return_range'],
@@ -577,27 +827,56 @@ class DealMemoService:
         if len(deal_ids) > 5:
             raise ValueError("Maximum 5 deals for comparison")
 
+        # One timestamp for the comparison and every memo generated for it
+        generated_at = datetime.utcnow()
+        now_year = datetime.now().year
+
         comparison = {
-            'generated_at': datetime.utcnow().isoformat(),
+            'generated_at': generated_at,
             'holding_period': holding_period,
             'deals': {},
             'rankings': {},
             'summary': {}
         }
 
-        # Generate memo for each deal
-        for deal_id in deal_ids:
-            try:
-                memo = DealMemoService.generate_memo(deal_id, holding_period)
-                comparison['deals'][deal_id] = memo
-            except Exception as e:
-                comparison['deals'][deal_id] = {'error': str(e)}
+        # Load every deal in one query rather than one per memo. Workers get
+        # plain column rows (read like a DealModel, but detached from any
+        # session) so they never touch this thread's session.
+        stmt = select(*DealModel.__table__.columns).where(DealModel.id.in_(deal_ids))
+        deals_by_id = {row.id: row for row in db.session.execute(stmt)}
+
+        # Generate the memos concurrently, collecting them in request order
+        futures = [
+            (deal_id, DealMemoService._submit(
+                DealMemoService._safe_generate_memo,
+                deal_id, holding_period, deals_by_id.get(deal_id), now_year, generated_at
+            ))
+            for deal_id in deal_ids
+        ]
+        for deal_id, future in futures:
+            comparison['deals'][deal_id] = future.result()
 
         # Rank deals by various metrics
         comparison['rankings'] = DealMemoService._rank_deals(comparison['deals'])
 
         return comparison
 
+    @staticmethod
+    def _safe_generate_memo(
+        deal_id: int,
+        holding_period: int,
+        deal: Optional[DealModel] = None,
+        now_year: Optional[int] = None,
+        generated_at: Optional[datetime] = None
+    ) -> Dict:
+        """Generate a memo for a comparison, returning {'error': ...} on failure"""
+        try:
+            return DealMemoService.generate_memo(
+                deal_id, holding_period, deal=deal, now_year=now_year, generated_at=generated_at
+            )
+        except Exception as e:
+            return {'error': str(e)}
+
     @staticmethod
     def _rank_deals(deals: Dict) -> Dict:
         """Rank deals by key metrics"""
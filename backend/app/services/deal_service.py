@@ -2,8 +2,14 @@
 Deal service layer for CRUD operations
 Handles business logic for deal management
 """
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Dict
 from datetime import datetime
+import orjson
+from flask import current_app, has_app_context
+from sqlalchemy import insert, select, update
 from app.database import db, DealModel, RiskAssessmentModel
 from app.models.deal_models import Deal
 from app.services.hedonic_model_service import HedonicModelService
@@ -13,12 +19,49 @@ from app.services.capital_appreciation_service import CapitalAppreciationService
 from app.services.total_return_service import TotalReturnService
 from app.services.risk_assessment_service import RiskAssessmentService
 from app.services.arbitrage_limits_service import ArbitrageLimitsService
-from app.services.climate_risk_service import ClimateRiskService
+from app.services.climate_risk_service import ClimateRiskService, REDIS_AVAILABLE
+
+if REDIS_AVAILABLE:
+    import redis
+
+logger = logging.getLogger(__name__)
+
+# Risk assessment columns an assessment dict may overwrite on recalculation
+_RA_UPDATABLE = frozenset(
+    column.name for column in RiskAssessmentModel.__table__.columns
+) - {'id', 'deal_id', 'created_at'}
 
 
 class DealService:
     """Service class for managing real estate deals"""
 
+    # Worker pool for the climate risk lookup, which runs alongside the rest
+    # of an assessment
+    _executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='deal-climate')
+
+    @classmethod
+    def _submit(cls, fn, *args):
+        """
+        Run fn(*args) on the worker pool, inside the caller's app context
+
+        Args:
+            fn: Function to run
+            *args: Positional arguments for fn
+
+        Returns:
+            concurrent.futures.Future for the result
+        """
+        if not has_app_context():
+            return cls._executor.submit(fn, *args)
+
+        app = current_app._get_current_object()
+
+        def run():
+            with app.app_context():
+                return fn(*args)
+
+        return cls._executor.submit(run)
+
     @staticmethod
     def create_deal(deal_data: dict) -> Deal:
         """
@@ -78,21 +121,18 @@ class DealService:
         Returns:
             List of Deal objects
         """
-        query = DealModel.query
+        # Plain column rows, no ORM instances; deal columns share the Deal
+        # dataclass field names, so each row maps straight onto a Deal
+        stmt = select(*DealModel.__table__.columns)
 
         # Apply status filter if provided
         if status:
-            query = query.filter(DealModel.status == status)
-
-        # Order by updated_at descending (most recent first)
-        query = query.order_by(DealModel.updated_at.desc())
+            stmt = stmt.where(DealModel.status == status)
 
-        # Limit results
-        query = query.limit(limit)
+        # Order by updated_at descending (most recent first), limit results
+        stmt = stmt.order_by(DealModel.updated_at.desc()).limit(limit)
 
-        # Execute query and convert to Deal objects
-        deal_models = query.all()
-        return [Deal.from_dict(dm.to_dict()) for dm in deal_models]
+        return [Deal(**row._mapping) for row in db.session.execute(stmt)]
 
     @staticmethod
     def update_deal(deal_id: int, deal_data: dict) -> Optional[Deal]:
@@ -182,7 +222,8 @@ class DealService:
         deal_id: int,
         holding_period: int = 10,
         geography: str = 'US',
-        save_to_db: bool = True
+        save_to_db: bool = True,
+        detail: str = 'full'
     ) -> Dict:
         """
         Orchestrate complete risk assessment calculation pipeline
@@ -204,13 +245,17 @@ class DealService:
             holding_period: Investment horizon in years
             geography: Geographic market for benchmarks
             save_to_db: Whether to save results to database
+            detail: 'full' for the assessment with its per-service
+                'components' breakdown, 'summary' for the top-level scores only
 
         Returns:
             Complete risk assessment dictionary
 
         Raises:
-            ValueError: If deal not found or missing required fields
+            ValueError: If deal not found, missing required fields or unknown detail
         """
+        if detail not in ('full', 'summary'):
+            raise ValueError(f"Invalid detail '{detail}'. Must be 'full' or 'summary'")
 
         # Step 1: Fetch and validate deal
         deal = DealModel.query.get(deal_id)
@@ -223,124 +268,131 @@ class DealService:
         if missing_fields:
             raise ValueError(f"Missing required fields for risk assessment: {missing_fields}")
 
-        # Step 2: Predict fundamental rent using hedonic model
-        property_data = {
-            'square_footage': deal.square_footage,
-            'bedrooms': deal.bedrooms,
-            'bathrooms': deal.bathrooms,
-            'year_built': getattr(deal, 'construction_year', None) or deal.year_built,
-            'property_type': deal.property_type,
-            'epc_score': getattr(deal, 'epc_score', None)
-        }
+        # Steps 2-9 are a pure function of the deal inputs; reuse a cached
+        # result while those inputs are unchanged
+        cache_key = DealService._assessment_cache_key(deal, holding_period, geography)
+        assessment = DealService._assessment_cache_get(cache_key)
+        if assessment is None:
+            assessment = DealService._compute_risk_assessment(deal, holding_period, geography)
+            DealService._assessment_cache_put(cache_key, assessment)
 
-        rent_prediction = HedonicModelService.predict_fundamental_rent(property_data)
-        predicted_rent = rent_prediction['predicted_rent']
+        # Summary callers skip the components breakdown (and its encoding)
+        if detail == 'summary':
+            del assessment['components']
 
-        # Step 3: Classify into rent tier
-        classification = RentTierService.classify_property(
-            predicted_rent=predicted_rent,
-            geography='national',
-            bedrooms=deal.bedrooms
-        )
-
-        rent_decile = classification['national_decile']
+        # Step 10: Save to database if requested
+        if save_to_db:
+            assessment_id = DealService._save_risk_assessment(deal, assessment)
+            assessment['assessment_id'] = assessment_id
 
-        # Step 4: Calculate yields
-        annual_rent = predicted_rent * 12
-        property_value = deal.purchase_price or 200000
+        return assessment
 
-        gross_yield = YieldCalculationService.calculate_gross_yield(
-            annual_rent=annual_rent,
-            property_value=property_value
-        )
+    # Deal columns read by the assessment pipeline; together with the holding
+    # period, geography and current year they determine the result
+    _ASSESSMENT_INPUT_COLUMNS = (
+        'square_footage', 'bedrooms', 'bathrooms', 'year_built', 'property_type',
+        'purchase_price', 'loan_interest_rate', 'down_payment_percent',
+        'property_address', 'latitude', 'longitude'
+    )
+    ASSESSMENT_CACHE_TTL_SECONDS = 3600
 
-        cost_components = YieldCalculationService.calculate_cost_components(
-            rent_decile=rent_decile,
-            num_units=getattr(deal, 'number_of_units', None) or 1,
-            property_value=property_value,
-            annual_rent=annual_rent
-        )
+    @staticmethod
+    def _assessment_cache_key(deal: DealModel, holding_period: int, geography: str) -> str:
+        """
+        Redis key for a deal's assessment, hashed over every input it depends on
 
-        net_yield = YieldCalculationService.calculate_net_yield(
-            gross_yield=gross_yield,
-            cost_components=cost_components
-        )
+        Editing any input column yields a new key, so stale results are never
+        read back and no invalidation is needed on update or delete.
 
-        # Step 5: Project capital appreciation
-        appreciation = CapitalAppreciationService.project_future_value(
-            current_value=property_value,
-            rent_decile=rent_decile,
-            years=holding_period,
-            geography=geography
-        )
+        Args:
+            deal: Deal being assessed
+            holding_period: Investment horizon in years
+            geography: Geographic market for benchmarks
 
-        # Step 6: Calculate total returns
-        total_return_unlevered = TotalReturnService.calculate_unlevered_return(
-            net_yield=net_yield,
-            capital_gain_yield=appreciation['annualized_appreciation_rate']
-        )
+        Returns:
+            Redis key string
+        """
+        inputs = [getattr(deal, column) for column in DealService._ASSESSMENT_INPUT_COLUMNS]
+        inputs += [holding_period, geography, datetime.now().year]
+        digest = hashlib.blake2b(repr(inputs).encode(), digest_size=16).hexdigest()
+        return f"rassess:{deal.id}:{digest}"
 
-        cost_of_debt = deal.loan_interest_rate or 6.5
-        down_payment_pct = deal.down_payment_percent or 25.0
-        ltv = 1.0 - (down_payment_pct / 100)
+    @staticmethod
+    def _assessment_cache_get(key: str) -> Optional[Dict]:
+        """Fetch a cached assessment from the shared Redis client, or None on miss/error"""
+        client = ClimateRiskService._get_redis()
+        if client is None:
+            return None
+        try:
+            raw = client.get(key)
+        except redis.RedisError as e:
+            logger.warning(f"Assessment cache read error: {e}")
+            return None
+        return orjson.loads(raw) if raw is not None else None
 
-        total_return_levered = TotalReturnService.calculate_levered_return(
-            unlevered_return=total_return_unlevered,
-            cost_of_debt=cost_of_debt,
-            ltv=ltv
-        )
+    @staticmethod
+    def _assessment_cache_put(key: str, assessment: Dict):
+        """
+        Store a computed assessment in Redis
 
-        # Step 7: Calculate risk dimensions
-        property_age = None
-        year_built = getattr(deal, 'construction_year', None) or deal.year_built
-        if year_built:
-            property_age = datetime.now().year - year_built
+        Assessments whose climate risk, or any single hazard lookup, failed
+        (e.g. geocoder or FEMA unreachable) are not cached, so the next
+        request retries the lookup.
+        """
+        client = ClimateRiskService._get_redis()
+        if client is None:
+            return
+        climate_risk = assessment['components']['climate_risk'] or {}
+        if 'error' in climate_risk or any(
+            'error' in hazard for hazard in climate_risk.get('hazards', {}).values()
+        ):
+            return
+        try:
+            client.setex(
+                key,
+                DealService.ASSESSMENT_CACHE_TTL_SECONDS,
+                orjson.dumps(assessment, option=orjson.OPT_SERIALIZE_NUMPY)
+            )
+        except (redis.RedisError, orjson.JSONEncodeError) as e:
+            logger.warning(f"Assessment cache write error: {e}")
 
-        # Try to determine state / coordinates from existing deal data
-        # Prefer explicit latitude/longitude if present, otherwise attempt to parse
-        # the provided property address into components and call the Census geocoder.
-        state = getattr(deal, 'state', None)
-        latitude = getattr(deal, 'latitude', None)
-        longitude = getattr(deal, 'longitude', None)
+    @staticmethod
+    def _assess_climate_risk(location: Dict) -> Dict:
+        """
+        Climate risk for a deal location (assessment step 7b)
 
-        systematic_risk = RiskAssessmentService.calculate_systematic_risk(
-            rent_decile=rent_decile,
-            geography=geography
-        )
+        Uses explicit coordinates when present, otherwise parses the address
+        into components and calls the Census geocoder. Failures are reported
+        as an 'Unknown' climate risk rather than raised.
 
-        regulatory_risk = RiskAssessmentService.calculate_regulatory_risk(
-            state=state or 'CA',
-            city=None,
-            rent_level=predicted_rent,
-            ami_percentage=None
-        )
+        Args:
+            location: deal_id, state, latitude, longitude, property_address,
+                street, city, zipcode and property_type read from the deal
 
-        idiosyncratic_risk = RiskAssessmentService.calculate_idiosyncratic_risk(
-            property_age=property_age,
-            property_condition=getattr(deal, 'property_condition', None),
-            num_units=getattr(deal, 'number_of_units', None) or 1,
-            concentration_risk=None,
-            occupancy_rate=None
-        )
+        Returns:
+            Composite climate risk dictionary
+        """
+        deal_id = location['deal_id']
+        state = location['state']
+        latitude = location['latitude']
+        longitude = location['longitude']
 
-        # Step 7b: Calculate Climate Risk (NEW - 4th dimension)
-        climate_risk = None
         try:
             # If deal already has lat/lon use them directly (no geocoding needed)
             if latitude is not None and longitude is not None:
                 climate_risk = ClimateRiskService.calculate_composite_climate_risk(
                     latitude=latitude,
                     longitude=longitude,
-                    property_type=getattr(deal, 'property_type', None)
+                    property_type=location['property_type']
                 )
 
                 print(f"✓ Climate risk calculated from existing coordinates: {climate_risk['climate_risk_score']:.1f} ({climate_risk['climate_risk_level']})")
             else:
                 # Try to build address components from model fields or single-line property_address
-                property_address = getattr(deal, 'property_address', '') or ''
-                street = getattr(deal, 'street_address', None) or ''
-                city = getattr(deal, 'city', None) or ''
-                zipcode = getattr(deal, 'zipcode', None) or ''
+                property_address = location['property_address']
+                street = location['street']
+                city = location['city']
+                zipcode = location['zipcode']
 
                 # If components missing, do a lightweight parse of property_address
                 if not (street or city or zipcode or state):
@@ -389,7 +441,7 @@ class DealService:
                     climate_risk = ClimateRiskService.calculate_composite_climate_risk(
                         latitude=latitude,
                         longitude=longitude,
-                        property_type=getattr(deal, 'property_type', None)
+                        property_type=location['property_type']
                     )
 
                     print(f"✓ Climate risk calculated: {climate_risk['climate_risk_score']:.1f} ({climate_risk['climate_risk_level']})")
@@ -412,6 +464,140 @@ class DealService:
                 'warning': 'Climate risk calculation unavailable'
             }
 
+        return climate_risk
+
+    @staticmethod
+    def _compute_risk_assessment(deal: DealModel, holding_period: int, geography: str) -> Dict:
+        """
+        Run assessment steps 2-9 for a validated deal
+
+        Args:
+            deal: Deal with the required property fields present
+            holding_period: Investment horizon in years
+            geography: Geographic market for benchmarks
+
+        Returns:
+            Complete risk assessment dictionary (not yet saved)
+        """
+        # Climate risk (step 7b) depends only on the deal's location and is
+        # dominated by geocoder/FEMA HTTP calls; start it on a worker so it
+        # overlaps steps 2-7. Plain values are passed so the worker never
+        # touches this thread's session.
+        location = {
+            'deal_id': deal.id,
+            'state': getattr(deal, 'state', None),
+            'latitude': getattr(deal, 'latitude', None),
+            'longitude': getattr(deal, 'longitude', None),
+            'property_address': getattr(deal, 'property_address', '') or '',
+            'street': getattr(deal, 'street_address', None) or '',
+            'city': getattr(deal, 'city', None) or '',
+            'zipcode': getattr(deal, 'zipcode', None) or '',
+            'property_type': getattr(deal, 'property_type', None)
+        }
+        climate_future = DealService._submit(DealService._assess_climate_risk, location)
+
+        deal_id = deal.id
+
+        # Step 2: Predict fundamental rent using hedonic model
+        property_data = {
+            'square_footage': deal.square_footage,
+            'bedrooms': deal.bedrooms,
+            'bathrooms': deal.bathrooms,
+            'year_built': getattr(deal, 'construction_year', None) or deal.year_built,
+            'property_type': deal.property_type,
+            'epc_score': getattr(deal, 'epc_score', None)
+        }
+
+        rent_prediction = HedonicModelService.predict_fundamental_rent(property_data)
+        predicted_rent = rent_prediction['predicted_rent']
+
+        # Step 3: Classify into rent tier
+        classification = RentTierService.classify_property(
+            predicted_rent=predicted_rent,
+            geography='national',
+            bedrooms=deal.bedrooms
+        )
+
+        rent_decile = classification['national_decile']
+
+        # Step 4: Calculate yields
+        annual_rent = predicted_rent * 12
+        property_value = deal.purchase_price or 200000
+
+        gross_yield = YieldCalculationService.calculate_gross_yield(
+            annual_rent=annual_rent,
+            property_value=property_value
+        )
+
+        cost_components = YieldCalculationService.calculate_cost_components(
+            rent_decile=rent_decile,
+            num_units=getattr(deal, 'number_of_units', None) or 1,
+            property_value=property_value,
+            annual_rent=annual_rent
+        )
+
+        net_yield = YieldCalculationService.calculate_net_yield(
+            gross_yield=gross_yield,
+            cost_components=cost_components
+        )
+
+        # Step 5: Project capital appreciation
+        appreciation = CapitalAppreciationService.project_future_value(
+            current_value=property_value,
+            rent_decile=rent_decile,
+            years=holding_period,
+            geography=geography
+        )
+
+        # Step 6: Calculate total returns
+        total_return_unlevered = TotalReturnService.calculate_unlevered_return(
+            net_yield=net_yield,
+            capital_gain_yield=appreciation['annualized_appreciation_rate']
+        )
+
+        cost_of_debt = deal.loan_interest_rate or 6.5
+        down_payment_pct = deal.down_payment_percent or 25.0
+        ltv = 1.0 - (down_payment_pct / 100)
+
+        total_return_levered = TotalReturnService.calculate_levered_return(
+            unlevered_return=total_return_unlevered,
+            cost_of_debt=cost_of_debt,
+            ltv=ltv
+        )
+
+        # Step 7: Calculate risk dimensions
+        property_age = None
+        year_built = getattr(deal, 'construction_year', None) or deal.year_built
+        if year_built:
+            property_age = datetime.now().year - year_built
+
+        state = getattr(deal, 'state', None) or RiskAssessmentService.state_from_address(
+            deal.property_address
+        )
+
+        systematic_risk = RiskAssessmentService.calculate_systematic_risk(
+            rent_decile=rent_decile,
+            geography=geography
+        )
+
+        regulatory_risk = RiskAssessmentService.calculate_regulatory_risk(
+            state=state,
+            city=None,
+            rent_level=predicted_rent,
+            ami_percentage=None
+        )
+
+        idiosyncratic_risk = RiskAssessmentService.calculate_idiosyncratic_risk(
+            property_age=property_age,
+            property_condition=getattr(deal, 'property_condition', None),
+            num_units=getattr(deal, 'number_of_units', None) or 1,
+            concentration_risk=None,
+            occupancy_rate=None
+        )
+
+        # Step 7b: Climate Risk (4th dimension), started before step 2
+        climate_risk = climate_future.result()
+
         # Step 7c: Calculate composite risk (with optional climate risk)
         composite_risk = RiskAssessmentService.calculate_composite_risk(
             systematic_risk=systematic_risk,
@@ -567,30 +753,28 @@ class DealService:
             }
         }
 
-        # Step 10: Save to database if requested
-        if save_to_db:
-            assessment_id = DealService._save_risk_assessment(deal_id, assessment)
-            assessment['assessment_id'] = assessment_id
-
         return assessment
 
     @staticmethod
-    def _save_risk_assessment(deal_id: int, assessment: Dict) -> int:
+    def _save_risk_assessment(deal: DealModel, assessment: Dict) -> int:
         """
         Save risk assessment to database
 
         Args:
-            deal_id: Deal ID
+            deal: Assessed deal, as already loaded by the caller
             assessment: Assessment data dictionary
 
         Returns:
             ID of created RiskAssessmentModel
         """
+        deal_id = deal.id
 
-        # Create or update risk assessment record
-        existing = RiskAssessmentModel.query.filter_by(deal_id=deal_id).first()
+        # Create or update risk assessment record; only the id is needed
+        existing_id = db.session.execute(
+            select(RiskAssessmentModel.id).filter_by(deal_id=deal_id).limit(1)
+        ).scalar()
 
-        if existing:
+        if existing_id is not None:
             # Update existing record
             try:
                 # Log database path for debugging
@@ -600,16 +784,18 @@ class DealService:
                 print(f"DEBUG: File exists: {os.path.exists(db_path) if db_path else 'N/A'}")
                 print(f"DEBUG: File writable: {os.access(db_path, os.W_OK) if db_path else 'N/A'}")
 
-                for key, value in assessment.items():
-                    if key not in ['deal_id', 'calculated_at', 'components', 'assessment_id']:
-                        if hasattr(existing, key):
-                            setattr(existing, key, value)
-                existing.updated_at = datetime.utcnow()
+                # One Core UPDATE of the matching columns, bypassing ORM
+                # attribute instrumentation
+                values = {key: assessment[key] for key in _RA_UPDATABLE & assessment.keys()}
+                values['updated_at'] = datetime.utcnow()
 
-                # Try to flush before commit
-                db.session.flush()
+                db.session.execute(
+                    update(RiskAssessmentModel)
+                    .where(RiskAssessmentModel.id == existing_id)
+                    .values(**values)
+                )
                 db.session.commit()
-                return existing.id
+                return existing_id
             except Exception as e:
                 db.session.rollback()
                 print(f"DEBUG: Database error: {str(e)}")
@@ -617,7 +803,7 @@ class DealService:
                 raise Exception(f"Failed to update risk assessment: {str(e)}")
         else:
             # Create new record
-            risk_assessment = RiskAssessmentModel(
+            row = dict(
                 deal_id=deal_id,
                 predicted_fundamental_rent=assessment['predicted_fundamental_rent'],
                 rent_decile_national=assessment['rent_decile_national'],
@@ -671,16 +857,17 @@ class DealService:
             )
 
             try:
-                db.session.add(risk_assessment)
-                db.session.commit()
+                # Core INSERT (no ORM instance); the new primary key comes back
+                # from the statement, then the record and the deal link are
+                # committed in one transaction
+                result = db.session.execute(insert(RiskAssessmentModel).values(**row))
+                risk_assessment_id = result.inserted_primary_key[0]
 
                 # Update deal with risk_assessment_id
-                deal = DealModel.query.get(deal_id)
-                if deal:
-                    deal.risk_assessment_id = risk_assessment.id
-                    db.session.commit()
+                deal.risk_assessment_id = risk_assessment_id
+                db.session.commit()
 
-                return risk_assessment.id
+                return risk_assessment_id
             except Exception as e:
                 db.session.rollback()
                 raise Exception(f"Failed to create risk assessment: {str(e)}")
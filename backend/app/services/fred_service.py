@@ -9,6 +9,7 @@ from app.models.fred_models import (
     HousingMarketData,
     EconomicIndicators,
     MacroeconomicData,
+    TimeSeries,
     TimeSeriesDataPoint
 )
 
@@ -398,30 +399,7 @@ class FREDService:
             if not time_series or len(time_series) < 2:
                 return None
 
-            # Get most recent value
-            current_value = time_series[-1].value
-            current_date = datetime.fromisoformat(time_series[-1].date)
-
-            # Find value from approximately 365 days ago
-            target_date = current_date - timedelta(days=365)
-
-            # Find closest observation to target date
-            year_ago_value = None
-            min_diff = timedelta(days=9999)
-
-            for point in time_series:
-                point_date = datetime.fromisoformat(point.date)
-                diff = abs(point_date - target_date)
-                if diff < min_diff:
-                    min_diff = diff
-                    year_ago_value = point.value
-
-            if year_ago_value is None or year_ago_value == 0:
-                return None
-
-            # Calculate percentage change
-            yoy_change = ((current_value - year_ago_value) / year_ago_value) * 100
-            return round(yoy_change, 2)
+            return TimeSeries.from_points(time_series).yoy_change()
 
         except Exception as e:
             print(f"Error calculating YoY change for {series_id}: {str(e)}")
@@ -433,37 +411,7 @@ class FREDService:
 
     def _dict_to_macro_data(self, data: dict) -> MacroeconomicData:
         """Convert dictionary back to MacroeconomicData object."""
-        return MacroeconomicData(
-            interest_rates=InterestRateData(
-                federal_funds_rate=data['interestRates']['federalFundsRate'],
-                prime_rate=data['interestRates']['primeRate'],
-                mortgage_30yr=data['interestRates']['mortgage30Year'],
-                mortgage_15yr=data['interestRates']['mortgage15Year'],
-                treasury_10yr=data['interestRates']['treasury10Year'],
-                treasury_2yr=data['interestRates']['treasury2Year']
-            ),
-            inflation=InflationData(
-                cpi_all_items=data['inflation']['cpiAllItems'],
-                core_cpi=data['inflation']['coreCpi'],
-                pce_inflation=data['inflation']['pceInflation'],
-                cpi_yoy_change=data['inflation']['cpiYoyChange']
-            ),
-            housing_market=HousingMarketData(
-                housing_starts=data['housingMarket']['housingStarts'],
-                building_permits=data['housingMarket']['buildingPermits'],
-                home_sales_existing=data['housingMarket']['homeSalesExisting'],
-                home_sales_new=data['housingMarket']['homeSalesNew'],
-                case_shiller_index=data['housingMarket']['caseShillerIndex']
-            ),
-            economic_indicators=EconomicIndicators(
-                gdp_real=data['economicIndicators']['realGdp'],
-                gdp_growth_rate=data['economicIndicators']['gdpGrowthRate'],
-                unemployment_rate=data['economicIndicators']['unemploymentRate'],
-                labor_force_participation=data['economicIndicators']['laborForceParticipation'],
-                consumer_sentiment=data['economicIndicators']['consumerSentiment']
-            ),
-            last_updated=data['lastUpdated']
-        )
+        return MacroeconomicData.from_dict(data)
 
 
 def asdict(obj):
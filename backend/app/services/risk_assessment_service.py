@@ -11,9 +11,34 @@ Academic Research Basis:
 
 import json
 import os
+import re
 from typing import Dict, Optional, Tuple
 from app.database import db, RiskBenchmarkData, DealModel
 
+# Two-letter codes keyed by lower-case state name
+_STATE_CODES = {
+    'alabama': 'AL', 'alaska': 'AK', 'arizona': 'AZ', 'arkansas': 'AR',
+    'california': 'CA', 'colorado': 'CO', 'connecticut': 'CT', 'delaware': 'DE',
+    'district of columbia': 'DC', 'florida': 'FL', 'georgia': 'GA', 'hawaii': 'HI',
+    'idaho': 'ID', 'illinois': 'IL', 'indiana': 'IN', 'iowa': 'IA',
+    'kansas': 'KS', 'kentucky': 'KY', 'louisiana': 'LA', 'maine': 'ME',
+    'maryland': 'MD', 'massachusetts': 'MA', 'michigan': 'MI', 'minnesota': 'MN',
+    'mississippi': 'MS', 'missouri': 'MO', 'montana': 'MT', 'nebraska': 'NE',
+    'nevada': 'NV', 'new hampshire': 'NH', 'new jersey': 'NJ', 'new mexico': 'NM',
+    'new york': 'NY', 'north carolina': 'NC', 'north dakota': 'ND', 'ohio': 'OH',
+    'oklahoma': 'OK', 'oregon': 'OR', 'pennsylvania': 'PA', 'puerto rico': 'PR',
+    'rhode island': 'RI', 'south carolina': 'SC', 'south dakota': 'SD',
+    'tennessee': 'TN', 'texas': 'TX', 'utah': 'UT', 'vermont': 'VT',
+    'virginia': 'VA', 'washington': 'WA', 'west virginia': 'WV',
+    'wisconsin': 'WI', 'wyoming': 'WY',
+}
+_STATE_ABBREVIATIONS = frozenset(_STATE_CODES.values())
+
+# Trailing country component of a geocoded address
+_COUNTRY_RE = re.compile(r'^(?:united states(?: of america)?|usa|us)$', re.IGNORECASE)
+# Address component holding the state, with an optional ZIP after it
+_STATE_PART_RE = re.compile(r'^(.*?)\s*(?:\d{5}(?:-\d{4})?)?$')
+
 
 class RiskAssessmentService:
     """
@@ -142,6 +167,36 @@ class RiskAssessmentService:
             }
         }
 
+    @staticmethod
+    def state_from_address(address: Optional[str], default: str = 'CA') -> str:
+        """
+        Extract the two-letter state code from a property address
+
+        Handles both "..., Sacramento, CA 95820" and geocoder-style
+        "..., Sacramento County, California, 95814, United States" forms.
+
+        Args:
+            address: Free-form property address
+            default: Code returned when no state can be found
+
+        Returns:
+            Two-letter state code (e.g., 'CA', 'TX')
+        """
+        parts = [part.strip() for part in (address or '').split(',') if part.strip()]
+
+        # Drop a trailing country and a ZIP code given as its own component
+        if parts and _COUNTRY_RE.match(parts[-1]):
+            parts.pop()
+        if parts and parts[-1].replace('-', '').isdigit():
+            parts.pop()
+        if len(parts) < 2:
+            return default
+
+        name = _STATE_PART_RE.match(parts[-1]).group(1)
+        if name in _STATE_ABBREVIATIONS:
+            return name
+        return _STATE_CODES.get(name.lower(), default)
+
     @staticmethod
     def calculate_regulatory_risk(
         state: str,
@@ -24,6 +24,9 @@ class Config:
     RENTCAST_API_KEY = os.getenv('RENTCAST_API_KEY', '')
     RENTCAST_CACHE_TTL = int(os.getenv('RENTCAST_CACHE_TTL', '604800'))
 
+    # Optional Redis URL for the shared climate risk cache (e.g. redis://localhost:6379/0)
+    REDIS_URL = os.getenv('REDIS_URL', '')
+
     # Frontend URL for CORS (only used in development)
     FRONTEND_URL = os.getenv('FRONTEND_URL', 'http://localhost:5173')
 
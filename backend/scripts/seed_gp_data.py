@@ -56,14 +56,9 @@ def seed_gp_data():
             {"year": 2023, "quarter": 3, "irr": 13.5},
             {"year": 2023, "quarter": 4, "irr": 14.0},
         ]
-        for q in gp1_quarters:
-            qp = GPQuarterlyPerformanceModel(
-                gp_id=gp1.id,
-                year=q["year"],
-                quarter=q["quarter"],
-                irr=q["irr"]
-            )
-            db.session.add(qp)
+        GPQuarterlyPerformanceModel.bulk_insert(
+            [{"gp_id": gp1.id, **q} for q in gp1_quarters]
+        )
 
         # Portfolio summary for GP1
         gp1_summary = [
@@ -72,15 +67,9 @@ def seed_gp_data():
             {"year": 2022, "quartile": 3, "deal_count": 3, "percentage": 25.0},
             {"year": 2021, "quartile": 4, "deal_count": 1, "percentage": 8.33},
         ]
-        for s in gp1_summary:
-            ps = GPPortfolioSummaryModel(
-                gp_id=gp1.id,
-                year=s["year"],
-                quartile=s["quartile"],
-                deal_count=s["deal_count"],
-                percentage=s["percentage"]
-            )
-            db.session.add(ps)
+        GPPortfolioSummaryModel.bulk_insert(
+            [{"gp_id": gp1.id, **s} for s in gp1_summary]
+        )
 
         # Sample GP 2: Austin Housing Partners
         print("Creating GP: Austin Housing Partners...")
@@ -112,14 +101,9 @@ def seed_gp_data():
             {"year": 2023, "quarter": 3, "irr": 12.8},
             {"year": 2023, "quarter": 4, "irr": 13.2},
         ]
-        for q in gp2_quarters:
-            qp = GPQuarterlyPerformanceModel(
-                gp_id=gp2.id,
-                year=q["year"],
-                quarter=q["quarter"],
-                irr=q["irr"]
-            )
-            db.session.add(qp)
+        GPQuarterlyPerformanceModel.bulk_insert(
+            [{"gp_id": gp2.id, **q} for q in gp2_quarters]
+        )
 
         # Portfolio summary for GP2
         gp2_summary = [
@@ -128,15 +112,9 @@ def seed_gp_data():
             {"year": 2022, "quartile": 3, "deal_count": 5, "percentage": 27.78},
             {"year": 2021, "quartile": 4, "deal_count": 2, "percentage": 11.11},
         ]
-        for s in gp2_summary:
-            ps = GPPortfolioSummaryModel(
-                gp_id=gp2.id,
-                year=s["year"],
-                quartile=s["quartile"],
-                deal_count=s["deal_count"],
-                percentage=s["percentage"]
-            )
-            db.session.add(ps)
+        GPPortfolioSummaryModel.bulk_insert(
+            [{"gp_id": gp2.id, **s} for s in gp2_summary]
+        )
 
         # Sample GP 3: Metro Development Group
         print("Creating GP: Metro Development Group...")
@@ -165,14 +143,9 @@ def seed_gp_data():
             {"year": 2024, "quarter": 3, "irr": 17.9},
             {"year": 2024, "quarter": 4, "irr": 18.5},
         ]
-        for q in gp3_quarters:
-            qp = GPQuarterlyPerformanceModel(
-                gp_id=gp3.id,
-                year=q["year"],
-                quarter=q["quarter"],
-                irr=q["irr"]
-            )
-            db.session.add(qp)
+        GPQuarterlyPerformanceModel.bulk_insert(
+            [{"gp_id": gp3.id, **q} for q in gp3_quarters]
+        )
 
         # Sample GP 4: Coastal Realty Fund
         print("Creating GP: Coastal Realty Fund...")
@@ -201,14 +174,9 @@ def seed_gp_data():
             {"year": 2024, "quarter": 3, "irr": 13.0},
             {"year": 2024, "quarter": 4, "irr": 12.8},
         ]
-        for q in gp4_quarters:
-            qp = GPQuarterlyPerformanceModel(
-                gp_id=gp4.id,
-                year=q["year"],
-                quarter=q["quarter"],
-                irr=q["irr"]
-            )
-            db.session.add(qp)
+        GPQuarterlyPerformanceModel.bulk_insert(
+            [{"gp_id": gp4.id, **q} for q in gp4_quarters]
+        )
 
         # Sample GP 5: Northeast Equity Partners
         print("Creating GP: Northeast Equity Partners...")
@@ -237,14 +205,9 @@ def seed_gp_data():
             {"year": 2024, "quarter": 3, "irr": 15.6},
             {"year": 2024, "quarter": 4, "irr": 15.9},
         ]
-        for q in gp5_quarters:
-            qp = GPQuarterlyPerformanceModel(
-                gp_id=gp5.id,
-                year=q["year"],
-                quarter=q["quarter"],
-                irr=q["irr"]
-            )
-            db.session.add(qp)
+        GPQuarterlyPerformanceModel.bulk_insert(
+            [{"gp_id": gp5.id, **q} for q in gp5_quarters]
+        )
 
         # Commit all changes
         db.session.commit()